@@ -13,11 +13,6 @@ if SRC not in sys.path:
 from src.db.init_db import init_db
 from src.db.sqlite import get_conn
 from src.auth.security import verify_password
-from src.db.sqlite import DB_PATH, get_connection
-print(f"⚙️ DB path -> {DB_PATH}")
-print("⚙️ Tables ->", get_connection().execute("SELECT name FROM sqlite_master WHERE type='table'").fetchall())
-
-from src.ui.mainwindow import MainWindow   
 
 def fetch_user_by_username(username: str):
     """Kullanıcıyı email ile getirir (sqlite3.Row döner veya None)."""
@@ -196,6 +191,8 @@ if __name__ == "__main__":
     app = QApplication(sys.argv)
     dlg = LoginDialog()
     if dlg.exec() == QDialog.Accepted and dlg.user_record:
+        # Sekmeler ve servisleri girişten sonra yüklenir
+        from src.ui.mainwindow import MainWindow
         mw = MainWindow(dlg.user_record)   
         mw.show()
         sys.exit(app.exec())
@@ -0,0 +1,38 @@
+"""
+Tüm bölümlerin ders/öğrenci listelerini tek komutla içe aktarır.
+
+  python scripts/batch_import.py <klasör | manifest.json> [--workers N] [--force]
+
+Dosyalar süreç havuzunda paralel okunur, tek yazıcıyla sırayla yazılır.
+--workers 1 seri okuma süresini görmek için kullanılabilir.
+--force değişmemiş dosyaları da yeniden uygular.
+"""
+import argparse
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from src.db.init_db import init_db
+from src.db.sqlite import DB_PATH
+from src.services.batch_import_sqlite import import_folder
+
+def run(source: str, workers, force: bool):
+    print(f"DB -> {DB_PATH}")
+    init_db()
+    res = import_folder(source, max_workers=workers, force=force)
+    print(res.summary())
+    if res.maintenance is not None:
+        print(res.maintenance.summary())
+    failed = res.errors or any(f.result.errors and f.row_count == 0 for f in res.files)
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("source", nargs="?", default=ROOT)
+    ap.add_argument("--workers", type=int, default=None)
+    ap.add_argument("--force", action="store_true")
+    args = ap.parse_args()
+    sys.exit(run(args.source, args.workers, args.force))
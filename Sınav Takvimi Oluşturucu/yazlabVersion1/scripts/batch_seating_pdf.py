@@ -0,0 +1,38 @@
+"""
+Bir sınav türündeki tüm sınavların oturma planı PDF'lerini tek komutla üretir.
+
+  python scripts/batch_seating_pdf.py <vize|final|butunleme> <hedef> [--department ID] [--merge] [--workers N]
+
+Varsayılan: <hedef> klasörüne sınav başına bir PDF. --merge: <hedef> tek birleşik PDF dosyası.
+Sınavlar süreç havuzunda çizilir; --workers 1 seri süreyi görmek için kullanılabilir.
+"""
+import argparse
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from src.db.init_db import init_db
+from src.db.sqlite import DB_PATH
+from src.services.batch_seating_pdf import export_seating_pdfs
+
+def run(exam_type: str, target: str, department_id, merge: bool, workers) -> int:
+    print(f"DB -> {DB_PATH}")
+    init_db()
+    res = export_seating_pdfs(exam_type, department_id, target, merge=merge, max_workers=workers,
+                              progress=lambda done, total: print(f"  {done}/{total}", end="\r"))
+    print()
+    print(res.summary())
+    return 1 if res.errors or any(e.error for e in res.exams) else 0
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("exam_type", choices=["vize", "final", "butunleme"])
+    ap.add_argument("target")
+    ap.add_argument("--department", type=int, default=None)
+    ap.add_argument("--merge", action="store_true")
+    ap.add_argument("--workers", type=int, default=None)
+    args = ap.parse_args()
+    sys.exit(run(args.exam_type, args.target, args.department, args.merge, args.workers))
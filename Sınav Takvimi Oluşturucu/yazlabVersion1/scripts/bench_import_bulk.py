@@ -0,0 +1,77 @@
+"""
+Toplu içe aktarım yazma hızı ölçümü.
+
+  python scripts/bench_import_bulk.py [--rows 100000] [--students 9000] [--courses 40]
+
+Geçici bir veritabanında sentetik öğrenci-ders satırlarını uygulamanın yazma yoluyla
+(_sync_students: import_seen'e yükleme, fark, yazma, çakışma tablosu, import_log, commit)
+tek transaction içinde yazar ve saniyedeki satırı uçtan uca raporlar. Her iki yazıcı modu
+ölçülür: önbellekli (DataFrame yolu ve toplu içe aktarım) ve parti parti (akış modu).
+Yeniden içe aktarım force ile yapılır (aksi halde değişmeyen satırlar yazılmaz).
+Hedef önbellekli ilk içe aktarım için kontrol edilir. Her çalıştırmanın aşama dökümü (import_profile) de yazılır. Gerçek veritabanına dokunmaz.
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+# Alt sınır: yerel diskte önbellekli ilk içe aktarımda uçtan uca saniyede 25k satır (ölçülen ~32k).
+# Eski 100k hedefi yalnızca _StudentWriter.write içindi; yükleme, fark, çakışma tablosu,
+# import_log ve commit dahil değildi.
+TARGET_ROWS_PER_S = 25_000
+
+def _synthetic(rows: int, students: int, courses: int, first_no: int = 200000000):
+    rnd = random.Random(42)
+    people = [(str(first_no + i), f"Ad{i} Soyad{i}", rnd.randint(1, 4)) for i in range(students)]
+    return [(i + 2, *rnd.choice(people), f"BLM{100 + rnd.randrange(courses)}") for i in range(rows)]
+
+def run(rows: int, students: int, courses: int) -> int:
+    tmp = tempfile.mkdtemp(prefix="yazlab_bench_")
+    os.environ["YAZLAB_DB_PATH"] = os.path.join(tmp, "bench.db")
+
+    from src.db.init_db import init_db
+    from src.db.sqlite import bulk_transaction
+    from src.services import import_profile
+    from src.services.importer_sqlite import _sync_students
+
+    init_db(force=True)
+    failed = False
+    # Her mod ayrı bölüme ve ayrı öğrenci numaralarına yazar (öğrenci no tüm bölümlerde aranır)
+    for dep, preload, mode in ((1, True, "önbellekli"), (2, False, "parti parti")):
+        with bulk_transaction() as con:
+            con.executemany("""INSERT INTO courses(department_id, code, name, instructor, class_level, compulsory)
+                               VALUES(?,?,?,?,1,1)""",
+                            [(dep, f"BLM{100 + i}", f"Ders {i}", "Hoca") for i in range(courses)])
+        data = _synthetic(rows, students, courses, first_no=dep * 100000000)
+
+        for label, force in (("ilk içe aktarım", False), ("yeniden içe aktarım", True)):
+            errors = []
+            t0 = time.perf_counter()
+            with import_profile.profiling("bench", "students", dep) as prof, \
+                    import_profile.transaction_timer(), bulk_transaction(temp_in_memory=False) as con:
+                res = _sync_students(con.cursor(), dep, iter(data), "bench", errors,
+                                     force=force, preload=preload)
+            dt = time.perf_counter() - t0
+            rate = rows / max(dt, 1e-9)
+            print(f"{mode}, {label}: {rows} satır {dt*1000:.0f} ms → {rate:,.0f} satır/sn "
+                  f"(eklenen {res.inserted}, güncellenen {res.updated}, hata {len(errors)})")
+            for line in prof.summary().splitlines()[2:]:
+                print(f"   {line}")
+            if preload and not force and rate < TARGET_ROWS_PER_S:
+                print(f"    ✗ hedefin altında ({TARGET_ROWS_PER_S:,} satır/sn)")
+                failed = True
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, default=100_000)
+    ap.add_argument("--students", type=int, default=9000)
+    ap.add_argument("--courses", type=int, default=40)
+    args = ap.parse_args()
+    sys.exit(run(args.rows, args.students, args.courses))
@@ -0,0 +1,69 @@
+"""
+Aynı öğrenci listesinin xlsx ve CSV olarak içe aktarım süresi karşılaştırması.
+
+  python scripts/bench_import_csv.py [--rows 100000]
+
+Sentetik (Öğrenci No, Ad Soyad, Sınıf, Ders) verisini hem xlsx hem CSV olarak yazar,
+her birini ayrı geçici veritabanına ayrı süreçte içe aktarır ve süreleri raporlar.
+Gerçek veritabanına dokunmaz.
+"""
+import argparse
+import csv
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from bench_import_streaming import _write_xlsx
+
+def _xlsx_to_csv(src: str, dst: str):
+    from openpyxl import load_workbook
+    wb = load_workbook(src, read_only=True)
+    with open(dst, "w", newline="", encoding="utf-8-sig") as f:
+        w = csv.writer(f, delimiter=";")
+        for row in wb.worksheets[0].iter_rows(values_only=True):
+            w.writerow(["" if v is None else v for v in row])
+    wb.close()
+
+def _child(path: str):
+    import time
+    from src.services.importer_sqlite import import_students
+
+    t0 = time.perf_counter()
+    res = import_students(path, 1)
+    dt = time.perf_counter() - t0
+    print(f"  {os.path.splitext(path)[1]:6s} {dt:7.2f} sn  "
+          f"(eklenen {res.inserted}, güncellenen {res.updated}, hata {len(res.errors)})")
+
+def run(rows: int) -> int:
+    tmp = tempfile.mkdtemp(prefix="yazlab_bench_")
+    xlsx = os.path.join(tmp, "ogrenci.xlsx")
+    csv_path = os.path.join(tmp, "ogrenci.csv")
+    _write_xlsx(xlsx, rows, students=max(rows // 10, 1))
+    _xlsx_to_csv(xlsx, csv_path)
+    print(f"{rows} satır: xlsx {os.path.getsize(xlsx)/1024/1024:.1f} MB, "
+          f"csv {os.path.getsize(csv_path)/1024/1024:.1f} MB")
+
+    for path in (xlsx, csv_path):
+        db = os.path.join(tmp, f"bench_{os.path.splitext(path)[1][1:]}.db")
+        env = dict(os.environ, YAZLAB_DB_PATH=db)
+        subprocess.run([sys.executable, os.path.join(ROOT, "scripts", "bench_import_streaming.py"),
+                        "--prepare", db], env=env, check=True, cwd=ROOT, stdout=subprocess.DEVNULL)
+        proc = subprocess.run([sys.executable, __file__, "--child", path], env=env, cwd=ROOT)
+        if proc.returncode != 0:
+            return proc.returncode
+    return 0
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, default=100_000)
+    ap.add_argument("--child", metavar="PATH")
+    args = ap.parse_args()
+    if args.child:
+        _child(args.child)
+    else:
+        sys.exit(run(args.rows))
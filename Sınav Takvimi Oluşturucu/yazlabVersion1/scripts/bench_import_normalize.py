@@ -0,0 +1,53 @@
+"""
+İçe aktarım normalizasyon ölçümü.
+
+  python scripts/bench_import_normalize.py [--rows 100000]
+
+Sentetik bir öğrenci listesinde hücre hücre _u (Series.map) ile
+vektörel _u_series sonuçlarını ve sürelerini karşılaştırır.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import pandas as pd
+from src.services.importer_sqlite import _u, _u_series
+
+def _synthetic(rows: int, students: int = 9000, courses: int = 40) -> pd.DataFrame:
+    rnd = random.Random(42)
+    people = [(str(200000000 + i), f"Ad{i}\xa0 Soyad{i} ", f"{rnd.randint(1, 4)}. Sınıf")
+              for i in range(students)]
+    data = []
+    for _ in range(rows):
+        sno, name, cls = rnd.choice(people)
+        data.append((sno, name, cls, f"BLM{100 + rnd.randrange(courses)}"))
+    return pd.DataFrame(data, columns=["student_no", "full_name", "class_level", "course_code"])
+
+def run(rows: int):
+    df = _synthetic(rows)
+
+    t0 = time.perf_counter()
+    cell = {c: df[c].map(_u) for c in df.columns}
+    t_cell = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    vec = {c: _u_series(df[c]) for c in df.columns}
+    t_vec = time.perf_counter() - t0
+
+    same = all(cell[c].tolist() == vec[c].tolist() for c in df.columns)
+    print(f"{rows} satır x {len(df.columns)} sütun")
+    print(f"  hücre hücre (_u):   {t_cell*1000:8.1f} ms")
+    print(f"  vektörel (_u_series): {t_vec*1000:8.1f} ms  (x{t_cell/max(t_vec, 1e-9):.1f})")
+    print(f"  sonuçlar aynı: {same}")
+    return 0 if same else 1
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, default=100_000)
+    sys.exit(run(ap.parse_args().rows))
@@ -0,0 +1,147 @@
+"""
+Büyük öğrenci listelerinde bellek ölçümü: DataFrame yolu vs akış modu.
+
+  python scripts/bench_import_streaming.py [--rows 200000]
+
+Geçici bir veritabanı ve sentetik (Öğrenci No, Ad Soyad, Sınıf, Ders) xlsx dosyaları
+(--rows ve iki katı) oluşturur; her iki modu ayrı süreçlerde çalıştırıp süre ve tepe
+belleği (RSS) raporlar. Akış modunda satır sayısı iki katına çıktığında tepe bellek
+artışı sınırı (STREAMING_GROWTH_LIMIT_MB + eklenen satırlar için
+OPENPYXL_ROW_BYTES) aşarsa çıkış kodu 1'dir.
+Gerçek veritabanına dokunmaz.
+"""
+import argparse
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import zipfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+COURSES = 40
+
+# Akış modunda satır sayısı ikiye katlanınca izin verilen tepe bellek artışı: üst sınırlı
+# önbellekler (toplu bağlantının 64 MB sayfa önbelleği, text_norm önbellekleri) dolana kadar
+# büyüyebilir; ayrıca openpyxl read_only temizlediği <row> öğelerini sayfada bırakır
+# (eklenen satır başına ~85 B). Geçici tablolar bellekte tutulursa artış satır başına ~470 B'tır.
+STREAMING_GROWTH_LIMIT_MB = 80
+OPENPYXL_ROW_BYTES = 96
+
+def _write_xlsx(path: str, rows: int, students: int):
+    from openpyxl import Workbook
+    rnd = random.Random(42)
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.append(["Öğrenci No", "Ad Soyad", "Sınıf", "Ders"])
+    for _ in range(rows):
+        i = rnd.randrange(students)
+        ws.append([200000000 + i, f"Ad{i} Soyad{i}", f"{1 + i % 4}. Sınıf", f"BLM{100 + rnd.randrange(COURSES)}"])
+    wb.save(path)
+    _add_dimension(path, f"A1:D{rows + 1}")
+
+def _add_dimension(path: str, ref: str):
+    """
+    write_only kitaplara Excel'in kaydettiği dosyalardaki gibi <dimension> ekler. Bu öğe yoksa
+    openpyxl read_only açılışta boyutu bulmak için tüm sayfayı ayrıştırır ve satır başına bir
+    öğe tutar; ölçüm gerçek dosyalarda olmayan bu maliyeti içermesin.
+    """
+    tmp = path + ".tmp"
+    with zipfile.ZipFile(path) as src, zipfile.ZipFile(tmp, "w", zipfile.ZIP_DEFLATED) as dst:
+        for item in src.infolist():
+            # sayfa parça parça kopyalanır (ölçen alt süreç bu sürecin tepe belleğini devralır)
+            with src.open(item) as f_in, dst.open(item.filename, "w") as f_out:
+                head = f_in.read(1 << 16)
+                if item.filename.startswith("xl/worksheets/sheet"):
+                    head = head.replace(b"<sheetViews>", f'<dimension ref="{ref}" /><sheetViews>'.encode(), 1)
+                f_out.write(head)
+                shutil.copyfileobj(f_in, f_out, 1 << 20)
+    os.replace(tmp, path)
+
+def _prepare_db(db_path: str):
+    os.environ["YAZLAB_DB_PATH"] = db_path
+    from src.db.init_db import init_db
+    from src.db.sqlite import bulk_transaction
+    init_db(force=True)
+    with bulk_transaction() as con:
+        con.execute("""INSERT INTO rooms(department_id, code, name, capacity, rows, cols)
+                       VALUES(1, 'B1', 'Bench', 40, 5, 8)""")
+        con.executemany("""INSERT INTO courses(department_id, code, name, instructor, class_level, compulsory)
+                           VALUES(1,?,?,?,1,1)""",
+                        [(f"BLM{100 + i}", f"Ders {i}", "Hoca") for i in range(COURSES)])
+
+def _peak_mb() -> float:
+    """Sürecin tepe bellek kullanımı (MB); resource yoksa (Windows) tracemalloc tepesi."""
+    try:
+        import resource
+    except ImportError:
+        import tracemalloc
+        return tracemalloc.get_traced_memory()[1] / 1024 / 1024
+    kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return kb / 1024 / 1024 if sys.platform == "darwin" else kb / 1024
+
+def _child(xlsx: str, streaming: bool, out: str):
+    """Tek modu ölçer (ayrı süreçte, diğer modun belleği karışmasın); tepe belleği out'a yazar."""
+    import time
+    from src.services.importer_sqlite import import_students
+
+    if sys.platform == "win32":
+        # resource modülü yok; _peak_mb tracemalloc tepesini kullanır
+        import tracemalloc
+        tracemalloc.start()
+    base = _peak_mb()
+    t0 = time.perf_counter()
+    res = import_students(xlsx, 1, streaming=streaming)
+    dt = time.perf_counter() - t0
+    label = "akış (openpyxl read_only)" if streaming else "DataFrame (pd.ExcelFile)"
+    peak = _peak_mb()
+    print(f"  {label:28s} {dt:7.2f} sn  tepe bellek {peak:7.1f} MB (başlangıç {base:.1f} MB)  "
+          f"(eklenen {res.inserted}, güncellenen {res.updated}, hata {len(res.errors)})")
+    with open(out, "w") as f:
+        f.write(str(peak))
+
+def run(rows: int) -> int:
+    tmp = tempfile.mkdtemp(prefix="yazlab_bench_")
+    streaming_peaks = []
+    for n in (rows, rows * 2):
+        xlsx = os.path.join(tmp, f"ogrenci_{n}.xlsx")
+        _write_xlsx(xlsx, n, students=max(n // 10, 1))
+        print(f"{n} satır, dosya {os.path.getsize(xlsx)/1024/1024:.1f} MB")
+
+        for streaming in (False, True):
+            db = os.path.join(tmp, f"bench_{n}_{int(streaming)}.db")
+            peak_file = os.path.join(tmp, f"peak_{n}_{int(streaming)}.txt")
+            env = dict(os.environ, YAZLAB_DB_PATH=db)
+            subprocess.run([sys.executable, __file__, "--prepare", db], env=env, check=True, cwd=ROOT,
+                           stdout=subprocess.DEVNULL)
+            proc = subprocess.run([sys.executable, __file__, "--child", xlsx, str(int(streaming)), peak_file],
+                                  env=env, cwd=ROOT)
+            if proc.returncode != 0:
+                return proc.returncode
+            if streaming:
+                with open(peak_file) as f:
+                    streaming_peaks.append(float(f.read()))
+
+    growth = streaming_peaks[1] - streaming_peaks[0]
+    limit = STREAMING_GROWTH_LIMIT_MB + rows * OPENPYXL_ROW_BYTES / 1024 / 1024
+    ok = growth <= limit
+    print(f"Akış modu tepe bellek artışı ({rows} → {rows * 2} satır): {growth:+.1f} MB "
+          f"{'✓' if ok else '✗'} (sınır {limit:.1f} MB)")
+    return 0 if ok else 1
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, default=200_000)
+    ap.add_argument("--prepare", metavar="DB")
+    ap.add_argument("--child", nargs=3, metavar=("XLSX", "STREAMING", "OUT"))
+    args = ap.parse_args()
+    if args.prepare:
+        _prepare_db(args.prepare)
+    elif args.child:
+        _child(args.child[0], args.child[1] == "1", args.child[2])
+    else:
+        sys.exit(run(args.rows))
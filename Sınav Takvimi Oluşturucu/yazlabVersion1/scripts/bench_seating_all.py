@@ -0,0 +1,97 @@
+"""
+Tüm sınavların oturma planı: sınav başına build_seating vs build_all_seatings.
+
+  python scripts/bench_seating_all.py [--courses 120] [--students 6000] [--per-student 8] [--workers N]
+
+Geçici bir veritabanında sentetik bir sınav haftası (her derse bir sınav, yeterli derslik)
+oluşturur, iki yolu da çalıştırıp süreleri ve sonuçların aynı olduğunu raporlar.
+--workers verilirse build_all_seatings süreç havuzunu eşikten bağımsız kullanır.
+Gerçek veritabanına dokunmaz.
+"""
+import argparse
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+ROOM_ROWS, ROOM_COLS, ROOM_GROUP = 6, 8, 3      # 96 kişilik derslik
+ROOM_SEATS = ROOM_ROWS * ROOM_COLS * 2
+
+def _prepare(courses: int, students: int, per_student: int):
+    from src.db.init_db import init_db
+    from src.db.sqlite import bulk_transaction
+
+    rnd = random.Random(42)
+    init_db(force=True)
+    enroll = {c: set() for c in range(courses)}
+    for s in range(students):
+        for c in rnd.sample(range(courses), per_student):
+            enroll[c].add(s)
+    rooms_needed = max(math.ceil(len(v) / ROOM_SEATS) for v in enroll.values())
+
+    with bulk_transaction() as con:
+        con.executemany("""INSERT INTO rooms(department_id, code, name, capacity, rows, cols, group_size)
+                           VALUES(1,?,?,?,?,?,?)""",
+                        [(f"D{i:03d}", f"Derslik {i}", ROOM_SEATS, ROOM_ROWS, ROOM_COLS, ROOM_GROUP)
+                         for i in range(rooms_needed)])
+        room_ids = [r[0] for r in con.execute("SELECT id FROM rooms WHERE department_id=1 ORDER BY code")]
+        con.executemany("""INSERT INTO courses(department_id, code, name, instructor, class_level, compulsory)
+                           VALUES(1,?,?,?,1,1)""",
+                        [(f"BLM{100 + c}", f"Ders {c}", "Hoca") for c in range(courses)])
+        course_ids = [r[0] for r in con.execute(
+            "SELECT id FROM courses WHERE department_id=1 AND code LIKE 'BLM%' ORDER BY code")]
+        con.executemany("INSERT INTO students(student_no, full_name, class_level, department_id) VALUES(?,?,1,1)",
+                        [(str(300000000 + s), f"Ad{s} Soyad{s}") for s in range(students)])
+        sid = {r[0]: r[1] for r in con.execute("SELECT student_no, id FROM students WHERE student_no >= '300000000'")}
+        con.executemany("INSERT OR IGNORE INTO enrollments(student_id, course_id) VALUES(?,?)",
+                        [(sid[str(300000000 + s)], course_ids[c]) for c, ss in enroll.items() for s in ss])
+        for c, ss in enroll.items():
+            cur = con.execute("""INSERT INTO exams(course_id, exam_type, date, start_time, duration_min)
+                                 VALUES(?, 'vize', ?, ?, 75)""",
+                              (course_ids[c], f"2026-11-{2 + c % 5:02d}", f"{9 + (c // 5) % 8:02d}:00"))
+            need = max(math.ceil(len(ss) / ROOM_SEATS), 1)
+            con.executemany("INSERT INTO exam_rooms(exam_id, room_id) VALUES(?,?)",
+                            [(cur.lastrowid, room_ids[i]) for i in range(need)])
+    return sum(len(v) for v in enroll.values())
+
+def run(courses: int, students: int, per_student: int, workers) -> int:
+    tmp = tempfile.mkdtemp(prefix="yazlab_bench_")
+    os.environ["YAZLAB_DB_PATH"] = os.path.join(tmp, "bench.db")
+    seats = _prepare(courses, students, per_student)
+
+    from src.services import seating_sqlite as seating
+    print(f"{courses} sınav, {seats} öğrenci-sınav yerleşimi")
+
+    t0 = time.perf_counter()
+    single = {}
+    for ex in seating.list_exams_with_rooms(1, "vize"):
+        single[ex["exam_id"]] = seating.build_seating(ex["exam_id"])
+    t_single = time.perf_counter() - t0
+    print(f"  sınav başına build_seating: {t_single:6.2f} sn ({2 * len(single)} sorgu)")
+
+    if workers:
+        seating.PARALLEL_MIN_STUDENTS = 0
+    t0 = time.perf_counter()
+    everything = seating.build_all_seatings("vize", 1, max_workers=workers)
+    t_all = time.perf_counter() - t0
+    print(f"  build_all_seatings:         {t_all:6.2f} sn (2 sorgu) → {t_single / max(t_all, 1e-9):.1f}x")
+
+    same = (len(everything) == len(single)
+            and all(single[s.exam_id] == (s.placements, s.warnings) for s in everything))
+    print(f"  sonuçlar aynı: {'evet' if same else 'HAYIR'}")
+    return 0 if same else 1
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--courses", type=int, default=120)
+    ap.add_argument("--students", type=int, default=6000)
+    ap.add_argument("--per-student", type=int, default=8)
+    ap.add_argument("--workers", type=int, default=None)
+    args = ap.parse_args()
+    sys.exit(run(args.courses, args.students, args.per_student, args.workers))
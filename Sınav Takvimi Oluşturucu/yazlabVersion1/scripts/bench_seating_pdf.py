@@ -0,0 +1,74 @@
+"""
+Oturma planı PDF'i ölçümü: oda başına süre ve dosya boyutu.
+
+  python scripts/bench_seating_pdf.py [--rooms 6] [--rows 15] [--cols 10] [--group 3] [--repeat 3]
+
+Geçici bir veritabanında aynı düzende --rooms derslik ve hepsini dolduran tek bir sınav
+oluşturur (varsayılan 15x10, 3'lü grup = 300 kişilik amfi), export_seating_pdf'i
+--repeat kez çalıştırır. İlk çağrı (font kaydı dahil) ayrıca raporlanır.
+Gerçek veritabanına dokunmaz.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+def _prepare(rooms: int, rows: int, cols: int, group: int) -> int:
+    from src.db.init_db import init_db
+    from src.db.sqlite import bulk_transaction
+
+    init_db(force=True)
+    seats = rows * cols * (1 if group <= 2 else 2)
+    students = rooms * seats
+    with bulk_transaction() as con:
+        con.executemany("""INSERT INTO rooms(department_id, code, name, capacity, rows, cols, group_size)
+                           VALUES(1,?,?,?,?,?,?)""",
+                        [(f"A{i:02d}", f"Amfi {i}", seats, rows, cols, group) for i in range(rooms)])
+        course_id = con.execute("""INSERT INTO courses(department_id, code, name, instructor, class_level, compulsory)
+                                   VALUES(1,'BLM999','Büyük Ders','Hoca',1,1)""").lastrowid
+        con.executemany("INSERT INTO students(student_no, full_name, class_level, department_id) VALUES(?,?,1,1)",
+                        [(str(300000000 + s), f"Ad{s} Soyad{s}") for s in range(students)])
+        con.execute("""INSERT INTO enrollments(student_id, course_id)
+                       SELECT id, ? FROM students WHERE student_no >= '300000000'""", (course_id,))
+        exam_id = con.execute("""INSERT INTO exams(course_id, exam_type, date, start_time, duration_min)
+                                 VALUES(?, 'vize', '2026-11-02', '09:00', 75)""", (course_id,)).lastrowid
+        con.execute("INSERT INTO exam_rooms(exam_id, room_id) SELECT ?, id FROM rooms WHERE code LIKE 'A%'",
+                    (exam_id,))
+    return exam_id
+
+def run(rooms: int, rows: int, cols: int, group: int, repeat: int) -> int:
+    tmp = tempfile.mkdtemp(prefix="yazlab_bench_")
+    os.environ["YAZLAB_DB_PATH"] = os.path.join(tmp, "bench.db")
+    exam_id = _prepare(rooms, rows, cols, group)
+
+    from src.services.seating_sqlite import build_seating, export_seating_pdf
+    placements, _ = build_seating(exam_id)
+    path = os.path.join(tmp, "plan.pdf")
+    print(f"{rooms} derslik ({rows}x{cols}, grup={group}), {len(placements)} öğrenci")
+
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        export_seating_pdf(exam_id, placements, path)
+        times.append(time.perf_counter() - t0)
+    size = os.path.getsize(path)
+    print(f"  ilk çağrı:        {times[0] * 1000 / rooms:8.1f} ms/oda")
+    if repeat > 1:
+        print(f"  sonraki çağrılar: {min(times[1:]) * 1000 / rooms:8.1f} ms/oda")
+    print(f"  dosya boyutu:     {size / 1024 / rooms:8.1f} KB/oda ({size / 1024:.1f} KB)")
+    return 0
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rooms", type=int, default=6)
+    ap.add_argument("--rows", type=int, default=15)
+    ap.add_argument("--cols", type=int, default=10)
+    ap.add_argument("--group", type=int, default=3)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+    sys.exit(run(args.rooms, args.rows, args.cols, args.group, args.repeat))
@@ -0,0 +1,83 @@
+"""
+Açılış süresi ölçümü (python -X importtime).
+
+  python scripts/bench_startup.py [--runs 5] [--budget-ms 600]
+
+- Giriş ekranı (main) ve giriş sonrası ana pencere (src.ui.mainwindow)
+  modüllerinin içe aktarım süresini ölçer.
+- Açılışta ağır kütüphaneler (pandas, reportlab, openpyxl) yükleniyorsa
+  veya süre bütçeyi aşarsa 1 ile çıkar.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Giriş ekranına kadar geçen içe aktarma süresi için bütçe (ms)
+STARTUP_BUDGET_MS = 600
+
+HEAVY_MODULES = ("pandas", "reportlab", "openpyxl", "numpy")
+
+TARGETS = {
+    "giriş (main)": "import main",
+    "ana pencere (src.ui.mainwindow)": "import main, src.ui.mainwindow",
+}
+
+def _importtime(code: str):
+    """Tek bir süreçte importtime çıktısını (modül -> kümülatif µs) döner."""
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT, env=env, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr else "import hatası")
+
+    total_us = 0
+    modules = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cum_us, name = line.split("|", 2)
+        name = name.rstrip()[1:]
+        mod = name.strip()
+        modules[mod] = int(cum_us)
+        if not name.startswith("  "):  # yalnızca üst seviye içe aktarımlar toplanır
+            total_us += int(cum_us)
+    return total_us / 1000.0, modules
+
+def run(runs: int, budget_ms: float) -> int:
+    failed = False
+    for label, code in TARGETS.items():
+        samples = []
+        modules = {}
+        for _ in range(runs):
+            ms, modules = _importtime(code)
+            samples.append(ms)
+        med = statistics.median(samples)
+        heavy = sorted({m.split(".")[0] for m in modules if m.split(".")[0] in HEAVY_MODULES})
+        top = sorted(((v, k) for k, v in modules.items() if k.startswith("src")), reverse=True)[:5]
+
+        print(f"{label}: medyan {med:.0f} ms (min {min(samples):.0f}, max {max(samples):.0f}, {runs} çalıştırma)")
+        for us, name in top:
+            print(f"    {us/1000:8.1f} ms  {name}")
+        if heavy:
+            print(f"    ✗ açılışta yüklenen ağır modüller: {', '.join(heavy)}")
+            failed = True
+
+        if code == "import main" and med > budget_ms:
+            print(f"    ✗ bütçe aşıldı: {med:.0f} ms > {budget_ms:.0f} ms")
+            failed = True
+
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--runs", type=int, default=5)
+    ap.add_argument("--budget-ms", type=float, default=STARTUP_BUDGET_MS)
+    args = ap.parse_args()
+    sys.exit(run(args.runs, args.budget_ms))
@@ -0,0 +1,80 @@
+"""
+Metin normalizasyonu mikro ölçümü: önbelleksiz _u vs text_norm.
+
+  python scripts/bench_text_norm.py [--rows 200000]
+
+Öğrenci listesine benzer bir değer akışı üretir (öğrenci no / ad her ~10 satırda bir
+tekrar eder, 40 ders kodu, 4 sınıf etiketi) ve saniyedeki çağrı sayısını raporlar.
+"""
+import argparse
+import math
+import os
+import random
+import re
+import sys
+import time
+import unicodedata
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from src.services.text_norm import cache_info, class_number, clear_caches, normalize_key, normalize_text
+
+def _u_uncached(s) -> str:
+    """Önceki importer _u gövdesi (karşılaştırma için)."""
+    if s is None or (isinstance(s, float) and math.isnan(s)):
+        return ""
+    s = str(s)
+    s = unicodedata.normalize("NFKC", s)
+    s = s.replace("\xa0", " ")
+    s = re.sub(r"\s+", " ", s).strip()
+    return s
+
+def _class_uncached(value) -> int:
+    m = re.search(r"(\d+)", _u_uncached(value))
+    return int(m.group(1)) if m else 0
+
+def _values(rows: int):
+    rnd = random.Random(42)
+    students = max(rows // 10, 1)
+    out = []
+    for _ in range(rows):
+        i = rnd.randrange(students)
+        out.append((200000000 + i, f"Ad{i}\xa0 Soyad{i} ", f"{1 + i % 4}. Sınıf", f" BLM{100 + rnd.randrange(40)}"))
+    return out
+
+def _rate(fn, values) -> float:
+    t0 = time.perf_counter()
+    for v in values:
+        fn(v)
+    return len(values) / max(time.perf_counter() - t0, 1e-9)
+
+def run(rows: int) -> int:
+    data = _values(rows)
+    columns = {
+        "öğrenci no": [r[0] for r in data],
+        "ad soyad": [r[1] for r in data],
+        "sınıf": [r[2] for r in data],
+        "ders kodu": [r[3] for r in data],
+    }
+    print(f"{rows} satır, sütun başına çağrı/sn:")
+    print(f"  {'sütun':12s} {'önceki _u':>14s} {'text_norm':>14s} {'hızlanma':>9s} {'isabet':>7s}")
+    for name, values in columns.items():
+        clear_caches()
+        if name == "sınıf":
+            old, new, cache = _rate(_class_uncached, values), _rate(class_number, values), "class"
+        elif name == "ders kodu":
+            old, new, cache = _rate(_u_uncached, values), _rate(normalize_key, values), "key"
+        else:
+            old, new, cache = _rate(_u_uncached, values), _rate(normalize_text, values), "text"
+        info = cache_info()[cache]
+        hit = info.hits / max(info.hits + info.misses, 1)
+        print(f"  {name:12s} {old:14,.0f} {new:14,.0f} {new / old:8.1f}x {hit:7.1%}")
+    return 0
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, default=200_000)
+    args = ap.parse_args()
+    sys.exit(run(args.rows))
@@ -0,0 +1,19 @@
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from src.db.maintenance import run_maintenance
+from src.db.sqlite import DB_PATH
+
+def run():
+    print(f"DB -> {DB_PATH}")
+    report = run_maintenance()
+    print(report.summary())
+    if report.integrity != "ok":
+        sys.exit(1)
+
+if __name__ == "__main__":
+    run()
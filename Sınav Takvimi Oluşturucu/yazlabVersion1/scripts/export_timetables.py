@@ -0,0 +1,84 @@
+"""
+Öğrenci başına sınav programlarını dışa aktarır (tek CSV ya da .ics dosyalı zip).
+
+  python scripts/export_timetables.py <hedef.csv|hedef.zip> [--department ID] [--type vize|final|butunleme]
+  python scripts/export_timetables.py <hedef.csv|hedef.zip> --synthetic 50000 [--courses 300] [--per-student 8]
+
+--synthetic: gerçek veritabanı yerine geçici bir veritabanında N öğrencilik sentetik bir
+sınav haftası oluşturur; süre ve en yüksek bellek kullanımı (RSS) raporlanır.
+"""
+import argparse
+import os
+import random
+import resource
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+def _prepare(students: int, courses: int, per_student: int) -> None:
+    from src.db.init_db import init_db
+    from src.db.sqlite import bulk_transaction
+
+    rnd = random.Random(42)
+    init_db(force=True)
+    with bulk_transaction() as con:
+        con.execute("""INSERT INTO rooms(department_id, code, name, capacity, rows, cols, group_size)
+                       VALUES(1,'D001','Derslik 1',96,6,8,3)""")
+        con.executemany("""INSERT INTO courses(department_id, code, name, instructor, class_level, compulsory)
+                           VALUES(1,?,?,?,1,1)""",
+                        [(f"BLM{1000 + c}", f"Ders {c}", "Hoca") for c in range(courses)])
+        course_ids = [r[0] for r in con.execute(
+            "SELECT id FROM courses WHERE department_id=1 AND code LIKE 'BLM1%' ORDER BY code")]
+        con.executemany("INSERT INTO students(student_no, full_name, class_level, department_id) VALUES(?,?,1,1)",
+                        ((str(300000000 + s), f"Ad{s} Soyad{s}") for s in range(students)))
+        first = con.execute("SELECT MIN(id) FROM students WHERE student_no >= '300000000'").fetchone()[0]
+        con.executemany("INSERT OR IGNORE INTO enrollments(student_id, course_id) VALUES(?,?)",
+                        ((first + s, cid) for s in range(students)
+                         for cid in rnd.sample(course_ids, per_student)))
+        con.executemany("""INSERT INTO exams(course_id, exam_type, date, start_time, duration_min)
+                           VALUES(?, 'vize', ?, ?, 75)""",
+                        [(cid, f"2026-11-{2 + i % 5:02d}", f"{9 + (i // 5) % 8:02d}:00")
+                         for i, cid in enumerate(course_ids)])
+        con.execute("INSERT INTO exam_rooms(exam_id, room_id) SELECT e.id, r.id FROM exams e, rooms r "
+                    "WHERE r.code = 'D001'")
+
+def _peak_rss_mb() -> float:
+    # Linux'ta ru_maxrss KB cinsindendir
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def run(target: str, department_id, exam_type, synthetic: int, courses: int, per_student: int) -> int:
+    if synthetic:
+        tmp = tempfile.mkdtemp(prefix="yazlab_bench_")
+        os.environ["YAZLAB_DB_PATH"] = os.path.join(tmp, "bench.db")
+        _prepare(synthetic, courses, per_student)
+        department_id = department_id or 1
+        print(f"Sentetik veri: {synthetic} öğrenci, {courses} ders, öğrenci başına {per_student} sınav")
+
+    from src.db.init_db import init_db
+    from src.db.sqlite import DB_PATH
+    from src.services.timetable_export_sqlite import export_timetables
+
+    print(f"DB -> {DB_PATH}")
+    init_db()
+    rss_before = _peak_rss_mb()
+    res = export_timetables(target, department_id, exam_type,
+                            progress=lambda done, total: print(f"  {done}/{total}", end="\r"))
+    print()
+    print(res.summary())
+    print(f"Dosya boyutu: {os.path.getsize(target) / 1024 / 1024:.1f} MB")
+    print(f"En yüksek RSS: {_peak_rss_mb():.0f} MB (dışa aktarım öncesi {rss_before:.0f} MB)")
+    return 0
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("target")
+    ap.add_argument("--department", type=int, default=None)
+    ap.add_argument("--type", dest="exam_type", choices=["vize", "final", "butunleme"], default=None)
+    ap.add_argument("--synthetic", type=int, default=0)
+    ap.add_argument("--courses", type=int, default=300)
+    ap.add_argument("--per-student", type=int, default=8)
+    args = ap.parse_args()
+    sys.exit(run(args.target, args.department, args.exam_type, args.synthetic, args.courses, args.per_student))
@@ -1,9 +1,106 @@
 import sqlite3
 from src.db.sqlite import get_conn
 from src.auth.security import hash_password
+from src.services.scheduler_sqlite import refresh_course_conflicts
+from src.services.search_index_sqlite import KIND_NAMES, SEARCH_SOURCES, fold_sql, rebuild_search_index
+
+def _table_cols(cur, table: str) -> set[str]:
+    cur.execute(f"PRAGMA table_info({table})")
+    return {r["name"] for r in cur.fetchall()}
+
+def _migrate_course_student_count(cur):
+    """
+    Eski veritabanlarında courses.student_count yoksa ekler ve
+    enrollments üzerinden bir kerelik doldurur.
+    """
+    if "student_count" in _table_cols(cur, "courses"):
+        return
+    cur.execute("ALTER TABLE courses ADD COLUMN student_count INTEGER NOT NULL DEFAULT 0")
+    cur.execute("""
+        UPDATE courses
+           SET student_count = (SELECT COUNT(*) FROM enrollments e WHERE e.course_id = courses.id)
+    """)
+
+def _create_enrollment_triggers(cur):
+    """courses.student_count sayacını enrollments değiştikçe günceller."""
+    cur.execute("""
+    CREATE TRIGGER IF NOT EXISTS trg_enrollments_count_ins
+    AFTER INSERT ON enrollments
+    BEGIN
+        UPDATE courses SET student_count = student_count + 1 WHERE id = NEW.course_id;
+    END""")
+
+    cur.execute("""
+    CREATE TRIGGER IF NOT EXISTS trg_enrollments_count_del
+    AFTER DELETE ON enrollments
+    BEGIN
+        UPDATE courses SET student_count = student_count - 1 WHERE id = OLD.course_id;
+    END""")
+
+def _create_search_index(cur) -> bool:
+    """
+    Öğrenci/ders/derslik FTS5 arama dizini ve onu eşitleyen tetikleyiciler
+    (ayrıntılar: search_index_sqlite). Dizin önceden varsa True döner.
+    """
+    cur.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name='search_index'")
+    existed = cur.fetchone() is not None
+    cur.execute("""
+    CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5(
+        kind, code, name,
+        code_raw UNINDEXED, name_raw UNINDEXED, department_id UNINDEXED,
+        tokenize = 'unicode61 remove_diacritics 2',
+        prefix = '1 2 3'
+    )""")
+
+    for table, kind, code, name in SEARCH_SOURCES:
+        cur.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_{table}_search_ins
+        AFTER INSERT ON {table}
+        BEGIN
+            INSERT INTO search_index(rowid, kind, code, name, code_raw, name_raw, department_id)
+            VALUES(NEW.id * 4 + {kind}, '{KIND_NAMES[kind]}', {fold_sql(f"NEW.{code}")}, {fold_sql(f"NEW.{name}")},
+                   NEW.{code}, NEW.{name}, NEW.department_id);
+        END""")
+
+        cur.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_{table}_search_upd
+        AFTER UPDATE OF {code}, {name}, department_id ON {table}
+        WHEN OLD.{code} IS NOT NEW.{code} OR OLD.{name} IS NOT NEW.{name}
+          OR OLD.department_id IS NOT NEW.department_id
+        BEGIN
+            UPDATE search_index
+               SET code = {fold_sql(f"NEW.{code}")}, name = {fold_sql(f"NEW.{name}")},
+                   code_raw = NEW.{code}, name_raw = NEW.{name}, department_id = NEW.department_id
+             WHERE rowid = OLD.id * 4 + {kind};
+        END""")
+
+        cur.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_{table}_search_del
+        AFTER DELETE ON {table}
+        BEGIN
+            DELETE FROM search_index WHERE rowid = OLD.id * 4 + {kind};
+        END""")
+    return existed
+
+# Şema her değiştiğinde artırılır; init_db yalnızca sürüm eskiyse kurulum yapar.
+SCHEMA_VERSION = 6
+
+_schema_ok = False
+
+def init_db(force: bool = False):
+    """
+    Şemayı kurar/günceller. PRAGMA user_version == SCHEMA_VERSION ise
+    hiçbir şey yapmaz; aynı süreçte ikinci çağrı DB'ye hiç dokunmaz.
+    """
+    global _schema_ok
+    if _schema_ok and not force:
+        return
 
-def init_db():
     con = get_conn(); cur = con.cursor()
+    if not force and cur.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+        con.close()
+        _schema_ok = True
+        return
 
     # --- tablolar ---
     cur.execute("""
@@ -45,6 +142,7 @@ def init_db():
         instructor TEXT,
         class_level INTEGER,
         compulsory INTEGER DEFAULT 1,
+        student_count INTEGER NOT NULL DEFAULT 0,
         UNIQUE(department_id, code),
         FOREIGN KEY(department_id) REFERENCES departments(id) ON DELETE CASCADE
     )""")
@@ -90,11 +188,88 @@ def init_db():
         FOREIGN KEY(room_id) REFERENCES rooms(id) ON DELETE CASCADE
     )""")
 
+    # kalıcı oturma planı: sınav başına koltuk -> öğrenci (PK sınav bazlı okumayı da karşılar)
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS exam_seats(
+        exam_id INTEGER NOT NULL,
+        room_id INTEGER NOT NULL,
+        row INTEGER NOT NULL,
+        col INTEGER NOT NULL,
+        pos INTEGER NOT NULL,
+        student_id INTEGER NOT NULL,
+        PRIMARY KEY(exam_id, room_id, row, col, pos),
+        FOREIGN KEY(exam_id) REFERENCES exams(id) ON DELETE CASCADE,
+        FOREIGN KEY(room_id) REFERENCES rooms(id) ON DELETE CASCADE,
+        FOREIGN KEY(student_id) REFERENCES students(id) ON DELETE CASCADE
+    ) WITHOUT ROWID""")
+
+    cur.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name='course_conflicts'")
+    conflicts_existed = cur.fetchone() is not None
+
+    # Aynı öğrenciyi paylaşan ders çiftleri (her iki yön de saklanır).
+    # İçe aktarım sonrası refresh_course_conflicts ile güncellenir.
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS course_conflicts(
+        c1 INTEGER NOT NULL,
+        c2 INTEGER NOT NULL,
+        shared_students INTEGER NOT NULL,
+        PRIMARY KEY(c1, c2),
+        FOREIGN KEY(c1) REFERENCES courses(id) ON DELETE CASCADE,
+        FOREIGN KEY(c2) REFERENCES courses(id) ON DELETE CASCADE
+    ) WITHOUT ROWID""")
+
+    # içe aktarım günlüğü: değişmeyen dosyaları atlamak / yalnızca satır farkını uygulamak için
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS import_log(
+        id INTEGER PRIMARY KEY,
+        department_id INTEGER NOT NULL,
+        kind TEXT NOT NULL CHECK(kind IN ('courses','students')),
+        file_hash TEXT NOT NULL,
+        row_count INTEGER NOT NULL DEFAULT 0,
+        imported_at TEXT NOT NULL,
+        UNIQUE(department_id, kind),
+        FOREIGN KEY(department_id) REFERENCES departments(id) ON DELETE CASCADE
+    )""")
+
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS import_log_rows(
+        log_id INTEGER NOT NULL,
+        row_key TEXT NOT NULL,
+        row_hash TEXT NOT NULL,
+        PRIMARY KEY(log_id, row_key),
+        FOREIGN KEY(log_id) REFERENCES import_log(id) ON DELETE CASCADE
+    ) WITHOUT ROWID""")
+
     cur.execute("""
         CREATE UNIQUE INDEX IF NOT EXISTS idx_unique_coord_per_dep
         ON users(department_id) WHERE role='coordinator'
         """)
 
+    # ders -> öğrenci erişimi (çakışma tablosu yenileme, ders bazlı kayıt sorguları)
+    cur.execute("""
+        CREATE INDEX IF NOT EXISTS idx_enrollments_course
+        ON enrollments(course_id, student_id)
+        """)
+
+    # öğrenci no ile bölümden bağımsız arama (akış modunda parti bazlı eşleme)
+    cur.execute("""
+        CREATE INDEX IF NOT EXISTS idx_students_no
+        ON students(student_no)
+        """)
+
+    # öğrenci -> sınav yerleri (find_student_seats)
+    cur.execute("""
+        CREATE INDEX IF NOT EXISTS idx_exam_seats_student
+        ON exam_seats(student_id, exam_id)
+        """)
+
+    _migrate_course_student_count(cur)
+    _create_enrollment_triggers(cur)
+    if not conflicts_existed:
+        refresh_course_conflicts(cur)
+    if not _create_search_index(cur):
+        rebuild_search_index(cur)
+
     
     departments = [
         "Bilgisayar Mühendisliği",
@@ -119,9 +294,11 @@ def init_db():
 
 
 
+    cur.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
     con.commit()
     con.close()
+    _schema_ok = True
     print("✅ DB hazır (tablolar + 5 bölüm + admin & koordinatörler).")
 
 if __name__ == "__main__":
-    init_db()
+    init_db(force=True)
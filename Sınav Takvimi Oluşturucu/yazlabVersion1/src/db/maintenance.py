@@ -0,0 +1,98 @@
+# src/db/maintenance.py
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import List, Tuple
+import os
+import time
+from src.db.sqlite import get_conn, DB_PATH
+
+# Bu kadar satırın üzerindeki içe aktarımlardan sonra bakım otomatik çalışır.
+AUTO_MAINTENANCE_ROW_THRESHOLD = 5000
+
+@dataclass
+class MaintenanceReport:
+    size_before: int
+    size_after: int
+    started_at: float
+    finished_at: float
+    integrity: str
+    steps: List[Tuple[str, float]] = field(default_factory=list)
+
+    @property
+    def duration_s(self) -> float:
+        return self.finished_at - self.started_at
+
+    def summary(self) -> str:
+        lines = [
+            f"Boyut: {_fmt_size(self.size_before)} → {_fmt_size(self.size_after)}",
+            f"Süre: {self.duration_s:.2f} sn "
+            f"({time.strftime('%H:%M:%S', time.localtime(self.started_at))} → "
+            f"{time.strftime('%H:%M:%S', time.localtime(self.finished_at))})",
+            f"Bütünlük: {self.integrity}",
+        ]
+        lines += [f" - {name}: {sec*1000:.0f} ms" for name, sec in self.steps]
+        return "\n".join(lines)
+
+def _fmt_size(n: int) -> str:
+    return f"{n/1024/1024:.2f} MB" if n >= 1024*1024 else f"{n/1024:.1f} KB"
+
+def _db_size() -> int:
+    """Ana dosya + WAL/SHM dosyalarının toplam boyutu (byte)."""
+    total = 0
+    for suffix in ("", "-wal", "-shm"):
+        p = f"{DB_PATH}{suffix}"
+        if os.path.exists(p):
+            total += os.path.getsize(p)
+    return total
+
+def run_maintenance() -> MaintenanceReport:
+    """
+    Veritabanı bakımı:
+      - PRAGMA optimize + ANALYZE (sorgu planlayıcı istatistikleri)
+      - arama dizini (FTS5) segmentlerinin birleştirilmesi
+      - wal_checkpoint(TRUNCATE)
+      - incremental_vacuum (boş sayfaları dosyaya geri verir)
+      - integrity_check
+    auto_vacuum INCREMENTAL değilse ilk çalıştırmada bir kerelik VACUUM ile dönüştürülür.
+    """
+    size_before = _db_size()
+    started = time.time()
+    steps: List[Tuple[str, float]] = []
+
+    con = get_conn()
+    con.isolation_level = None  # VACUUM / PRAGMA'lar transaction dışında çalışmalı
+    cur = con.cursor()
+
+    def step(name: str, sql: str):
+        t0 = time.perf_counter()
+        cur.execute(sql)
+        rows = cur.fetchall()
+        steps.append((name, time.perf_counter() - t0))
+        return rows
+
+    try:
+        if cur.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+            cur.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            step("VACUUM (auto_vacuum=INCREMENTAL)", "VACUUM")
+
+        step("PRAGMA optimize", "PRAGMA optimize")
+        step("ANALYZE", "ANALYZE")
+        step("search_index optimize", "INSERT INTO search_index(search_index) VALUES('optimize')")
+        step("wal_checkpoint(TRUNCATE)", "PRAGMA wal_checkpoint(TRUNCATE)")
+        step("incremental_vacuum", "PRAGMA incremental_vacuum")
+        rows = step("integrity_check", "PRAGMA integrity_check")
+        integrity = "; ".join(str(r[0]) for r in rows[:5]) or "?"
+    finally:
+        con.close()
+
+    return MaintenanceReport(
+        size_before=size_before,
+        size_after=_db_size(),
+        started_at=started,
+        finished_at=time.time(),
+        integrity=integrity,
+        steps=steps,
+    )
+
+if __name__ == "__main__":
+    print(run_maintenance().summary())
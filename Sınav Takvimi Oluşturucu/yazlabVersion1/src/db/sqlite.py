@@ -1,4 +1,5 @@
 from __future__ import annotations
+from contextlib import contextmanager
 from pathlib import Path
 import os
 import sqlite3
@@ -27,3 +28,35 @@ def get_connection() -> sqlite3.Connection:
 
 def get_conn() -> sqlite3.Connection:
     return get_connection()
+
+def get_bulk_connection(temp_in_memory: bool = True) -> sqlite3.Connection:
+    """
+    Toplu yazma profili (içe aktarım vb.):
+    büyük sayfa önbelleği, geçici tablolar bellekte, synchronous=NORMAL.
+    temp_in_memory=False: geçici tablolar diskte (dosya boyutuyla büyüyen ara tablolar için;
+    bellekte tutulursa tepe bellek satır sayısıyla artar).
+    Transaction açma/kapama çağırana aittir (isolation_level=None).
+    """
+    con = get_connection()
+    con.isolation_level = None
+    con.execute("PRAGMA synchronous=NORMAL")
+    con.execute(f"PRAGMA temp_store={'MEMORY' if temp_in_memory else 'FILE'}")
+    con.execute("PRAGMA cache_size=-65536")
+    return con
+
+@contextmanager
+def bulk_transaction(temp_in_memory: bool = True):
+    """
+    Toplu yazma profiliyle tek bir transaction açar.
+    Blok hatasız biterse COMMIT, aksi halde ROLLBACK (hep ya da hiç).
+    """
+    con = get_bulk_connection(temp_in_memory)
+    con.execute("BEGIN IMMEDIATE")
+    try:
+        yield con
+        con.execute("COMMIT")
+    except BaseException:
+        con.execute("ROLLBACK")
+        raise
+    finally:
+        con.close()
@@ -0,0 +1,269 @@
+# src/services/batch_import_sqlite.py
+from __future__ import annotations
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+import json
+import os
+import re
+import threading
+import time
+
+from src.db.sqlite import bulk_transaction
+from src.db.maintenance import (
+    AUTO_MAINTENANCE_ROW_THRESHOLD, MaintenanceReport, run_maintenance
+)
+from src.services.guards import classrooms_ready
+from src.services.room_repo_sqlite import list_departments
+from src.services import import_log_sqlite as import_log
+from src.services.import_log_sqlite import KIND_COURSES, KIND_STUDENTS
+from src.services.text_norm import normalize_key
+from src.services.importer_sqlite import (
+    ImportCancelled, ImportResult, _course_rows, _student_rows, _sync_students, _write_courses
+)
+
+# Dosya öneki -> bölüm adı (bm_ders_listesi.xlsx, tronik_ogrenci_listesi.csv ...)
+FILE_PREFIX_DEPARTMENTS = {
+    "bm": "Bilgisayar Mühendisliği",
+    "ym": "Yazılım Mühendisliği",
+    "im": "İnşaat Mühendisliği",
+    "trik": "Elektrik Mühendisliği",
+    "tronik": "Elektronik Mühendisliği",
+}
+
+# Klasörde bu dosya varsa önek kuralı yerine kullanılır:
+# [{"file": "bm_dersler.xlsx", "department": "Bilgisayar Mühendisliği" | 1, "kind": "courses"}]
+MANIFEST_NAME = "manifest.json"
+
+_FILE_RE = re.compile(r"^(?P<prefix>[a-z]+)_(?P<kind>ders|ogrenci)_listesi\.(xlsx|csv|tsv)$", re.I)
+_KIND_BY_WORD = {"ders": KIND_COURSES, "ogrenci": KIND_STUDENTS}
+
+@dataclass
+class BatchItem:
+    path: str
+    department_id: int
+    department_name: str
+    kind: str
+
+@dataclass
+class BatchFileResult:
+    item: BatchItem
+    result: ImportResult
+    parse_s: float = 0.0
+    row_count: int = 0
+
+@dataclass
+class BatchImportResult:
+    files: List[BatchFileResult]
+    errors: List[str]
+    wall_s: float
+    maintenance: Optional[MaintenanceReport] = None
+    cancelled: bool = False
+
+    @property
+    def parse_s(self) -> float:
+        """Dosyaların tek tek okunma sürelerinin toplamı (seri çalışsaydı)."""
+        return sum(f.parse_s for f in self.files)
+
+    def summary(self) -> str:
+        lines = []
+        for f in self.files:
+            label = "Dersler" if f.item.kind == KIND_COURSES else "Öğrenciler"
+            if f.result.skipped:
+                lines.append(f"{f.item.department_name} / {os.path.basename(f.item.path)} → {label}: "
+                             f"değişmemiş, atlandı")
+                continue
+            lines.append(f"{f.item.department_name} / {os.path.basename(f.item.path)} → {label}: "
+                         f"Eklendi {f.result.inserted}, Güncellendi {f.result.updated}, "
+                         f"Silinen {f.result.removed}, Değişmeyen {f.result.unchanged}, Hata {len(f.result.errors)} (okuma {f.parse_s:.2f} sn)")
+        lines += [f"⚠️ {e}" for e in self.errors]
+        if self.cancelled:
+            lines.append("İptal edildi; yazılmış dosyalar kaldı, kalan dosyalar içe aktarılmadı.")
+        lines.append(f"Toplam süre: {self.wall_s:.2f} sn (okumalar toplamı {self.parse_s:.2f} sn)")
+        return "\n".join(lines)
+
+def _department_lookup() -> Tuple[Dict[str, int], Dict[int, str]]:
+    deps = list_departments()
+    return {normalize_key(d["name"]): d["id"] for d in deps}, {d["id"]: d["name"] for d in deps}
+
+def _kind_from_name(name: str) -> Optional[str]:
+    low = name.lower()
+    if "ogrenci" in low or "öğrenci" in low:
+        return KIND_STUDENTS
+    if "ders" in low:
+        return KIND_COURSES
+    return None
+
+def _items_from_manifest(manifest_path: str) -> Tuple[List[BatchItem], List[str]]:
+    by_name, by_id = _department_lookup()
+    base = os.path.dirname(os.path.abspath(manifest_path))
+    with open(manifest_path, encoding="utf-8-sig") as f:
+        entries = json.load(f)
+
+    items: List[BatchItem] = []
+    errors: List[str] = []
+    for i, e in enumerate(entries, start=1):
+        path = os.path.join(base, str(e.get("file", "")))
+        dep = e.get("department")
+        dep_id = dep if isinstance(dep, int) else by_name.get(normalize_key(dep))
+        kind = e.get("kind") or _kind_from_name(os.path.basename(path))
+        if dep_id not in by_id:
+            errors.append(f"Manifest #{i}: bölüm bulunamadı ({dep}).")
+        elif kind not in (KIND_COURSES, KIND_STUDENTS):
+            errors.append(f"Manifest #{i}: dosya türü belirlenemedi ({e.get('file')}).")
+        elif not os.path.isfile(path):
+            errors.append(f"Manifest #{i}: dosya yok ({e.get('file')}).")
+        else:
+            items.append(BatchItem(path, dep_id, by_id[dep_id], kind))
+    return items, errors
+
+def discover_batch(folder_or_manifest: str) -> Tuple[List[BatchItem], List[str]]:
+    """
+    İçe aktarılacak dosyaları bölümlere eşler.
+    - .json verilirse ya da klasörde manifest.json varsa manifest kullanılır.
+    - Aksi halde <önek>_ders_listesi / <önek>_ogrenci_listesi (.xlsx/.csv/.tsv) adları
+      FILE_PREFIX_DEPARTMENTS ile eşlenir.
+    """
+    if os.path.isfile(folder_or_manifest):
+        return _items_from_manifest(folder_or_manifest)
+    manifest = os.path.join(folder_or_manifest, MANIFEST_NAME)
+    if os.path.isfile(manifest):
+        return _items_from_manifest(manifest)
+
+    by_name, _ = _department_lookup()
+    items: List[BatchItem] = []
+    errors: List[str] = []
+    for name in sorted(os.listdir(folder_or_manifest)):
+        m = _FILE_RE.match(name)
+        if not m:
+            continue
+        dep_name = normalize_key(FILE_PREFIX_DEPARTMENTS.get(m.group("prefix").lower()))
+        if dep_name not in by_name:
+            errors.append(f"{name}: önek bir bölümle eşleşmedi.")
+            continue
+        items.append(BatchItem(os.path.join(folder_or_manifest, name), by_name[dep_name], dep_name,
+                               _KIND_BY_WORD[m.group("kind").lower()]))
+    return items, errors
+
+def _parse_file(kind: str, path: str):
+    """Süreç havuzunda çalışır: dosyayı okuyup doğrulanmış satırları döner (DB'ye dokunmaz)."""
+    t0 = time.perf_counter()
+    rows, errors, row_count = (_course_rows if kind == KIND_COURSES else _student_rows)(path)
+    return rows, errors, row_count, time.perf_counter() - t0
+
+def _write_parsed(item: BatchItem, parsed, digest: str, force: bool,
+                  cancel: Optional[threading.Event] = None) -> BatchFileResult:
+    """
+    Tek yazıcı: okunmuş bir dosyayı kendi transaction'ında yazar (öğrencilerde yalnızca fark).
+    Yazım sırasında iptal edilirse ImportCancelled yükselir ve bu dosyanın transaction'ı geri alınır.
+    """
+    rows, errors, row_count, parse_s = parsed
+    if row_count == 0:
+        return BatchFileResult(item, ImportResult(0, 0, errors), parse_s, 0)
+    try:
+        with bulk_transaction(temp_in_memory=False) as con:
+            cur = con.cursor()
+            if item.kind == KIND_COURSES:
+                ins, upd = _write_courses(cur, item.department_id, rows)
+                import_log.save_log(cur, item.department_id, KIND_COURSES, digest, len(rows))
+                res = ImportResult(ins, upd, errors)
+            else:
+                res = _sync_students(cur, item.department_id, iter(rows), digest, errors,
+                                     force=force, cancel=cancel)
+    except ImportCancelled:
+        raise
+    except Exception as e:
+        return BatchFileResult(item, ImportResult(0, 0, errors + [f"Yazma başarısız: {e}"]), parse_s, row_count)
+    return BatchFileResult(item, res, parse_s, row_count)
+
+def run_batch_import(items: List[BatchItem], max_workers: Optional[int] = None,
+                     progress: Optional[Callable[[int, int], None]] = None,
+                     force: bool = False,
+                     cancel: Optional[threading.Event] = None) -> BatchImportResult:
+    """
+    Dosyaları süreç havuzunda paralel okur, sonuçları tek bir yazıcıyla sırayla yazar.
+    Bir bölümün ders dosyaları yazılıp commit edilmeden o bölümün öğrenci dosyaları yazılmaz.
+    Her dosya kendi transaction'ındadır; hatalı dosya diğerlerini etkilemez.
+    Son içe aktarımdan beri değişmeyen dosyalar (import_log) okunmadan atlanır.
+    progress(tamamlanan, toplam) dosya başına çağrılır. cancel kurulursa o an yazılan dosya
+    geri alınır, kalan dosyalar yazılmaz; önceden commit edilmiş dosyalar kalır (cancelled=True).
+    """
+    t0 = time.perf_counter()
+    cancelled = False
+    errors: List[str] = []
+    results: List[BatchFileResult] = []
+    ready: List[BatchItem] = []
+    digests: Dict[str, str] = {}
+    for it in items:
+        if not classrooms_ready(it.department_id):
+            errors.append(f"{it.department_name}: derslik bilgileri tamamlanmadan içe aktarılamaz "
+                          f"({os.path.basename(it.path)}).")
+            continue
+        digests[it.path] = import_log.file_digest(it.path)
+        if not force and import_log.is_unchanged(it.department_id, it.kind, digests[it.path]):
+            results.append(BatchFileResult(it, ImportResult(0, 0, [], skipped=True)))
+        else:
+            ready.append(it)
+    total = len(results) + len(ready)   # derslik eksikliğinden reddedilenler sayılmaz
+    if progress:
+        progress(len(results), total)
+
+    if ready:
+        courses_left = Counter(it.department_id for it in ready if it.kind == KIND_COURSES)
+        held: Dict[int, List[Tuple[BatchItem, tuple]]] = {}
+
+        def done(res: BatchFileResult):
+            results.append(res)
+            if progress:
+                progress(len(results), total)
+
+        workers = max_workers or min(len(ready), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(_parse_file, it.kind, it.path): it for it in ready}
+            try:
+                for fut in as_completed(futures):
+                    it = futures[fut]
+                    if cancel is not None and cancel.is_set():
+                        raise ImportCancelled()
+                    try:
+                        parsed = fut.result()
+                    except Exception as e:
+                        parsed = ([] if it.kind == KIND_STUDENTS else {}, [f"Dosya okunamadı: {e}"], 0, 0.0)
+
+                    dep = it.department_id
+                    if it.kind == KIND_STUDENTS and courses_left[dep] > 0:
+                        held.setdefault(dep, []).append((it, parsed))
+                        continue
+
+                    done(_write_parsed(it, parsed, digests[it.path], force, cancel))
+                    if it.kind == KIND_COURSES:
+                        courses_left[dep] -= 1
+                        if courses_left[dep] == 0:
+                            for held_it, held_parsed in held.pop(dep, []):
+                                done(_write_parsed(held_it, held_parsed, digests[held_it.path], force, cancel))
+            except ImportCancelled:
+                cancelled = True
+                pool.shutdown(wait=True, cancel_futures=True)
+
+    order = {KIND_COURSES: 0, KIND_STUDENTS: 1}
+    results.sort(key=lambda r: (r.item.department_name, order[r.item.kind], r.item.path))
+    out = BatchImportResult(results, errors, time.perf_counter() - t0, cancelled=cancelled)
+
+    changed = sum(r.result.inserted + r.result.updated + r.result.removed for r in results)
+    if changed >= AUTO_MAINTENANCE_ROW_THRESHOLD:
+        try:
+            out.maintenance = run_maintenance()
+        except Exception as e:
+            out.errors.append(f"Otomatik bakım çalıştırılamadı: {e}")
+    return out
+
+def import_folder(folder_or_manifest: str, max_workers: Optional[int] = None,
+                  progress: Optional[Callable[[int, int], None]] = None,
+                  force: bool = False,
+                  cancel: Optional[threading.Event] = None) -> BatchImportResult:
+    """Klasör/manifest'teki tüm bölüm dosyalarını tek işlemde içe aktarır."""
+    items, errors = discover_batch(folder_or_manifest)
+    res = run_batch_import(items, max_workers, progress, force, cancel)
+    res.errors[:0] = errors
+    return res
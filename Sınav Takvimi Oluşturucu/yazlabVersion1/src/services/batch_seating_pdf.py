@@ -0,0 +1,184 @@
+# src/services/batch_seating_pdf.py
+"""
+Bir sınav türündeki tüm sınavların oturma planı PDF'leri (toplu dışa aktarım).
+Sınavlar süreç havuzunda çizilir; çıktı sınav başına bir dosya ya da tek bir birleşik PDF'tir.
+Birleşik PDF'te de sınavlar havuzda çizilir, parçalar pypdf ile birleştirilir (requirements.txt).
+pypdf kurulu değilse birleşik PDF tek süreçte, tek canvas üzerinde çizilir (yedek yol; aynı
+düzendeki ızgara formları tüm sınavlarca paylaşılır).
+"""
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
+import importlib.util
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+
+from src.services.seating_sqlite import (
+    _draw_exam_pages, _exam_pdf_info, _try_register_turkish_font,
+    build_seating, export_seating_pdf, list_exams_with_rooms, load_seating
+)
+
+_UNSAFE_RE = re.compile(r"[^\w.-]+")
+
+@dataclass
+class ExamPdf:
+    exam_id: int
+    label: str
+    path: Optional[str] = None
+    pages: int = 0
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+@dataclass
+class BatchPdfResult:
+    exams: List[ExamPdf]
+    wall_s: float
+    merged_path: Optional[str] = None
+    cancelled: bool = False
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def render_s(self) -> float:
+        """Sınavların tek tek çizim sürelerinin toplamı (seri çalışsaydı)."""
+        return sum(e.seconds for e in self.exams)
+
+    def summary(self) -> str:
+        ok = [e for e in self.exams if e.error is None]
+        lines = [f"{e.label}: ⚠️ {e.error}" for e in self.exams if e.error]
+        lines += [f"⚠️ {e}" for e in self.errors]
+        if self.cancelled:
+            lines.append("İptal edildi.")
+        target = f" → {self.merged_path}" if self.merged_path else ""
+        lines.append(f"{len(ok)} sınav, {sum(e.pages for e in ok)} sayfa{target}")
+        lines.append(f"Toplam süre: {self.wall_s:.2f} sn (çizimler toplamı {self.render_s:.2f} sn)")
+        return "\n".join(lines)
+
+def _exam_label(r) -> str:
+    return f"{r['date']} {r['start_time']} - {r['course_code']}"
+
+def _file_name(r) -> str:
+    # ders kodu yalnızca bölüm içinde tekil; sınav id'si bölümler arası çakışmayı önler
+    name = f"{r['date']}_{r['start_time'].replace(':', '')}_{r['course_code']}_{r['exam_id']}"
+    return _UNSAFE_RE.sub("_", name) + ".pdf"
+
+def _exam_placements(exam_id: int) -> List[dict]:
+    """Kayıtlı plan varsa o, yoksa yeni hesaplanan yerleşim."""
+    return load_seating(exam_id) or build_seating(exam_id)[0]
+
+def _render_exam(exam_id: int, path: str):
+    """Süreç havuzunda çalışır: sınavın PDF'ini yazar; (sayfa, süre) döner."""
+    t0 = time.perf_counter()
+    placements = _exam_placements(exam_id)
+    export_seating_pdf(exam_id, placements, path)
+    return len({p["room_code"] for p in placements}), time.perf_counter() - t0
+
+def _have_pypdf() -> bool:
+    return importlib.util.find_spec("pypdf") is not None
+
+def _merge_pdfs(paths: List[str], target: str) -> None:
+    from pypdf import PdfWriter
+    writer = PdfWriter()
+    for p in paths:
+        writer.append(p)
+    with open(target, "wb") as f:
+        writer.write(f)
+
+def _render_merged_serial(exams: List[ExamPdf], target: str, progress, cancel) -> bool:
+    """pypdf yokken birleşik PDF: tüm sınavlar tek canvas'a. İptal edilirse False (dosya yazılmaz)."""
+    from reportlab.pdfgen import canvas
+    from reportlab.lib.pagesizes import A4
+    font_name = _try_register_turkish_font()
+    c = canvas.Canvas(target, pagesize=A4)
+    forms: set = set()
+    for i, e in enumerate(exams, start=1):
+        if cancel is not None and cancel.is_set():
+            return False
+        t0 = time.perf_counter()
+        try:
+            ex, room_layout = _exam_pdf_info(e.exam_id)
+            e.pages = _draw_exam_pages(c, font_name, forms, ex, room_layout, _exam_placements(e.exam_id))
+            e.path = target
+        except Exception as err:
+            e.error = str(err)
+        e.seconds = time.perf_counter() - t0
+        if progress:
+            progress(i, len(exams))
+    c.save()
+    return True
+
+def export_seating_pdfs(exam_type: str, department_id: Optional[int], target: str, merge: bool = False,
+                        max_workers: Optional[int] = None,
+                        progress: Optional[Callable[[int, int], None]] = None,
+                        cancel: Optional[threading.Event] = None) -> BatchPdfResult:
+    """
+    Türdeki (ve bölümdeki) dersliği atanmış tüm sınavların oturma planlarını PDF'e yazar.
+    merge=False: target klasörüne sınav başına <tarih>_<saat>_<ders>_<sınav id>.pdf
+    merge=True:  target dosyasına tarih/saat sırasıyla tek PDF
+    Kayıtlı plan (exam_seats) varsa o kullanılır, yoksa plan o an hesaplanır (kaydedilmez).
+    progress(tamamlanan, toplam) her sınavdan sonra çağrılır; cancel kurulursa kalan sınavlar
+    çizilmez (birleşik PDF yazılmaz, klasöre yazılmış dosyalar kalır).
+    """
+    t0 = time.perf_counter()
+    rows = list_exams_with_rooms(department_id, exam_type)
+    exams = [ExamPdf(int(r["exam_id"]), _exam_label(r)) for r in rows]
+    out = BatchPdfResult(exams, 0.0)
+    if not exams:
+        out.errors.append("Seçilen türde dersliği atanmış sınav yok.")
+        return out
+
+    if merge and not _have_pypdf():
+        out.cancelled = not _render_merged_serial(exams, target, progress, cancel)
+        out.merged_path = None if out.cancelled else target
+        out.wall_s = time.perf_counter() - t0
+        return out
+
+    if merge:
+        folder = tempfile.mkdtemp(prefix="yazlab_pdf_")
+    else:
+        folder = target
+        os.makedirs(folder, exist_ok=True)
+    try:
+        paths = {e.exam_id: os.path.join(folder, _file_name(r)) for e, r in zip(exams, rows)}
+        by_id = {e.exam_id: e for e in exams}
+        workers = max_workers or min(len(exams), os.cpu_count() or 1)
+        done = 0
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(_render_exam, e.exam_id, paths[e.exam_id]): e.exam_id for e in exams}
+            for fut in as_completed(futures):
+                e = by_id[futures[fut]]
+                try:
+                    e.pages, e.seconds = fut.result()
+                    e.path = paths[e.exam_id]
+                except Exception as err:
+                    e.error = str(err)
+                done += 1
+                if progress:
+                    progress(done, len(exams))
+                if cancel is not None and cancel.is_set():
+                    out.cancelled = True
+                    pool.shutdown(wait=True, cancel_futures=True)
+                    break
+        if out.cancelled:
+            # iptal anında çalışmakta olup yine de biten sınavlar
+            for fut, exam_id in futures.items():
+                e = by_id[exam_id]
+                if e.path is None and e.error is None and not fut.cancelled() and fut.exception() is None:
+                    e.pages, e.seconds = fut.result()
+                    e.path = paths[exam_id]
+
+        if merge and not out.cancelled:
+            _merge_pdfs([e.path for e in exams if e.path], target)
+            out.merged_path = target
+            for e in exams:
+                e.path = target if e.path else None
+    finally:
+        if merge:
+            shutil.rmtree(folder, ignore_errors=True)
+
+    out.wall_s = time.perf_counter() - t0
+    return out
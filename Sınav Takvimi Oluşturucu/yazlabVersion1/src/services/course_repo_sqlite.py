@@ -13,9 +13,8 @@ def list_courses_with_counts(department_id: int | None = None):
             c.code,
             c.name,
             c.department_id,
-            COUNT(e.student_id) AS student_count
+            c.student_count
         FROM courses c
-        LEFT JOIN enrollments e ON e.course_id = c.id
     """
 
     conds = []
@@ -26,7 +25,7 @@ def list_courses_with_counts(department_id: int | None = None):
         params.append(department_id)
 
     where = (" WHERE " + " AND ".join(conds)) if conds else ""
-    sql = base + where + " GROUP BY c.id ORDER BY c.code"
+    sql = base + where + " ORDER BY c.code"
 
     cur.execute(sql, params)
     rows = cur.fetchall()
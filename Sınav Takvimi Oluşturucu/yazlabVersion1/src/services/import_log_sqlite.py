@@ -0,0 +1,134 @@
+# src/services/import_log_sqlite.py
+"""
+İçe aktarım günlüğü (import_log / import_log_rows).
+Bölüm + liste türü başına son içe aktarılan dosyanın özeti ve her normalize satırın
+(öğrenci no + ders kodu) içerik özeti tutulur; değişmeyen dosyalar atlanır,
+değişen dosyalarda yalnızca fark uygulanır.
+"""
+from __future__ import annotations
+import hashlib
+from typing import Iterable, List, Optional, Tuple
+from src.db.sqlite import get_conn
+
+KIND_COURSES = "courses"
+KIND_STUDENTS = "students"
+
+def file_digest(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+def _row_key(student_no: str, course_code: str) -> str:
+    return f"{student_no}\t{course_code}"
+
+def _row_hash(full_name: str, class_level: int) -> str:
+    return hashlib.blake2b(f"{full_name}\t{class_level}".encode("utf-8"), digest_size=8).hexdigest()
+
+def get_log(cur, department_id: int, kind: str) -> Tuple[Optional[int], Optional[str]]:
+    """(log_id, file_hash); kayıt yoksa (None, None)."""
+    cur.execute("SELECT id, file_hash FROM import_log WHERE department_id=? AND kind=?",
+                (department_id, kind))
+    r = cur.fetchone()
+    return (r["id"], r["file_hash"]) if r else (None, None)
+
+def is_unchanged(department_id: int, kind: str, digest: str) -> bool:
+    """Son başarılı içe aktarım aynı dosyadan mı yapıldı?"""
+    con = get_conn(); cur = con.cursor()
+    _, logged = get_log(cur, department_id, kind)
+    con.close()
+    return bool(logged) and logged == digest
+
+def save_log(cur, department_id: int, kind: str, digest: str, row_count: int) -> int:
+    """
+    Dosya özetini kaydeder. digest boş bırakılırsa ("") bir sonraki içe aktarım
+    dosya değişmemiş olsa bile atlanmaz (ör. ders bulunamayan satırlar yeniden denensin).
+    """
+    cur.execute("""
+        INSERT INTO import_log(department_id, kind, file_hash, row_count, imported_at)
+        VALUES(?,?,?,?, datetime('now'))
+        ON CONFLICT(department_id, kind) DO UPDATE SET
+            file_hash=excluded.file_hash,
+            row_count=excluded.row_count,
+            imported_at=excluded.imported_at
+    """, (department_id, kind, digest, row_count))
+    log_id, _ = get_log(cur, department_id, kind)
+    return log_id
+
+# --- satır farkı (temp.import_seen üzerinden; temp_store=FILE bağlantıda tablo diskte tutulur) ---
+
+def begin_rows(cur) -> None:
+    cur.execute("""
+        CREATE TEMP TABLE IF NOT EXISTS import_seen(
+            row_key TEXT PRIMARY KEY,
+            row_hash TEXT NOT NULL,
+            line INTEGER NOT NULL,
+            student_no TEXT NOT NULL,
+            full_name TEXT NOT NULL,
+            class_level INTEGER NOT NULL,
+            course_code TEXT NOT NULL
+        )""")
+    cur.execute("DELETE FROM temp.import_seen")
+
+def add_rows(cur, records: Iterable[tuple]) -> None:
+    """(satır_no, student_no, full_name, class_level, course_code); aynı öğrenci+ders için ilk satır geçerli."""
+    cur.executemany("""
+        INSERT OR IGNORE INTO temp.import_seen(row_key, row_hash, line, student_no, full_name, class_level, course_code)
+        VALUES(?,?,?,?,?,?,?)
+    """, ((_row_key(sno, ccode), _row_hash(name, cl), line, sno, name, cl, ccode)
+          for line, sno, name, cl, ccode in records))
+
+def seen_count(cur) -> int:
+    return cur.execute("SELECT COUNT(*) FROM temp.import_seen").fetchone()[0]
+
+def changed_count(cur, log_id: Optional[int]) -> int:
+    """changed_rows'un döndüreceği satır sayısı (ilerleme göstergesi için)."""
+    cur.execute("""
+        SELECT COUNT(*)
+        FROM temp.import_seen s
+        LEFT JOIN import_log_rows r ON r.log_id = ? AND r.row_key = s.row_key
+        WHERE r.row_hash IS NULL OR r.row_hash != s.row_hash
+    """, (log_id,))
+    return cur.fetchone()[0]
+
+def changed_rows(cur, log_id: Optional[int]):
+    """Önceki günlükte olmayan ya da içeriği değişen satırlar (satır sırasıyla). log_id None ise hepsi."""
+    cur.execute("""
+        SELECT s.line, s.student_no, s.full_name, s.class_level, s.course_code
+        FROM temp.import_seen s
+        LEFT JOIN import_log_rows r ON r.log_id = ? AND r.row_key = s.row_key
+        WHERE r.row_hash IS NULL OR r.row_hash != s.row_hash
+        ORDER BY s.line
+    """, (log_id,))
+    return cur
+
+def removed_keys(cur, log_id: int) -> List[Tuple[str, str]]:
+    """Önceki içe aktarımda olup yeni dosyada olmayan (student_no, course_code) çiftleri."""
+    cur.execute("""
+        SELECT r.row_key FROM import_log_rows r
+        WHERE r.log_id = ?
+          AND NOT EXISTS (SELECT 1 FROM temp.import_seen s WHERE s.row_key = r.row_key)
+    """, (log_id,))
+    return [tuple(r[0].split("\t", 1)) for r in cur.fetchall()]
+
+def forget_rows(cur, keys: Iterable[Tuple[str, str]]) -> None:
+    """Uygulanamayan satırları günlüğe yazılmasın diye çıkarır (sonraki içe aktarımda yeniden denenir)."""
+    cur.executemany("DELETE FROM temp.import_seen WHERE row_key=?",
+                    ((_row_key(sno, ccode),) for sno, ccode in keys))
+
+def save_rows(cur, log_id: int) -> None:
+    """Satır günlüğünü temp.import_seen ile eşitler (yalnızca fark yazılır)."""
+    cur.execute("""
+        DELETE FROM import_log_rows
+        WHERE log_id = ?
+          AND row_key NOT IN (SELECT row_key FROM temp.import_seen)
+    """, (log_id,))
+    cur.execute("""
+        INSERT OR REPLACE INTO import_log_rows(log_id, row_key, row_hash)
+        SELECT ?, s.row_key, s.row_hash
+        FROM temp.import_seen s
+        WHERE NOT EXISTS (SELECT 1 FROM import_log_rows r
+                          WHERE r.log_id = ? AND r.row_key = s.row_key AND r.row_hash = s.row_hash)
+    """, (log_id, log_id))
+    cur.execute("DELETE FROM temp.import_seen")
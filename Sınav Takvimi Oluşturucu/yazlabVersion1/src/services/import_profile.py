@@ -0,0 +1,205 @@
+# src/services/import_profile.py
+"""
+İçe aktarım profili: aşama bazında süre/satır, SQL ifade sayısı, transaction süresi
+ve tepe bellek. Profil yalnızca istendiğinde (profiling(enabled=True)) toplanır;
+importer yardımcıları stage(...) ile ölçüm noktası bırakır, profil yoksa bunlar boş geçer.
+Tepe bellek süreç RSS'inden okunur (tracemalloc içe aktarımı birkaç kat yavaşlatıyor):
+Linux'ta içe aktarım başında sıfırlanır, diğer POSIX sistemlerde sürecin tepe değeridir.
+"""
+from __future__ import annotations
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, Optional
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+from src.db.sqlite import DB_PATH
+
+# Aşamalar (rapordaki sırayla)
+STAGE_LABELS = {
+    "parse": "Dosya okuma",
+    "header": "Başlık tespiti",
+    "normalise": "Normalizasyon",
+    "validate": "Doğrulama",
+    "staging": "Geçici tabloya yükleme",
+    "write": "Veritabanı yazma",
+    "conflicts": "Çakışma tablosu",
+    "maintenance": "Otomatik bakım",
+}
+
+# JSON satırları (her içe aktarım bir satır) — eğilim takibi için
+PROFILE_LOG_PATH = DB_PATH.with_name("import_profile.jsonl")
+
+_active: ContextVar[Optional["ImportProfile"]] = ContextVar("import_profile", default=None)
+
+@dataclass
+class StageTiming:
+    seconds: float = 0.0
+    rows: int = 0
+
+    @property
+    def rows_per_s(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+@dataclass
+class ImportProfile:
+    path: str
+    kind: str
+    department_id: int
+    started_at: float
+    total_s: float = 0.0
+    rows_read: int = 0
+    sql_statements: int = 0
+    transaction_s: float = 0.0
+    peak_memory_bytes: int = 0
+    peak_memory_scope: str = "import"   # "import" | "process" (sürecin tepe değeri) | "python" (tracemalloc)
+    stages: Dict[str, StageTiming] = field(default_factory=dict)
+
+    def summary(self) -> str:
+        lines = [
+            f"Dosya: {os.path.basename(self.path)} ({self.rows_read} satır), toplam {self.total_s:.2f} sn",
+            f"SQL ifadesi: {self.sql_statements}, transaction: {self.transaction_s:.2f} sn, "
+            f"tepe bellek: {self.peak_memory_bytes/1024/1024:.1f} MB"
+            + ("" if self.peak_memory_scope == "import" else f" ({_SCOPE_LABELS[self.peak_memory_scope]})"),
+        ]
+        for name, st in self.stages.items():
+            rows = ""
+            if st.rows:
+                rate = f", {st.rows_per_s:,.0f} satır/sn" if st.seconds >= 0.001 else ""
+                rows = f" ({st.rows} satır{rate})"
+            lines.append(f" - {STAGE_LABELS.get(name, name)}: {st.seconds*1000:.0f} ms{rows}")
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict:
+        d = asdict(self)
+        d["started_at"] = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.started_at))
+        for name, st in self.stages.items():
+            d["stages"][name]["rows_per_s"] = round(st.rows_per_s, 1)
+        return d
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), ensure_ascii=False)
+
+_SCOPE_LABELS = {"process": "süreç tepe değeri", "python": "yalnızca Python nesneleri"}
+
+def _reset_peak_rss() -> bool:
+    """Linux: VmHWM'yi güncel RSS'e sıfırlar. Başarılıysa True."""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+def _peak_rss_bytes() -> Optional[int]:
+    """Sürecin tepe RSS değeri (byte); ölçülemiyorsa None."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return kb if sys.platform == "darwin" else kb * 1024
+
+def append_log(profile: ImportProfile, path: Optional[Path] = None) -> Path:
+    """Profili JSON satırı olarak günlük dosyasına ekler; dosya yolunu döner."""
+    path = Path(path or PROFILE_LOG_PATH)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(profile.to_json() + "\n")
+    return path
+
+def current() -> Optional[ImportProfile]:
+    return _active.get()
+
+@contextmanager
+def profiling(path: str, kind: str, department_id: int, enabled: bool = True):
+    """
+    Blok süresince profil toplar ve profili (enabled=False ise None) verir.
+    RSS ölçülemeyen sistemlerde (Windows) tepe bellek için tracemalloc açılır.
+    """
+    if not enabled:
+        yield None
+        return
+    prof = ImportProfile(path, kind, department_id, time.time())
+    token = _active.set(prof)
+    use_rss = _peak_rss_bytes() is not None
+    own_trace = False
+    if use_rss:
+        prof.peak_memory_scope = "import" if _reset_peak_rss() else "process"
+    else:
+        prof.peak_memory_scope = "python"
+        own_trace = not tracemalloc.is_tracing()
+        if own_trace:
+            tracemalloc.start()
+        else:
+            tracemalloc.reset_peak()
+    t0 = time.perf_counter()
+    try:
+        yield prof
+    finally:
+        prof.total_s = time.perf_counter() - t0
+        if use_rss:
+            prof.peak_memory_bytes = _peak_rss_bytes() or 0
+        else:
+            prof.peak_memory_bytes = tracemalloc.get_traced_memory()[1]
+            if own_trace:
+                tracemalloc.stop()
+        _active.reset(token)
+
+@contextmanager
+def stage(name: str, rows: int = 0):
+    """Aşama süresini (ve varsa satır sayısını) etkin profile ekler; aynı aşama birden çok kez ölçülebilir."""
+    prof = _active.get()
+    if prof is None:
+        yield
+        return
+    st = prof.stages.setdefault(name, StageTiming())
+    st.rows += rows
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        st.seconds += time.perf_counter() - t0
+
+def add_rows(name: str, rows: int) -> None:
+    """Süresi ayrıca ölçülen aşamaya işlenen satır sayısını ekler."""
+    prof = _active.get()
+    if prof is not None:
+        prof.stages.setdefault(name, StageTiming()).rows += rows
+
+@contextmanager
+def transaction_timer():
+    """Transaction süresini (commit dahil) ölçer; bulk_transaction'ın dışına sarılır."""
+    prof = _active.get()
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        if prof is not None:
+            prof.transaction_s += time.perf_counter() - t0
+
+def trace_statements(con) -> None:
+    """Bağlantıda çalışan her SQL ifadesini etkin profilde sayar (executemany'de her satır ayrı)."""
+    prof = _active.get()
+    if prof is None:
+        return
+
+    def count(_sql):
+        prof.sql_statements += 1
+    con.set_trace_callback(count)
+
+def note_rows_read(n: int) -> None:
+    prof = _active.get()
+    if prof is not None:
+        prof.rows_read = n
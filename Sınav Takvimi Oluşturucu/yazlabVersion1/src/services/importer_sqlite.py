@@ -2,33 +2,118 @@ from __future__ import annotations
 from src.services.guards import ensure_classrooms_ready, DomainError
 from src.config import DB_PATH
 from dataclasses import dataclass
-from typing import List, Tuple, Optional
+from typing import Callable, Iterator, List, Tuple, Optional, TYPE_CHECKING
+import codecs
+import csv
+import os
 import re
-import unicodedata
-import pandas as pd
-from src.db.sqlite import get_conn
+import sys
+import threading
+from src.db.sqlite import bulk_transaction
+from src.services.text_norm import class_number, normalize_key, normalize_text
+from src.services.scheduler_sqlite import refresh_course_conflicts
+from src.services import import_log_sqlite as import_log
+from src.services import import_profile
+from src.services.import_profile import ImportProfile
+from src.services.import_log_sqlite import KIND_COURSES, KIND_STUDENTS
+from src.db.maintenance import (
+    AUTO_MAINTENANCE_ROW_THRESHOLD, MaintenanceReport, run_maintenance
+)
 
 REQUIRED_COURSE_COLS = ["code", "name", "instructor", "class_level", "compulsory"]
 REQUIRED_STUDENT_COLS = ["student_no", "full_name", "class_level", "course_code"]
 
+# Örnek şablondaki öğrenci listesi başlıkları
+STUDENT_HEADER_MAP = {
+    "Öğrenci No": "student_no",
+    "Ad Soyad": "full_name",
+    "Sınıf": "class_level",
+    "Ders": "course_code",
+}
+
+# Bu boyutun üzerindeki öğrenci listeleri akış modunda (sabit bellek) okunur.
+STREAMING_MIN_BYTES = 5 * 1024 * 1024
+STREAM_BATCH_SIZE = 5000
+
+# Kayıt sistemi dışa aktarımları: uzantı -> ayraç (None ise ilk satırlardan koklanır)
+CSV_EXTENSIONS = {".csv": None, ".tsv": "\t"}
+
+# İçe aktarım aşamaları (ilerleme bildiriminde kullanılır)
+STAGE_PARSE = "parse"          # dosya okunuyor
+STAGE_NORMALISE = "normalise"  # satırlar doğrulanıp normalize ediliyor
+STAGE_WRITE = "write"          # veritabanına yazılıyor
+
+# progress(aşama, işlenen, toplam | None)
+ProgressCallback = Callable[[str, int, Optional[int]], None]
+
+class ImportCancelled(RuntimeError):
+    """İçe aktarım kullanıcı tarafından iptal edildi; transaction geri alındı."""
+    def __init__(self):
+        super().__init__("İçe aktarım iptal edildi, değişiklikler geri alındı.")
+
+def _check_cancel(cancel: Optional[threading.Event]) -> None:
+    if cancel is not None and cancel.is_set():
+        raise ImportCancelled()
+
 @dataclass
 class ImportResult:
     inserted: int
     updated: int
     errors: List[str]
+    maintenance: Optional[MaintenanceReport] = None
+    removed: int = 0        # listeden çıkarıldığı için silinen kayıtlar
+    unchanged: int = 0      # önceki içe aktarımla aynı olduğu için atlanan satırlar
+    skipped: bool = False   # dosya değişmemiş, hiçbir şey yapılmadı
+    profile: Optional[ImportProfile] = None  # profile=True ile çağrıldıysa aşama süreleri
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+def _pd():
+    """pandas ilk içe aktarımda yüklenir (uygulama açılışını yavaşlatmasın)."""
+    import pandas as pd
+    return pd
+
+def _maybe_run_maintenance(res: ImportResult, row_count: int) -> ImportResult:
+    """Büyük içe aktarımlardan sonra ANALYZE/vacuum bakımını çalıştırır."""
+    if row_count >= AUTO_MAINTENANCE_ROW_THRESHOLD:
+        try:
+            with import_profile.stage("maintenance"):
+                res.maintenance = run_maintenance()
+        except Exception as e:
+            res.errors.append(f"Otomatik bakım çalıştırılamadı: {e}")
+    return res
+
+# Unicode normalize + NBSP temizliği + whitespace sadeleştirme (önbellekli, bkz. text_norm)
+_u = normalize_text
+
+def _per_unique(col: pd.Series, transform) -> pd.Series:
+    """
+    transform'u (vektörel str işlemleri) yalnızca sütunun tekil değerlerine uygular
+    ve sonucu tüm satırlara yayar. Tekrarlayan değerler (ders kodu, sınıf, ad)
+    bir kez işlenir.
+    """
+    pd = _pd()
+    s = col.astype(object).where(col.notna(), "").astype(str)
+    codes, uniques = pd.factorize(s)
+    res = transform(pd.Series(uniques, dtype=object))
+    return pd.Series(res.to_numpy(dtype=object)[codes], index=col.index, dtype=object)
+
+def _u_vec(s: pd.Series) -> pd.Series:
+    return (s.str.normalize("NFKC")
+             .str.replace("\xa0", " ", regex=False)
+             .str.replace(r"\s+", " ", regex=True)
+             .str.strip())
 
-def _u(s) -> str:
-    """Unicode normalize + NBSP temizliği + whitespace sadeleştirme."""
-    if s is None or (isinstance(s, float) and pd.isna(s)):
-        return ""
-    s = str(s)
-    s = unicodedata.normalize("NFKC", s)
-    s = s.replace("\xa0", " ")
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
+def _u_series(col: pd.Series) -> pd.Series:
+    """_u'nun sütun bazlı (vektörel) karşılığı."""
+    return _per_unique(col, _u_vec)
 
-def _norm(x) -> str:
-    return _u(x)
+def _key_series(col: pd.Series) -> pd.Series:
+    """normalize_key'in sütun bazlı karşılığı (tekil değerler intern edilir)."""
+    return _per_unique(col, lambda u: _u_vec(u).map(sys.intern))
+
+_norm = normalize_text
 
 def _normalize_cols(cols) -> list[str]:
     return [_u(c) for c in cols]
@@ -50,34 +135,22 @@ def _extract_class_from_colname(colname: str) -> Optional[int]:
     m = _CLASS_PAT.match(_u(colname))
     return int(m.group(1)) if m else None
 
-def _row_is_class_header(text: str) -> Optional[int]:
-    s = _u(text)
-    m = _CLASS_PAT.match(s)
-    return int(m.group(1)) if m else None
-
 _ELECTIVE_MARKERS = (
     "SEÇMELİ", "SEÇİMLİK",
     "SEÇMELİ DERS", "SEÇİMLİK DERS",
     "SEÇMELİ DERSLER", "SEÇİMLİK DERSLER"
 )
 
-def _row_is_elective_header(text: str) -> bool:
-    s = _u(text).upper()
-    return any(mark in s for mark in _ELECTIVE_MARKERS)
+_ELECTIVE_RE = "|".join(re.escape(m) for m in _ELECTIVE_MARKERS)
 
-def _first_nonempty_cell(row: pd.Series) -> str:
-    for v in row.values:
-        s = _u(v)
-        if s:
-            return s
-    return ""
+_COURSE_CODE_RE = re.compile(r"^[A-Za-zÇĞİÖŞÜçğıöşü]{2,}\d{2,}[A-Za-zÇĞİÖŞÜçğıöşü\-]*$")
 
 def _looks_like_course_code(code: str) -> bool:
     """ABC101, BLM205, MUH403 gibi; TR karakterlerini destekler."""
     c = _u(code)
     if not c:
         return False
-    return re.match(r"^[A-Za-zÇĞİÖŞÜçğıöşü]{2,}\d{2,}[A-Za-zÇĞİÖŞÜçğıöşü\-]*$", c) is not None
+    return _COURSE_CODE_RE.match(c) is not None
 
 
 def _to_standard_courses_df(xlsx_path: str) -> Tuple[pd.DataFrame, List[str]]:
@@ -86,69 +159,89 @@ def _to_standard_courses_df(xlsx_path: str) -> Tuple[pd.DataFrame, List[str]]:
       - Kolonlar: ['code','name','instructor','class_level','compulsory']
       - 'compulsory' sınıf/SEÇMELİ başlıklarına göre hesaplanır.
     """
+    pd = _pd()
     warnings: List[str] = []
-    xls = pd.ExcelFile(xlsx_path)
-    if not xls.sheet_names:
-        return pd.DataFrame(columns=REQUIRED_COURSE_COLS), ["Sayfa bulunamadı."]
-
-    sheet = xls.sheet_names[0]
-    raw = xls.parse(sheet, header=None)  
-    raw = raw.applymap(_u)
-
-    out_rows: List[dict] = []
-    current_class: int = 0
-    current_compulsory: int = 1
-    idx_code = idx_name = idx_instr = None
-
-    for _, row in raw.iterrows():
-        # 1) sınıf başlığı?
-        first_text = _first_nonempty_cell(row)
-        maybe_cls = _row_is_class_header(first_text)
-        if maybe_cls is not None:
-            current_class = int(maybe_cls)
-            current_compulsory = 1
-            continue
-
-        # 2) seçmeli/seçimlik?
-        if _row_is_elective_header(first_text):
-            current_compulsory = 0
-            continue
-
-        tokens = { _u(v).upper() for v in row.values if _u(v) }
-        if _COURSE_HEADER_TOKENS.issubset(tokens):
-            idx_code = idx_name = idx_instr = None
-            for j, v in enumerate(row.values):
-                t = _u(v).upper()
-                if t == "DERS KODU" and idx_code is None:
-                    idx_code = j
-                elif t == "DERSİN ADI" and idx_name is None:
-                    idx_name = j
-                elif t == "DERSİ VEREN ÖĞR. ELEMANI" and idx_instr is None:
-                    idx_instr = j
-            if idx_code is None or idx_name is None or idx_instr is None:
-                warnings.append("Başlık satırı bulundu ama sütun indeksleri çıkarılamadı.")
-                idx_code = idx_name = idx_instr = None
-            continue
-
-        if idx_code is None or idx_name is None or idx_instr is None:
-            continue
+    if _is_csv(xlsx_path):
+        with import_profile.stage("parse"):
+            _, rows = _csv_rows(xlsx_path)
+            raw = pd.DataFrame(list(rows), dtype=object)
+        import_profile.add_rows("parse", len(raw))
+        if raw.empty:
+            return pd.DataFrame(columns=REQUIRED_COURSE_COLS), ["Dosya boş."]
+        return _courses_from_raw(raw, warnings)
+
+    with import_profile.stage("parse"):
+        xls = pd.ExcelFile(xlsx_path)
+        if not xls.sheet_names:
+            return pd.DataFrame(columns=REQUIRED_COURSE_COLS), ["Sayfa bulunamadı."]
+
+        sheet = xls.sheet_names[0]
+        raw = xls.parse(sheet, header=None)
+    import_profile.add_rows("parse", len(raw))
+    return _courses_from_raw(raw, warnings)
+
+
+def _courses_from_raw(raw: pd.DataFrame, warnings: List[str]) -> Tuple[pd.DataFrame, List[str]]:
+    """
+    Ham (başlıksız) ders sayfasını satır satır gezmeden standart tabloya çevirir.
+    Sınıf / seçmeli / tablo başlığı satırları sütun bazlı maskelerle bulunur,
+    geçerli sınıf, zorunluluk ve sütun indeksleri ileri doldurma (ffill) ile taşınır.
+    """
+    pd = _pd()
+    import numpy as np
 
-        code = _u(row.iloc[idx_code]) if idx_code < len(row) else ""
-        name = _u(row.iloc[idx_name]) if idx_name < len(row) else ""
-        instr = _u(row.iloc[idx_instr]) if idx_instr < len(row) else ""
+    if raw.empty:
+        warnings.append("Geçerli ders kaydı bulunamadı.")
+        return pd.DataFrame(columns=REQUIRED_COURSE_COLS), warnings
 
-        if not _looks_like_course_code(code) or not name:
-            continue
+    with import_profile.stage("normalise", len(raw)):
+        norm = raw.apply(_u_series)
+        upper = norm.apply(lambda c: c.str.upper())
 
-        out_rows.append({
-            "code": code,
-            "name": name,
-            "instructor": instr,
-            "class_level": int(current_class or 0),
-            "compulsory": int(current_compulsory),
-        })
+    with import_profile.stage("header", len(raw)):
+        # 1) sınıf başlığı? (ilk dolu hücre '1. Sınıf' gibi)
+        first = norm.where(norm != "").bfill(axis=1).iloc[:, 0].fillna("")
+        cls = first.str.extract(_CLASS_PAT.pattern, flags=re.I, expand=False)
+        is_class = cls.notna()
 
-    out = pd.DataFrame(out_rows).drop_duplicates(subset=["code"]).reset_index(drop=True)
+        # 2) seçmeli/seçimlik?
+        is_elective = ~is_class & first.str.upper().str.contains(_ELECTIVE_RE, regex=True)
+
+        # 3) tablo başlığı? (DERS KODU / DERSİN ADI / DERSİ VEREN ... aynı satırda)
+        token_hits = {tok: upper.eq(tok) for tok in _COURSE_HEADER_TOKENS}
+        is_header = ~is_class & ~is_elective
+        for hits in token_hits.values():
+            is_header &= hits.any(axis=1)
+
+        def header_col(tok: str) -> pd.Series:
+            idx = pd.Series(np.nan, index=raw.index)
+            idx[is_header] = token_hits[tok].to_numpy()[is_header.to_numpy()].argmax(axis=1)
+            return idx.ffill()
+
+        idx_code = header_col("DERS KODU")
+        idx_name = header_col("DERSİN ADI")
+        idx_instr = header_col("DERSİ VEREN ÖĞR. ELEMANI")
+
+        current_class = pd.to_numeric(cls, errors="coerce").ffill().fillna(0).astype(int)
+        compulsory = pd.Series(np.nan, index=raw.index)
+        compulsory[is_class] = 1
+        compulsory[is_elective] = 0
+        compulsory = compulsory.ffill().fillna(1).astype(int)
+
+        data = ~(is_class | is_elective | is_header) & idx_code.notna()
+        rows = np.flatnonzero(data.to_numpy())
+        cells = norm.to_numpy(dtype=object)
+
+        out = pd.DataFrame({
+            "code": cells[rows, idx_code.to_numpy()[rows].astype(int)],
+            "name": cells[rows, idx_name.to_numpy()[rows].astype(int)],
+            "instructor": cells[rows, idx_instr.to_numpy()[rows].astype(int)],
+            "class_level": current_class.to_numpy()[rows],
+            "compulsory": compulsory.to_numpy()[rows],
+        }, columns=REQUIRED_COURSE_COLS)
+
+    valid = out["code"].str.match(_COURSE_CODE_RE) & (out["name"] != "")
+    out = out[valid.astype(bool)].drop_duplicates(subset=["code"]).reset_index(drop=True)
     if out.empty:
         warnings.append("Geçerli ders kaydı bulunamadı.")
 
@@ -163,57 +256,227 @@ def _to_standard_students_df(xlsx_path: str) -> Tuple[pd.DataFrame, List[str]]:
     Çıkış:
       - ['student_no','full_name','class_level','course_code']
     """
+    pd = _pd()
     warnings: List[str] = []
-    xls = pd.ExcelFile(xlsx_path)
-    if not xls.sheet_names:
-        return pd.DataFrame(columns=REQUIRED_STUDENT_COLS), ["Sayfa bulunamadı."]
-
-    sheet = xls.sheet_names[0]
-    df = xls.parse(sheet)
-    df.columns = _normalize_cols(df.columns)
-
-    if set(REQUIRED_STUDENT_COLS).issubset(set(df.columns)):
-        out = df.copy()
-        return out[REQUIRED_STUDENT_COLS], warnings
-
-    turkish_map = {
-        "Öğrenci No": "student_no",
-        "Ad Soyad": "full_name",
-        "Sınıf": "class_level",
-        "Ders": "course_code",
-    }
+    with import_profile.stage("parse"):
+        xls = pd.ExcelFile(xlsx_path)
+        if not xls.sheet_names:
+            return pd.DataFrame(columns=REQUIRED_STUDENT_COLS), ["Sayfa bulunamadı."]
+
+        sheet = xls.sheet_names[0]
+        df = xls.parse(sheet)
+    import_profile.add_rows("parse", len(df))
+
+    with import_profile.stage("header", len(df)):
+        df.columns = _normalize_cols(df.columns)
+        flat = set(REQUIRED_STUDENT_COLS).issubset(set(df.columns))
+
+    if flat:
+        with import_profile.stage("normalise", len(df)):
+            out = df[REQUIRED_STUDENT_COLS].copy()
+            for col in ("student_no", "full_name"):
+                out[col] = _u_series(out[col])
+            out["course_code"] = _key_series(out["course_code"])
+        return out, warnings
+
+    turkish_map = STUDENT_HEADER_MAP
     missing = [k for k in turkish_map.keys() if k not in df.columns]
     if missing:
         return pd.DataFrame(columns=REQUIRED_STUDENT_COLS), [f"Eksik sütun(lar): {missing}"]
 
-    out = df[list(turkish_map.keys())].rename(columns=turkish_map).copy()
+    with import_profile.stage("normalise", len(df)):
+        out, removed = _students_from_template(df)
+    if removed > 0:
+        warnings.append(f"{removed} satır boş/eksik veri nedeniyle atlandı.")
+    return out, warnings
+
+
+def _students_from_template(df: pd.DataFrame) -> Tuple[pd.DataFrame, int]:
+    """Türkçe şablon sütunlarını standart tabloya çevirir; (tablo, boş/eksik nedeniyle atlanan) döner."""
+    out = df[list(STUDENT_HEADER_MAP.keys())].rename(columns=STUDENT_HEADER_MAP).copy()
 
     out = out.dropna(how="all")
-    def _to_int_class(v) -> int:
-        s = _u(v)
-        m = re.search(r"(\d+)", s)
-        return int(m.group(1)) if m else 0
 
-    out["student_no"] = out["student_no"].map(_u)
+    out["student_no"] = _u_series(out["student_no"])
     out = out[out["student_no"] != ""]
-    out["full_name"] = out["full_name"].map(_u)
-    out["course_code"] = out["course_code"].map(_u)
-    out["class_level"] = out["class_level"].apply(_to_int_class)
+    out["full_name"] = _u_series(out["full_name"])
+    out["course_code"] = _key_series(out["course_code"])
+    out["class_level"] = _per_unique(
+        out["class_level"],
+        lambda u: _u_vec(u).str.extract(r"(\d+)", expand=False).fillna("0")
+    ).astype(int)
 
     before = len(out)
     out = out[(out["full_name"] != "") & (out["course_code"] != "")]
     removed = before - len(out)
-    if removed > 0:
-        warnings.append(f"{removed} satır boş/eksik veri nedeniyle atlandı.")
 
     out = out.drop_duplicates(subset=["student_no", "course_code"], keep="first").reset_index(drop=True)
 
-    return out[REQUIRED_STUDENT_COLS], warnings
+    return out[REQUIRED_STUDENT_COLS], removed
 
 
-def import_courses(xlsx_path: str, department_id: int) -> ImportResult:
-    ensure_classrooms_ready( department_id)
-    df, prep_warnings = _to_standard_courses_df(xlsx_path)
+def _chunks(seq, size: int = 500):
+    """SQLite parametre sınırına takılmamak için IN (...) listelerini böler."""
+    seq = list(seq)
+    for i in range(0, len(seq), size):
+        yield seq[i:i + size]
+
+
+class _StudentWriter:
+    """
+    Doğrulanmış öğrenci satırlarını (satır_no, student_no, full_name, class_level, course_code)
+    parti parti yazar.
+      - Bölümün dersleri, kayıtları ve tüm öğrenciler birer sorguyla belleğe yüklenir.
+      - Öğrenciler UPDATE / INSERT ... ON CONFLICT, kayıtlar INSERT OR IGNORE ile executemany yazılır.
+        Yalnızca bellekte olmayan satırlar INSERT'e gider (AUTOINCREMENT sayacı boşa artmasın);
+        değerleri değişmeyen öğrenci için UPDATE yapılmaz (aynı öğrenci her partide tekrar eder).
+        Yeni öğrenciler temp.import_new_students üzerinden tek INSERT ... SELECT ile eklenir:
+        arama dizini (FTS5) tetikleyicisi her deyim sonunda diske yazdığından satır başına
+        deyim, eklemeyi ~10 kat yavaşlatır.
+      - Kayıt eklenen dersler toplanır; finish() çakışma tablosunu yalnızca onlar için tazeler.
+    preload=True iken yeni kayıtlar biriktirilip flush()/finish()'te tek seferde, sıralı eklenir
+    (parti parti eklemek aynı indeks sayfalarını her partide yeniden yazar).
+    preload=False (akış modu) iken öğrenci/kayıt anahtarları her partide yalnızca o partideki
+    öğrenciler için sorgulanır ve kayıtlar partiyle birlikte yazılır; bellek kullanımı parti
+    boyutuyla sınırlı kalır.
+    Transaction yönetimi çağırana aittir.
+    """
+
+    def __init__(self, cur, department_id: int, errors: List[str], preload: bool = True):
+        self.cur = cur
+        self.department_id = department_id
+        self.errors = errors
+        self.inserted = 0
+        self.updated = 0
+        self.touched_courses: set[int] = set()
+        self.failed: list[tuple[str, str]] = []
+        self.preload = preload
+        self.student_id_by_no: dict[str, int] = {}
+        self.student_values: dict[int, tuple] = {}   # id -> (department_id, full_name, class_level)
+        self.enrolled: set[tuple[int, int]] = set()
+        self.new_enrollments: list[tuple[int, int]] = []
+
+        cur.execute("""CREATE TEMP TABLE IF NOT EXISTS import_new_students(
+                           department_id INTEGER, student_no TEXT, full_name TEXT, class_level INTEGER)""")
+        cur.execute("SELECT id, code FROM courses WHERE department_id=?", (department_id,))
+        self.course_id_by_code = {r["code"]: r["id"] for r in cur.fetchall()}
+        if not preload:
+            return
+        # Öğrenci no tüm bölümlerde aranır (başka bölümdeyse bu bölüme taşınır)
+        cur.execute("""SELECT id, student_no, department_id, full_name, class_level
+                       FROM students ORDER BY id DESC""")
+        self._add_students(cur.fetchall())
+        cur.execute("""SELECT e.student_id, e.course_id FROM enrollments e
+                       JOIN courses c ON c.id = e.course_id
+                       WHERE c.department_id=?""", (department_id,))
+        self.enrolled = {(r[0], r[1]) for r in cur.fetchall()}
+
+    def _load_batch_keys(self, student_nos) -> None:
+        """Akış modu: yalnızca bu partideki öğrencileri ve mevcut kayıtlarını yükler."""
+        cur = self.cur
+        self.student_id_by_no = {}
+        self.student_values = {}
+        for part in _chunks(student_nos):
+            cur.execute(f"""SELECT id, student_no, department_id, full_name, class_level FROM students
+                            WHERE student_no IN ({",".join("?" * len(part))})
+                            ORDER BY id DESC""", part)
+            self._add_students(cur.fetchall())
+        self.enrolled = set()
+        for part in _chunks(self.student_id_by_no.values()):
+            cur.execute(f"""SELECT student_id, course_id FROM enrollments
+                            WHERE student_id IN ({",".join("?" * len(part))})""", part)
+            self.enrolled.update((r[0], r[1]) for r in cur.fetchall())
+
+    def _add_students(self, rows) -> None:
+        for r in rows:
+            self.student_id_by_no[r["student_no"]] = r["id"]
+            self.student_values[r["id"]] = (r["department_id"], r["full_name"], r["class_level"])
+
+    def write(self, rows) -> None:
+        if not self.preload:
+            rows = list(rows)
+            self._load_batch_keys({r[1] for r in rows})
+        cur = self.cur
+        dep = self.department_id
+        students = self.student_id_by_no
+        values = self.student_values
+        courses = self.course_id_by_code
+
+        new_students: dict[str, tuple] = {}
+        upd_students: dict[int, tuple] = {}
+        pending: list[tuple[str, int]] = []
+
+        for line, sno, full_name, class_level, ccode in rows:
+            st_id = students.get(sno)
+            if st_id is not None:
+                if values.get(st_id) != (dep, full_name, class_level):
+                    upd_students[st_id] = (dep, full_name, class_level, st_id)
+                else:
+                    upd_students.pop(st_id, None)  # partide sonra gelen satır geçerli
+                self.updated += 1
+            elif sno in new_students:
+                new_students[sno] = (dep, sno, full_name, class_level)
+                self.updated += 1
+            else:
+                new_students[sno] = (dep, sno, full_name, class_level)
+                self.inserted += 1
+
+            cid = courses.get(ccode)
+            if cid is None:
+                self.errors.append(f"Satır {line}: course_code '{ccode}' bulunamadı (önce dersleri içe aktarın).")
+                self.failed.append((sno, ccode))
+                continue
+            pending.append((sno, cid))
+
+        if upd_students:
+            cur.executemany("""UPDATE students
+                               SET department_id=?, full_name=?, class_level=?
+                               WHERE id=?""", upd_students.values())
+            values.update((st_id, v[:3]) for st_id, v in upd_students.items())
+        if new_students:
+            cur.execute("DELETE FROM temp.import_new_students")
+            cur.executemany("INSERT INTO temp.import_new_students VALUES(?,?,?,?)", new_students.values())
+            cur.execute("""INSERT INTO students(department_id, student_no, full_name, class_level)
+                           SELECT department_id, student_no, full_name, class_level
+                           FROM temp.import_new_students WHERE true ORDER BY rowid
+                           ON CONFLICT(department_id, student_no) DO UPDATE SET
+                               full_name=excluded.full_name,
+                               class_level=excluded.class_level""")
+            for part in _chunks(new_students):
+                cur.execute(f"""SELECT id, student_no, department_id, full_name, class_level FROM students
+                                WHERE department_id=? AND student_no IN ({",".join("?" * len(part))})""",
+                            (dep, *part))
+                self._add_students(cur.fetchall())
+
+        new_enrollments = self.new_enrollments
+        for sno, cid in pending:
+            key = (students[sno], cid)
+            if key not in self.enrolled:
+                self.enrolled.add(key)
+                new_enrollments.append(key)
+        if not self.preload:
+            self.flush()
+
+    def flush(self) -> None:
+        """Biriken yeni kayıtları yazar."""
+        if self.new_enrollments:
+            self.new_enrollments.sort()  # indeks sırasıyla eklemek B-tree yazımını hızlandırır
+            self.cur.executemany("INSERT OR IGNORE INTO enrollments(student_id, course_id) VALUES(?,?)",
+                                 self.new_enrollments)
+            self.touched_courses.update(cid for _, cid in self.new_enrollments)
+            self.new_enrollments = []
+
+    def finish(self) -> None:
+        self.flush()
+        refresh_course_conflicts(self.cur, self.touched_courses)
+
+
+def _course_rows(path: str) -> Tuple[dict[str, tuple], List[str], int]:
+    """
+    Ders listesini okur ve doğrular (veritabanına dokunmaz, süreç havuzunda çalışabilir).
+    Dönüş: (kod -> (code, name, instructor, class_level, compulsory), hatalar, satır sayısı)
+    """
+    df, prep_warnings = _to_standard_courses_df(path)
     df.columns = _normalize_cols(df.columns)
 
     errors: List[str] = []
@@ -223,23 +486,19 @@ def import_courses(xlsx_path: str, department_id: int) -> ImportResult:
         if col not in df.columns:
             errors.append(f"Kolon eksik: {col}")
     if df.empty:
-        return ImportResult(0, 0, errors)
-
-    ins, upd = 0, 0
-    con = get_conn(); cur = con.cursor()
-    try:
-        for i, row in df.iterrows():
-            code = _norm(row.get("code"))
-            name = _norm(row.get("name"))
-            instructor = _norm(row.get("instructor"))
+        return {}, errors, 0
 
+    with import_profile.stage("validate", len(df)):
+        rows: dict[str, tuple] = {}
+        for i, code, name, instructor, class_level, compulsory in df[REQUIRED_COURSE_COLS].itertuples(name=None):
+            code, name, instructor = normalize_key(code), _norm(name), _norm(instructor)
             try:
-                class_level = int(row.get("class_level"))
+                class_level = int(class_level)
             except Exception:
                 errors.append(f"Satır {i+2}: class_level sayısal değil.")
                 continue
             try:
-                compulsory = int(row.get("compulsory"))
+                compulsory = int(compulsory)
             except Exception:
                 errors.append(f"Satır {i+2}: compulsory sayısal değil.")
                 continue
@@ -247,100 +506,380 @@ def import_courses(xlsx_path: str, department_id: int) -> ImportResult:
             if not code or not name:
                 errors.append(f"Satır {i+2}: code/name boş olamaz.")
                 continue
-
-            cur.execute("SELECT id FROM courses WHERE department_id=? AND code=?",
-                        (department_id, code))
-            ex = cur.fetchone()
-            if ex:
-                cur.execute("""UPDATE courses
-                               SET name=?, instructor=?, class_level=?, compulsory=?
-                               WHERE id=?""",
-                            (name, instructor, class_level, 1 if compulsory else 0, ex["id"]))
-                upd += 1
-            else:
-                cur.execute("""INSERT INTO courses(department_id, code, name, instructor, class_level, compulsory)
-                               VALUES(?,?,?,?,?,?)""",
-                            (department_id, code, name, instructor, class_level, 1 if compulsory else 0))
-                ins += 1
-        con.commit()
-    finally:
-        con.close()
-    return ImportResult(ins, upd, errors)
-
-
-def import_students(xlsx_path: str, department_id: int) -> ImportResult:
+            rows[code] = (code, name, instructor, class_level, 1 if compulsory else 0)
+    return rows, errors, len(df)
+
+
+def _write_courses(cur, department_id: int, rows: dict[str, tuple]) -> Tuple[int, int]:
+    """Dersleri toplu yazar; (eklenen, güncellenen) döner. Transaction çağırana aittir."""
+    cur.execute("SELECT code FROM courses WHERE department_id=?", (department_id,))
+    existing = {r["code"] for r in cur.fetchall()}
+    cur.executemany("""UPDATE courses
+                       SET name=?, instructor=?, class_level=?, compulsory=?
+                       WHERE department_id=? AND code=?""",
+                    [(*r[1:], department_id, code) for code, r in rows.items() if code in existing])
+    cur.executemany("""INSERT INTO courses(department_id, code, name, instructor, class_level, compulsory)
+                       VALUES(?,?,?,?,?,?)
+                       ON CONFLICT(department_id, code) DO UPDATE SET
+                           name=excluded.name,
+                           instructor=excluded.instructor,
+                           class_level=excluded.class_level,
+                           compulsory=excluded.compulsory""",
+                    [(department_id, *r) for code, r in rows.items() if code not in existing])
+
+    ins = sum(1 for code in rows if code not in existing)
+    return ins, len(rows) - ins
+
+
+def import_courses(xlsx_path: str, department_id: int, force: bool = False,
+                   progress: Optional[ProgressCallback] = None,
+                   cancel: Optional[threading.Event] = None,
+                   profile: bool = False) -> ImportResult:
+    """
+    Ders listesini içe aktarır. Aynı dosya daha önce içe aktarıldıysa (import_log)
+    force verilmedikçe hiçbir şey yapılmaz. Listeden çıkan dersler silinmez.
+    cancel işaretlenirse commit'ten önce ImportCancelled fırlatılır ve hiçbir şey yazılmaz.
+    profile=True ise aşama süreleri ImportResult.profile'a eklenir (bkz. import_profile).
+    """
+    with import_profile.profiling(xlsx_path, KIND_COURSES, department_id, profile) as prof:
+        res = _import_courses(xlsx_path, department_id, force, progress, cancel)
+    res.profile = prof
+    return res
+
+def _import_courses(xlsx_path: str, department_id: int, force: bool,
+                    progress: Optional[ProgressCallback],
+                    cancel: Optional[threading.Event]) -> ImportResult:
     ensure_classrooms_ready( department_id)
-    df, prep_warnings = _to_standard_students_df(xlsx_path)
-    df.columns = _normalize_cols(df.columns)
+    digest = import_log.file_digest(xlsx_path)
+    if not force and import_log.is_unchanged(department_id, KIND_COURSES, digest):
+        return ImportResult(0, 0, [], skipped=True)
+
+    if progress:
+        progress(STAGE_PARSE, 0, None)
+    rows, errors, row_count = _course_rows(xlsx_path)
+    import_profile.note_rows_read(row_count)
+    _check_cancel(cancel)
+    if progress:
+        progress(STAGE_NORMALISE, row_count, row_count)
+    if row_count == 0:
+        return ImportResult(0, 0, errors)
 
-    errors: List[str] = []
-    errors.extend(prep_warnings)
+    with import_profile.transaction_timer(), bulk_transaction() as con:
+        import_profile.trace_statements(con)
+        cur = con.cursor()
+        if progress:
+            progress(STAGE_WRITE, 0, len(rows))
+        with import_profile.stage("write", len(rows)):
+            ins, upd = _write_courses(cur, department_id, rows)
+            import_log.save_log(cur, department_id, KIND_COURSES, digest, len(rows))
+        _check_cancel(cancel)
+        if progress:
+            progress(STAGE_WRITE, len(rows), len(rows))
+    return _maybe_run_maintenance(ImportResult(ins, upd, errors), row_count)
+
+
+def _valid_student_rows(df: pd.DataFrame, errors: List[str]) -> list[tuple]:
+    """Satırları doğrular; (satır_no, student_no, full_name, class_level, course_code) listesi döner."""
+    rows = []
+    for i, sno, full_name, class_level, ccode in df[REQUIRED_STUDENT_COLS].itertuples(name=None):
+        try:
+            class_level = int(class_level)
+        except Exception:
+            errors.append(f"Satır {i+2}: class_level sayısal değil.")
+            continue
 
-    for col in REQUIRED_STUDENT_COLS:
-        if col not in df.columns:
-            errors.append(f"Kolon eksik: {col}")
-    if df.empty:
-        return ImportResult(0, 0, errors)
+        if not sno or not full_name or not ccode:
+            errors.append(f"Satır {i+2}: student_no/full_name/course_code boş olamaz.")
+            continue
+        rows.append((i + 2, sno, full_name, class_level, ccode))
+    return rows
 
-    ins, upd = 0, 0
-    con = get_conn(); cur = con.cursor()
-    try:
-        course_id_by_code: dict[str, int] = {}
 
-        for i, row in df.iterrows():
-            sno = _norm(row.get("student_no"))
-            full_name = _norm(row.get("full_name"))
-            ccode = _norm(row.get("course_code"))
+def _xlsx_rows(path: str) -> Tuple[Optional[int], Iterator[tuple]]:
+    """
+    İlk sayfanın satırlarını openpyxl read_only ile akış halinde döner (değer tuple'ları).
+    Çalışma kitabı satırlar tükenince kapanır. Toplam satır sayısı bilinmiyorsa None.
+    """
+    from openpyxl import load_workbook
+    wb = load_workbook(path, read_only=True, data_only=True)
+    ws = wb.worksheets[0] if wb.worksheets else None
+    total = ws.max_row if ws is not None else 0
+
+    def rows():
+        try:
+            if ws is not None:
+                yield from ws.iter_rows(values_only=True)
+        finally:
+            wb.close()
+    return total, rows()
+
+def _is_csv(path: str) -> bool:
+    return os.path.splitext(path)[1].lower() in CSV_EXTENSIONS
+
+def _csv_encoding(path: str) -> str:
+    """
+    UTF-8 (BOM'lu/BOM'suz) değilse Türkçe Windows dışa aktarımları için cp1254.
+    Dosyanın tamamı parça parça denetlenir: cp1254 dosyalarda ilk Türkçe karakter
+    (ör. ilk sayfalar yalnızca ASCII numara/kod ise) çok ileride olabilir.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    try:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                decoder.decode(chunk)
+        decoder.decode(b"", final=True)
+        return "utf-8-sig"
+    except UnicodeDecodeError:
+        return "cp1254"
+
+def _csv_rows(path: str) -> Tuple[Optional[int], Iterator[list]]:
+    """
+    CSV/TSV satırlarını csv modülüyle akış halinde döner (_xlsx_rows ile aynı biçimde).
+    .csv için ayraç (',', ';' veya sekme) ilk satırlardan koklanır. Toplam satır bilinmez (None).
+    """
+    encoding = _csv_encoding(path)
+    delimiter = CSV_EXTENSIONS[os.path.splitext(path)[1].lower()]
+
+    def rows():
+        with open(path, newline="", encoding=encoding) as f:
+            sep = delimiter
+            if sep is None:
+                sample = f.read(1 << 14)
+                f.seek(0)
+                try:
+                    sep = csv.Sniffer().sniff(sample, delimiters=",;\t").delimiter
+                except csv.Error:
+                    sep = ","
+            yield from csv.reader(f, delimiter=sep)
+    return None, rows()
+
+def _student_records(rows: Iterator[tuple], errors: List[str]) -> Iterator[tuple]:
+    """
+    Başlık satırını çözer ve her geçerli veri satırı için
+    (satır_no, student_no, full_name, class_level, course_code) üretir.
+    Düz tablo (REQUIRED_STUDENT_COLS) ve Türkçe şablon başlıkları desteklenir;
+    atlama/hata kuralları DataFrame yoluyla aynıdır.
+    """
+    header = next(rows, None)
+    if header is None:
+        errors.append("Sayfa bulunamadı.")
+        return
+    cols = _normalize_cols(header)
+
+    flat = set(REQUIRED_STUDENT_COLS).issubset(cols)
+    if flat:
+        idx = [cols.index(c) for c in REQUIRED_STUDENT_COLS]
+    else:
+        missing = [k for k in STUDENT_HEADER_MAP if k not in cols]
+        if missing:
+            errors.append(f"Eksik sütun(lar): {missing}")
+            return
+        idx = [cols.index(k) for k in STUDENT_HEADER_MAP]
+    width = max(idx) + 1
+
+    removed = 0
+    for line, row in enumerate(rows, start=2):
+        if len(row) < width:
+            row = tuple(row) + (None,) * (width - len(row))
+        sno, full_name, class_level, ccode = (row[i] for i in idx)
+        sno, full_name, ccode = _u(sno), _u(full_name), normalize_key(ccode)
+
+        if flat:
             try:
-                class_level = int(row.get("class_level"))
+                class_level = int(class_level)
             except Exception:
-                errors.append(f"Satır {i+2}: class_level sayısal değil.")
+                errors.append(f"Satır {line}: class_level sayısal değil.")
                 continue
-
             if not sno or not full_name or not ccode:
-                errors.append(f"Satır {i+2}: student_no/full_name/course_code boş olamaz.")
+                errors.append(f"Satır {line}: student_no/full_name/course_code boş olamaz.")
+                continue
+        else:
+            if not sno:
+                continue
+            if not full_name or not ccode:
+                removed += 1
                 continue
+            class_level = class_number(class_level)  # '2. Sınıf' -> 2 (DataFrame yolundaki extract ile aynı)
+        yield (line, sno, full_name, class_level, ccode)
 
-            cur.execute("SELECT id, department_id FROM students WHERE student_no=?", (sno,))
-            st = cur.fetchone()
-            if st:
-                if st["department_id"] != department_id:
-                    cur.execute("UPDATE students SET department_id=? WHERE id=?",
-                                (department_id, st["id"]))
-                cur.execute("""UPDATE students
-                               SET full_name=?, class_level=?
-                               WHERE id=?""",
-                            (full_name, class_level, st["id"]))
-                st_id = st["id"]
-                upd += 1
-            else:
-                cur.execute("""INSERT INTO students(department_id, student_no, full_name, class_level)
-                               VALUES(?,?,?,?)""",
-                            (department_id, sno, full_name, class_level))
-                st_id = cur.lastrowid
-                ins += 1
-
-
-            if ccode not in course_id_by_code:
-                cur.execute("""SELECT id FROM courses
-                               WHERE department_id=? AND code=?""",
-                            (department_id, ccode))
-                c = cur.fetchone()
-                if not c:
-                    errors.append(f"Satır {i+2}: course_code '{ccode}' bulunamadı (önce dersleri içe aktarın).")
-                    continue
-                course_id_by_code[ccode] = c["id"]
-            cid = course_id_by_code[ccode]
-
-            cur.execute("""SELECT 1 FROM enrollments
-                           WHERE student_id=? AND course_id=?""",
-                        (st_id, cid))
-            if not cur.fetchone():
-                cur.execute("""INSERT INTO enrollments(student_id, course_id)
-                               VALUES(?,?)""", (st_id, cid))
-
-        con.commit()
-    finally:
-        con.close()
-
-    return ImportResult(ins, upd, errors)
+    if removed > 0:
+        errors.append(f"{removed} satır boş/eksik veri nedeniyle atlandı.")
+
+def _student_rows(path: str) -> Tuple[list[tuple], List[str], int]:
+    """
+    Öğrenci listesini tamamen okur ve doğrular (veritabanına dokunmaz, süreç havuzunda çalışabilir).
+    Dönüş: ((satır_no, student_no, full_name, class_level, course_code) listesi, hatalar, satır sayısı)
+    """
+    if _is_csv(path):
+        errors: List[str] = []
+        _, raw_rows = _csv_rows(path)
+        rows: dict[tuple[str, str], tuple] = {}
+        last_line = 1
+        for rec in _student_records(raw_rows, errors):
+            last_line = rec[0]
+            rows.setdefault((rec[1], rec[4]), rec)
+        return list(rows.values()), errors, last_line - 1
+
+    df, prep_warnings = _to_standard_students_df(path)
+    df.columns = _normalize_cols(df.columns)
+
+    errors = list(prep_warnings)
+    for col in REQUIRED_STUDENT_COLS:
+        if col not in df.columns:
+            errors.append(f"Kolon eksik: {col}")
+    if df.empty:
+        return [], errors, 0
+    with import_profile.stage("validate", len(df)):
+        rows = _valid_student_rows(df, errors)
+    return rows, errors, len(df)
+
+def _student_source(path: str, streaming: Optional[bool]) -> Tuple[Iterator[tuple], List[str], Optional[int], bool]:
+    """
+    Dosya türüne göre doğrulanmış öğrenci satırları kaynağı:
+    (kayıtlar, hatalar, toplam satır | None, akış halinde mi).
+    - .csv/.tsv her zaman csv modülüyle akış halinde okunur.
+    - xlsx, streaming=None ise STREAMING_MIN_BYTES'tan büyükse openpyxl read_only ile akış halinde,
+      değilse DataFrame yoluyla okunur.
+    """
+    errors: List[str] = []
+    if _is_csv(path):
+        total, rows = _csv_rows(path)
+        return _student_records(rows, errors), errors, total, True
+    if streaming is None:
+        streaming = os.path.getsize(path) >= STREAMING_MIN_BYTES
+    if streaming:
+        total, rows = _xlsx_rows(path)
+        return _student_records(rows, errors), errors, (total - 1 if total else None), True
+
+    rows, errors, row_count = _student_rows(path)
+    return iter(rows), errors, row_count, False
+
+def _sync_students(cur, department_id: int, records: Iterator[tuple], digest: str,
+                   errors: List[str], total: Optional[int] = None,
+                   progress: Optional[ProgressCallback] = None, force: bool = False,
+                   cancel: Optional[threading.Event] = None, preload: bool = True) -> ImportResult:
+    """
+    Öğrenci satırlarını önceki içe aktarıma (import_log) göre fark olarak uygular:
+      - satırlar STREAM_BATCH_SIZE'lık partilerle temp.import_seen'e yüklenir
+        (aynı öğrenci+ders tekrarında ilk satır geçerli)
+      - yalnızca yeni/değişen satırlar _StudentWriter ile yazılır (force ise hepsi);
+        preload=False (akış modu) iken anahtarlar her partide ayrı sorgulanır
+      - önceki dosyada olup yenisinde olmayan (öğrenci, ders) kayıtları silinir
+    Geçerli satır yoksa hiçbir şey silinmez. Transaction çağırana aittir;
+    cancel her partide kontrol edilir (ImportCancelled → çağıran geri alır).
+    temp.import_seen dosya boyutuyla büyür; bağlantı bulk_transaction(temp_in_memory=False) ile açılmalı.
+    """
+    log_id, _ = import_log.get_log(cur, department_id, KIND_STUDENTS)
+    import_log.begin_rows(cur)
+
+    batch: list[tuple] = []
+    with import_profile.stage("staging"):
+        for rec in records:
+            batch.append(rec)
+            if len(batch) >= STREAM_BATCH_SIZE:
+                _check_cancel(cancel)
+                import_log.add_rows(cur, batch)
+                if progress:
+                    progress(STAGE_NORMALISE, rec[0] - 1, total)
+                batch = []
+        if batch:
+            import_log.add_rows(cur, batch)
+
+    row_count = import_log.seen_count(cur)
+    import_profile.add_rows("staging", row_count)
+    import_profile.note_rows_read(total if total is not None else row_count)
+    if progress:
+        progress(STAGE_NORMALISE, total or row_count, total or row_count)
+    if row_count == 0:
+        return ImportResult(0, 0, errors)
+
+    _check_cancel(cancel)
+    base_log = None if force else log_id
+    to_write = import_log.changed_count(cur, base_log) if progress else None
+    with import_profile.stage("write"):
+        writer = _StudentWriter(cur, department_id, errors, preload=preload)
+        changed = 0
+        reader = import_log.changed_rows(cur.connection.cursor(), base_log)
+        while True:
+            part = reader.fetchmany(STREAM_BATCH_SIZE)
+            if not part:
+                break
+            writer.write(part)
+            changed += len(part)
+            _check_cancel(cancel)
+            if progress:
+                progress(STAGE_WRITE, changed, to_write)
+        writer.flush()
+
+        removed = 0
+        if log_id is not None:
+            gone = [(sno, writer.course_id_by_code[ccode])
+                    for sno, ccode in import_log.removed_keys(cur, log_id)
+                    if ccode in writer.course_id_by_code]
+            if gone:
+                cur.executemany("""DELETE FROM enrollments
+                                   WHERE course_id=?
+                                     AND student_id IN (SELECT id FROM students
+                                                        WHERE department_id=? AND student_no=?)""",
+                                [(cid, department_id, sno) for sno, cid in gone])
+                removed = max(cur.rowcount, 0)  # tetikleyicilerin değişiklikleri sayılmaz
+            if removed:
+                writer.touched_courses.update(cid for _, cid in gone)
+    import_profile.add_rows("write", changed)
+    with import_profile.stage("conflicts", len(writer.touched_courses)):
+        writer.finish()
+
+    with import_profile.stage("write"):
+        import_log.forget_rows(cur, writer.failed)
+        log_id = import_log.save_log(cur, department_id, KIND_STUDENTS,
+                                     "" if writer.failed else digest, row_count)
+        import_log.save_rows(cur, log_id)
+    _check_cancel(cancel)
+    if progress:
+        progress(STAGE_WRITE, changed, changed)
+
+    return ImportResult(writer.inserted, writer.updated, errors,
+                        removed=removed, unchanged=row_count - changed)
+
+
+def import_students(xlsx_path: str, department_id: int,
+                    progress: Optional[ProgressCallback] = None,
+                    streaming: Optional[bool] = None,
+                    force: bool = False,
+                    cancel: Optional[threading.Event] = None,
+                    profile: bool = False) -> ImportResult:
+    """
+    Öğrenci-ders listesini içe aktarır (bkz. _student_source, _sync_students).
+    Aynı dosya daha önce içe aktarıldıysa force verilmedikçe hemen döner;
+    değişen dosyada yalnızca eklenen/değişen/çıkarılan satırlar uygulanır.
+    Tümü tek transaction'dadır: hata ya da iptal (ImportCancelled) durumunda hiçbir şey yazılmaz.
+    Akış modunda okuma ile normalizasyon birlikte yürür ve STAGE_NORMALISE olarak bildirilir
+    (profilde "staging" aşamasına düşer).
+    """
+    with import_profile.profiling(xlsx_path, KIND_STUDENTS, department_id, profile) as prof:
+        res = _import_students(xlsx_path, department_id, progress, streaming, force, cancel)
+    res.profile = prof
+    return res
+
+def _import_students(xlsx_path: str, department_id: int,
+                     progress: Optional[ProgressCallback],
+                     streaming: Optional[bool],
+                     force: bool,
+                     cancel: Optional[threading.Event]) -> ImportResult:
+    ensure_classrooms_ready( department_id)
+    digest = import_log.file_digest(xlsx_path)
+    if not force and import_log.is_unchanged(department_id, KIND_STUDENTS, digest):
+        return ImportResult(0, 0, [], skipped=True)
+
+    if progress:
+        progress(STAGE_PARSE, 0, None)
+    records, errors, total, streamed = _student_source(xlsx_path, streaming)
+    _check_cancel(cancel)
+    # Satırlar zaten bellekteyse (DataFrame yolu) öğrenci/kayıt anahtarları tek seferde yüklenir;
+    # akış modunda parti parti sorgulanır ki bellek dosya boyutuyla büyümesin.
+    with import_profile.transaction_timer(), bulk_transaction(temp_in_memory=False) as con:
+        import_profile.trace_statements(con)
+        res = _sync_students(con.cursor(), department_id, records, digest, errors, total,
+                             progress, force, cancel, preload=not streamed)
+
+    return _maybe_run_maintenance(res, res.inserted + res.updated + res.removed)
@@ -52,9 +52,8 @@ def fetch_courses_with_counts(department_id: int | None = None,
                               include_ids: Optional[Iterable[int]] = None) -> List[dict]:
     con = get_conn(); cur = con.cursor()
     base = """
-        SELECT c.id, c.code, c.name, COUNT(e.student_id) AS student_count
+        SELECT c.id, c.code, c.name, c.student_count
         FROM courses c
-        LEFT JOIN enrollments e ON e.course_id = c.id
     """
     conds = []
     params: List[object] = []
@@ -65,24 +64,22 @@ def fetch_courses_with_counts(department_id: int | None = None,
         conds.append(f"c.id IN ({placeholders})")
         params.extend(list(include_ids))
     where = (" WHERE " + " AND ".join(conds)) if conds else ""
-    q = base + where + " GROUP BY c.id"
+    q = base + where
     cur.execute(q, params)
     rows = cur.fetchall(); con.close()
     return rows
 
 def fetch_conflicts(course_ids: List[int]) -> Dict[int, set]:
-    """Aynı öğrenciyi paylaşan dersleri bulur (çakışma grafı)."""
+    """Aynı öğrenciyi paylaşan dersleri bulur (çakışma grafı, course_conflicts tablosundan)."""
     if not course_ids:
         return {}
     con = get_conn(); cur = con.cursor()
     ph = ",".join("?" * len(course_ids))
     q = f"""
-        SELECT e1.course_id AS c1, e2.course_id AS c2
-        FROM enrollments e1
-        JOIN enrollments e2 ON e1.student_id = e2.student_id
-        WHERE e1.course_id != e2.course_id
-          AND e1.course_id IN ({ph})
-          AND e2.course_id IN ({ph})
+        SELECT c1, c2
+        FROM course_conflicts
+        WHERE c1 IN ({ph})
+          AND c2 IN ({ph})
     """
     cur.execute(q, course_ids + course_ids)
     adj = {cid: set() for cid in course_ids}
@@ -91,6 +88,47 @@ def fetch_conflicts(course_ids: List[int]) -> Dict[int, set]:
     con.close()
     return adj
 
+def refresh_course_conflicts(cur, course_ids: Optional[Iterable[int]] = None) -> None:
+    """
+    course_conflicts tablosunu enrollments'a göre günceller.
+    - course_ids verilirse yalnızca bu dersleri içeren çiftler yeniden hesaplanır
+    - None ise tablo baştan kurulur
+    Commit çağıranın sorumluluğundadır.
+    """
+    if course_ids is None:
+        cur.execute("DELETE FROM course_conflicts")
+        cur.execute("""
+            INSERT INTO course_conflicts(c1, c2, shared_students)
+            SELECT e1.course_id, e2.course_id, COUNT(*)
+            FROM enrollments e1
+            JOIN enrollments e2 ON e2.student_id = e1.student_id
+            WHERE e1.course_id != e2.course_id
+            GROUP BY e1.course_id, e2.course_id
+        """)
+        return
+
+    ids = [int(x) for x in course_ids]
+    if not ids:
+        return
+    ph = ",".join("?" * len(ids))
+    cur.execute(f"DELETE FROM course_conflicts WHERE c1 IN ({ph}) OR c2 IN ({ph})", ids + ids)
+    cur.execute(f"""
+        INSERT OR REPLACE INTO course_conflicts(c1, c2, shared_students)
+        SELECT e1.course_id, e2.course_id, COUNT(*)
+        FROM enrollments e1
+        JOIN enrollments e2 ON e2.student_id = e1.student_id
+        WHERE e1.course_id != e2.course_id
+          AND e1.course_id IN ({ph})
+        GROUP BY e1.course_id, e2.course_id
+    """, ids)
+    # çift yönlü tutulur: (c2, c1) satırları da eklenir
+    cur.execute(f"""
+        INSERT OR REPLACE INTO course_conflicts(c1, c2, shared_students)
+        SELECT c2, c1, shared_students
+        FROM course_conflicts
+        WHERE c1 IN ({ph})
+    """, ids)
+
 def fetch_rooms(department_id: int | None = None, room_ids: Optional[Iterable[int]] = None) -> List[dict]:
     con = get_conn(); cur = con.cursor()
     base = "SELECT id, code, name, capacity FROM rooms"
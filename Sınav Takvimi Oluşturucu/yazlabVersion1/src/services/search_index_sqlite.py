@@ -0,0 +1,131 @@
+# src/services/search_index_sqlite.py
+"""
+Öğrenci, ders ve derslikler için birleşik tam metin araması (SQLite FTS5).
+search_index tablosu init_db'de kurulur ve students/courses/rooms tetikleyicileriyle güncel tutulur.
+
+- rowid = kaynak id * 4 + tür (1 öğrenci, 2 ders, 3 derslik); tür ve id rowid'den çözülür,
+  tetikleyiciler satırı rowid ile bulur. Tür ayrıca dizinli 'kind' sütunundadır; türe göre süzme
+  eşleşmelerin tümünü gezmek yerine dizin üzerinde yapılır.
+- code/name sütunları katlanmış metindir: unicode61 (remove_diacritics 2) büyük/küçük harfi ve
+  aksanları katlar (Ö->o, Ş->s, İ->i); katlayamadığı noktasız ı ayrıca i'ye çevrilir.
+  Böylece "isik", "IŞIK" ve "ışık" aynı kaydı bulur. code_raw/name_raw görüntüleme içindir.
+- Sorgudaki her kelime önek olarak aranır (prefix='1 2 3' önek dizinleri); yazarken arama için.
+  Varsayılan sıra rowid'dir: FTS5 eşleşmeleri bu sırada ürettiği için LIMIT'e ulaşınca durur.
+  bm25 sıralaması (ranked=True) tüm eşleşmeleri puanlar; çok genel öneklerde onlarca ms sürer.
+- unicode61 'BLM101', 'R3' gibi kodları tek kelime sayar; "101" önek olarak bunları bulmaz.
+  search_ids(code_contains=True) kodun içinde geçen metni ayrıca arar (ders/derslik gibi küçük
+  türler için; o türün kodları taranır).
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Iterable, List, Optional
+import re
+
+from src.db.sqlite import get_conn
+from src.services.text_norm import normalize_text
+
+KIND_CODES = {"student": 1, "course": 2, "room": 3}
+KIND_NAMES = {v: k for k, v in KIND_CODES.items()}
+
+# (tablo, tür kodu, kod sütunu, ad sütunu)
+SEARCH_SOURCES = [
+    ("students", KIND_CODES["student"], "student_no", "full_name"),
+    ("courses",  KIND_CODES["course"],  "code",       "name"),
+    ("rooms",    KIND_CODES["room"],    "code",       "name"),
+]
+
+_TOKEN_RE = re.compile(r"\w+")
+
+@dataclass
+class SearchHit:
+    kind: str              # 'student' | 'course' | 'room'
+    id: int
+    code: str
+    name: str
+    department_id: Optional[int]
+
+def fold_sql(expr: str) -> str:
+    """Dizine yazılan metnin SQL tarafındaki katlaması (tetikleyiciler ve yeniden kurulum ortak)."""
+    return f"replace({expr}, 'ı', 'i')"
+
+def fold_search_text(text) -> str:
+    """Sorgu metnini dizindeki katlamayla uyumlu hale getirir (ı/İ -> i; gerisini unicode61 katlar)."""
+    return normalize_text(text).replace("ı", "i").replace("İ", "i")
+
+def build_match(query, kinds: Optional[Iterable[str]] = None) -> Optional[str]:
+    """
+    'blm 10' -> '{code name} : ("blm"* AND "10"*)' (tüm kelimeler, önek olarak, kod ya da adda);
+    kinds verilirse '... AND kind : (course OR room)'. Aranacak kelime yoksa None.
+    """
+    tokens = _TOKEN_RE.findall(fold_search_text(query))
+    if not tokens:
+        return None
+    match = "{code name} : (" + " AND ".join(f'"{t}"*' for t in tokens) + ")"
+    if kinds:
+        match += " AND kind : (" + " OR ".join(KIND_NAMES[KIND_CODES[k]] for k in kinds) + ")"
+    return match
+
+def rebuild_search_index(cur) -> None:
+    """Dizini kaynak tablolardan baştan doldurur (kurulum/şema yükseltme). Transaction çağırana aittir."""
+    cur.execute("DELETE FROM search_index")
+    for table, kind, code, name in SEARCH_SOURCES:
+        cur.execute(f"""
+            INSERT INTO search_index(rowid, kind, code, name, code_raw, name_raw, department_id)
+            SELECT id * 4 + {kind}, '{KIND_NAMES[kind]}', {fold_sql(code)}, {fold_sql(name)},
+                   {code}, {name}, department_id
+            FROM {table}
+        """)
+    cur.execute("INSERT INTO search_index(search_index) VALUES('optimize')")
+
+def search(query: str, kinds: Optional[Iterable[str]] = None, department_id: Optional[int] = None,
+           limit: int = 20, ranked: bool = False) -> List[SearchHit]:
+    """
+    Yazarken arama: her kelime kod ya da adda önek olarak geçen kayıtlar.
+    kinds ile tür ('student', 'course', 'room'), department_id ile bölüm sınırlanabilir.
+    ranked=True: bm25 sırası (daha yavaş); aksi halde kayıt sırası.
+    """
+    match = build_match(query, kinds)
+    if match is None:
+        return []
+    sql = ["SELECT rowid, code_raw, name_raw, department_id FROM search_index WHERE search_index MATCH ?"]
+    params: list = [match]
+    if department_id:
+        sql.append("AND department_id = ?")
+        params.append(department_id)
+    sql.append("ORDER BY rank LIMIT ?" if ranked else "LIMIT ?")
+    params.append(limit)
+
+    con = get_conn(); cur = con.cursor()
+    cur.execute(" ".join(sql), params)
+    hits = [SearchHit(KIND_NAMES[r[0] % 4], r[0] // 4, r[1], r[2], r[3]) for r in cur.fetchall()]
+    con.close()
+    return hits
+
+def _kind_rows(cur, match: str, department_id: Optional[int], columns: str = "rowid"):
+    sql = f"SELECT {columns} FROM search_index WHERE search_index MATCH ?"
+    params: list = [match]
+    if department_id:
+        sql += " AND department_id = ?"
+        params.append(department_id)
+    cur.execute(sql, params)
+    return cur.fetchall()
+
+def search_ids(query: str, kind: str, department_id: Optional[int] = None,
+               code_contains: bool = False) -> List[int]:
+    """
+    Eşleşen tüm kayıtların id'leri (ör. bir listeyi süzmek için); sıralama yok.
+    code_contains=True: kodunun içinde sorgu metni geçen kayıtlar da eklenir ("101" -> BLM101).
+    """
+    match = build_match(query, [kind])
+    if match is None:
+        return []
+    con = get_conn(); cur = con.cursor()
+    ids = [r[0] // 4 for r in _kind_rows(cur, match, department_id)]
+    if code_contains:
+        key = fold_search_text(query).lower()
+        seen = set(ids)
+        for rowid, code in _kind_rows(cur, f"kind : {kind}", department_id, "rowid, code_raw"):
+            if rowid // 4 not in seen and key in fold_search_text(code).lower():
+                ids.append(rowid // 4)
+    con.close()
+    return ids
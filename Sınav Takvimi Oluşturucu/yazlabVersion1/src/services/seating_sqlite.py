@@ -1,17 +1,20 @@
 # src/services/seating_sqlite.py
 from __future__ import annotations
-from typing import List, Dict, Tuple
+from typing import List, Dict, FrozenSet, Optional, Tuple
 from dataclasses import dataclass
-from src.db.sqlite import get_conn
+from array import array
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+from itertools import groupby
+from src.config import PROJECT_ROOT
+from src.db.sqlite import get_conn, bulk_transaction
 from types import SimpleNamespace
 import csv
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.units import mm
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
 import os
 import sqlite3
+
+# Bir oturumdaki toplam öğrenci sayısı bunun üzerindeyse yerleşimler süreç havuzunda hesaplanır.
+PARALLEL_MIN_STUDENTS = 50_000
 @dataclass
 class RoomInfo:
     id: int
@@ -33,10 +36,76 @@ def _allowed_positions(group_size: int, row: int, col: int) -> list[int]:
         return [0, 2]
     return [0, 3]
 
-def _effective_capacity(rows: int, cols: int, group_size: int) -> int:
-    """Görsel kurala göre gerçek oturabilecek kişi sayısı."""
-    per_group = 1 if group_size <= 2 else 2
-    return rows * cols * per_group
+# Çizimde izinli alt hücre boş olanın iki katı genişliktedir.
+WEIGHT_ALLOWED = 2.0
+WEIGHT_EMPTY = 1.0
+
+@dataclass(frozen=True, eq=False)
+class SeatTemplate:
+    """
+    Bir derslik düzeninin (rows, cols, group_size) önceden hesaplanmış koltuk geometrisi.
+    seat_row / seat_col / seat_pos: yerleşim sırasındaki kullanılabilir koltuklar (sıra ve
+    sütun 1 tabanlı); bir sınavın yerleşimi bu dizilerin baştan bir dilimidir.
+    cell_kind: hücre başına (satır öncelikli) desen numarası; patterns / fractions desen
+    başına izinli pozisyonlar ve alt hücre genişlik oranları (yalnızca 1-2 farklı desen olur).
+    """
+    rows: int
+    cols: int
+    group_size: int
+    seat_row: array
+    seat_col: array
+    seat_pos: array
+    cell_kind: bytes
+    patterns: Tuple[FrozenSet[int], ...]
+    fractions: Tuple[Tuple[float, ...], ...]
+
+    @property
+    def capacity(self) -> int:
+        return len(self.seat_row)
+
+    def kind(self, row: int, col: int) -> int:
+        return self.cell_kind[(row - 1) * self.cols + (col - 1)]
+
+    def cell_layouts(self, cell_w: float, sub_gap: float) -> Tuple[Tuple[Tuple[int, float, float, bool], ...], ...]:
+        """
+        Desen başına alt hücreler: (pos, hücre solundan uzaklık, genişlik, izinli mi).
+        Çizimde hücre için layouts[template.kind(row, col)] kullanılır.
+        """
+        out = []
+        inner_w = cell_w - (self.group_size - 1) * sub_gap
+        for allowed, fracs in zip(self.patterns, self.fractions):
+            cells, x = [], 0.0
+            for pos, f in enumerate(fracs):
+                w = inner_w * f
+                cells.append((pos, x, w, pos in allowed))
+                x += w + sub_gap
+            out.append(tuple(cells))
+        return tuple(out)
+
+@lru_cache(maxsize=256)
+def seat_template(rows: int, cols: int, group_size: int) -> SeatTemplate:
+    """Düzen başına bir kez hesaplanır; aynı düzendeki tüm derslik ve sınavlar paylaşır."""
+    rows, cols, group_size = max(rows, 0), max(cols, 0), max(group_size, 1)
+    pattern_ids: Dict[Tuple[int, ...], int] = {}
+    patterns, fractions = [], []
+    seat_row, seat_col, seat_pos = array("H"), array("H"), array("H")
+    kinds = bytearray()
+    for r in range(1, rows + 1):
+        for c in range(1, cols + 1):
+            allowed = _allowed_positions(group_size, r, c)
+            key = tuple(allowed)
+            k = pattern_ids.get(key)
+            if k is None:
+                k = pattern_ids[key] = len(patterns)
+                weights = [WEIGHT_ALLOWED if pos in allowed else WEIGHT_EMPTY for pos in range(group_size)]
+                total = sum(weights)
+                patterns.append(frozenset(allowed))
+                fractions.append(tuple(w / total for w in weights))
+            kinds.append(k)
+            for pos in allowed:
+                seat_row.append(r); seat_col.append(c); seat_pos.append(pos)
+    return SeatTemplate(rows, cols, group_size, seat_row, seat_col, seat_pos,
+                        bytes(kinds), tuple(patterns), tuple(fractions))
 
 
 
@@ -72,10 +141,21 @@ def list_exams_with_rooms(department_id: int | None = None, exam_type: str | Non
     con.close()
     return rows
 
+def _room_from_row(r) -> SimpleNamespace:
+    return SimpleNamespace(
+        id = r["id"],
+        code = r["code"],
+        name = r["name"],
+        rows = int(r["rows"] or 0),
+        cols = int(r["cols"] or 0),
+        group_size = int(r["group_size"] or 2),
+        capacity = int(r["capacity"] or 0),
+    )
+
 def get_exam_rooms(exam_id: int):
     con = get_conn(); cur = con.cursor()
     cur.execute("""
-        SELECT r.code, r.name, r.rows, r.cols, r.group_size, r.capacity
+        SELECT r.id, r.code, r.name, r.rows, r.cols, r.group_size, r.capacity
         FROM exam_rooms er
         JOIN rooms r ON r.id = er.room_id
         WHERE er.exam_id = ?
@@ -84,17 +164,7 @@ def get_exam_rooms(exam_id: int):
     rows = cur.fetchall()
     con.close()
 
-    return [
-        SimpleNamespace(
-            code = r["code"],
-            name = r["name"],                 
-            rows = int(r["rows"] or 0),
-            cols = int(r["cols"] or 0),
-            group_size = int(r["group_size"] or 2),
-            capacity = int(r["capacity"] or 0),
-        )
-        for r in rows
-    ]
+    return [_room_from_row(r) for r in rows]
 
 def get_exam_students(exam_id: int) -> List[dict]:
     """
@@ -110,15 +180,17 @@ def get_exam_students(exam_id: int) -> List[dict]:
         JOIN enrollments e ON e.course_id = c.id
         JOIN students s ON s.id = e.student_id
         WHERE ex.id = ?
-        ORDER BY s.student_no
+        ORDER BY s.student_no, s.id
     """, (exam_id,))
     rows = cur.fetchall()
     con.close()
     return rows
 
 def build_seating(exam_id: int) -> Tuple[List[dict], List[str]]:
-    rooms = get_exam_rooms(exam_id)
-    students = get_exam_students(exam_id)
+    return _place_students(get_exam_rooms(exam_id), get_exam_students(exam_id))
+
+def _place_students(rooms, students) -> Tuple[List[dict], List[str]]:
+    """Öğrencileri (student_no sırasıyla) odalara sırayla yerleştirir; (yerleşimler, uyarılar)."""
     warnings: List[str] = []
 
     if not rooms:
@@ -134,37 +206,211 @@ def build_seating(exam_id: int) -> Tuple[List[dict], List[str]]:
             warnings.append(f"{room.code} için rows/cols tanımlı değil; atlanıyor.")
             continue
 
-        cap = _effective_capacity(room.rows, room.cols, room.group_size)
-        take = min(cap, len(students) - idx)
-
-        placed_in_room = 0 
-
-        for r in range(1, room.rows + 1):
-            if placed_in_room >= take:
-                break
-            for c in range(1, room.cols + 1):
-                if placed_in_room >= take:
-                    break
-                for pos in _allowed_positions(room.group_size, r, c):
-                    if placed_in_room >= take or idx >= len(students):
-                        break
-                    st = students[idx]; idx += 1
-                    placements.append({
-                        "room_code": room.code,
-                        "row": r,
-                        "col": c,
-                        "pos": pos,
-                        "student_no": st["student_no"],
-                        "full_name": st["full_name"],
-                    })
-                    placed_in_room += 1  
+        tpl = seat_template(room.rows, room.cols, room.group_size)
+        take = min(tpl.capacity, len(students) - idx)
+        if take <= 0:
+            continue
 
+        # koltuklar şablonun ilk `take` elemanı
+        for r, c, pos, st in zip(tpl.seat_row, tpl.seat_col, tpl.seat_pos, students[idx:idx + take]):
+            placements.append({
+                "room_id": room.id,
+                "room_code": room.code,
+                "row": r,
+                "col": c,
+                "pos": pos,
+                "student_id": st["student_id"],
+                "student_no": st["student_no"],
+                "full_name": st["full_name"],
+            })
+        idx += take
 
     if idx < len(students):
         warnings.append(f"{len(students)-idx} öğrenci yerleştirilemedi (kapasite yetersiz).")
     return placements, warnings
 
 
+# --- Bir sınav türünün tüm sınavları (toplu) ---
+
+@dataclass
+class ExamSeating:
+    exam_id: int
+    date: str
+    start_time: str
+    course_code: str
+    course_name: str
+    rooms: List[SimpleNamespace]     # get_exam_rooms ile aynı alanlar
+    placements: List[dict]
+    warnings: List[str]
+
+def _exam_filter(exam_type: Optional[str], department_id: Optional[int]) -> Tuple[str, list]:
+    where, params = [], []
+    if exam_type:
+        where.append("ex.exam_type = ?"); params.append(exam_type)
+    if department_id:
+        where.append("c.department_id = ?"); params.append(department_id)
+    return (("WHERE " + " AND ".join(where)) if where else ""), params
+
+def load_all_exam_rooms(exam_type: Optional[str], department_id: Optional[int] = None) -> Dict[int, dict]:
+    """
+    Tek sorguda tüm sınavların derslikleri (get_exam_rooms sırasıyla) ve sınav bilgisi:
+    exam_id -> {"date", "start_time", "course_code", "course_name", "rooms": [...]}
+    Dersliği atanmamış sınavlar dahil edilmez (list_exams_with_rooms gibi).
+    """
+    wh, params = _exam_filter(exam_type, department_id)
+    con = get_conn(); cur = con.cursor()
+    cur.execute(f"""
+        SELECT ex.id AS exam_id, ex.date, ex.start_time,
+               c.code AS course_code, c.name AS course_name,
+               r.id, r.code, r.name, r.rows, r.cols, r.group_size, r.capacity
+        FROM exams ex
+        JOIN courses c ON c.id = ex.course_id
+        JOIN exam_rooms er ON er.exam_id = ex.id
+        JOIN rooms r ON r.id = er.room_id
+        {wh}
+        ORDER BY ex.id, r.capacity DESC, r.code
+    """, params)
+    out: Dict[int, dict] = {}
+    for r in cur.fetchall():
+        ex = out.get(r["exam_id"])
+        if ex is None:
+            ex = out[r["exam_id"]] = {
+                "date": r["date"], "start_time": r["start_time"],
+                "course_code": r["course_code"], "course_name": r["course_name"],
+                "rooms": [],
+            }
+        ex["rooms"].append(_room_from_row(r))
+    con.close()
+    return out
+
+def load_all_exam_students(exam_type: Optional[str], department_id: Optional[int] = None) -> Dict[int, List[dict]]:
+    """Tek sorguda tüm sınavların öğrenci listeleri (get_exam_students sırasıyla): exam_id -> öğrenciler."""
+    wh, params = _exam_filter(exam_type, department_id)
+    con = get_conn(); cur = con.cursor()
+    cur.execute(f"""
+        SELECT ex.id AS exam_id, s.id AS student_id, s.student_no, s.full_name
+        FROM exams ex
+        JOIN courses c ON c.id = ex.course_id
+        JOIN enrollments e ON e.course_id = c.id
+        JOIN students s ON s.id = e.student_id
+        {wh}
+        ORDER BY ex.id, s.student_no, s.id
+    """, params)
+    # süreç havuzuna gönderilebilsin diye sqlite3.Row yerine düz sözlük
+    out = {
+        exam_id: [{"student_id": r[1], "student_no": r[2], "full_name": r[3]} for r in grp]
+        for exam_id, grp in groupby(cur, key=lambda r: r[0])
+    }
+    con.close()
+    return out
+
+def _place_many(jobs: List[Tuple[int, list, list]]) -> List[Tuple[int, List[dict], List[str]]]:
+    """Süreç havuzunda çalışır: [(exam_id, odalar, öğrenciler)] -> [(exam_id, yerleşimler, uyarılar)]."""
+    return [(exam_id, *_place_students(rooms, students)) for exam_id, rooms, students in jobs]
+
+def _split_jobs(jobs: list, parts: int) -> List[list]:
+    """İşleri öğrenci sayısına göre dengeli parçalara böler (en büyükten, en boş parçaya)."""
+    buckets: List[list] = [[] for _ in range(parts)]
+    loads = [0] * parts
+    for job in sorted(jobs, key=lambda j: len(j[2]), reverse=True):
+        i = loads.index(min(loads))
+        buckets[i].append(job)
+        loads[i] += len(job[2])
+    return [b for b in buckets if b]
+
+def build_all_seatings(exam_type: Optional[str], department_id: Optional[int] = None,
+                       max_workers: Optional[int] = None) -> List[ExamSeating]:
+    """
+    Bir sınav türündeki tüm sınavların oturma planlarını birlikte üretir.
+    Derslikler ve öğrenci listeleri iki küme sorgusuyla okunur; yerleşim kuralı
+    build_seating ile aynıdır. Toplam öğrenci PARALLEL_MIN_STUDENTS'i aşarsa
+    sınavlar süreç havuzunda paralel yerleştirilir. Tarih/saat/ders sırasıyla döner.
+    """
+    exams = load_all_exam_rooms(exam_type, department_id)
+    rosters = load_all_exam_students(exam_type, department_id)
+    jobs = [(exam_id, ex["rooms"], rosters.get(exam_id, [])) for exam_id, ex in exams.items()]
+
+    workers = max_workers or os.cpu_count() or 1
+    if workers > 1 and len(jobs) > 1 and sum(len(j[2]) for j in jobs) >= PARALLEL_MIN_STUDENTS:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            done = [r for part in pool.map(_place_many, _split_jobs(jobs, workers)) for r in part]
+    else:
+        done = _place_many(jobs)
+
+    out = [
+        ExamSeating(exam_id, exams[exam_id]["date"], exams[exam_id]["start_time"],
+                    exams[exam_id]["course_code"], exams[exam_id]["course_name"],
+                    exams[exam_id]["rooms"], placements, warnings)
+        for exam_id, placements, warnings in done
+    ]
+    out.sort(key=lambda s: (s.date, s.start_time, s.course_code))
+    return out
+
+
+# --- Kalıcı oturma planı (exam_seats) ---
+# Plan oluşturulunca yazılır; arayüz ve dışa aktarımlar buradan okur. Sınav silinince
+# (yeniden planlama) koltuklar da silinir; kayıtlar değişirse plan yeniden oluşturulmalıdır.
+
+def _write_seats(con, exam_id: int, placements: List[dict]) -> int:
+    con.execute("DELETE FROM exam_seats WHERE exam_id = ?", (exam_id,))
+    con.executemany(
+        "INSERT INTO exam_seats(exam_id, room_id, row, col, pos, student_id) VALUES(?,?,?,?,?,?)",
+        [(exam_id, p["room_id"], p["row"], p["col"], p["pos"], p["student_id"]) for p in placements],
+    )
+    return len(placements)
+
+def save_seating(exam_id: int, placements: List[dict]) -> int:
+    """Sınavın oturma planını (öncekinin yerine) kaydeder; yazılan koltuk sayısını döner."""
+    with bulk_transaction() as con:
+        return _write_seats(con, exam_id, placements)
+
+def save_all_seatings(seatings: List[ExamSeating]) -> int:
+    """build_all_seatings sonucunu tek transaction'da kaydeder."""
+    with bulk_transaction() as con:
+        return sum(_write_seats(con, es.exam_id, es.placements) for es in seatings)
+
+def load_seating(exam_id: int) -> List[dict]:
+    """Kayıtlı planı build_seating ile aynı biçim ve sırada döner; plan yoksa boş liste."""
+    con = get_conn(); cur = con.cursor()
+    cur.execute("""
+        SELECT r.id AS room_id, r.code AS room_code, es.row, es.col, es.pos,
+               s.id AS student_id, s.student_no, s.full_name
+        FROM exam_seats es
+        JOIN rooms r    ON r.id = es.room_id
+        JOIN students s ON s.id = es.student_id
+        WHERE es.exam_id = ?
+        ORDER BY r.capacity DESC, r.code, es.row, es.col, es.pos
+    """, (exam_id,))
+    rows = [dict(r) for r in cur.fetchall()]
+    con.close()
+    return rows
+
+def find_student_seats(student_no: str, department_id: Optional[int] = None,
+                       exam_type: Optional[str] = None) -> List[sqlite3.Row]:
+    """Öğrencinin kayıtlı sınav yerleri (tarih/saat sırasıyla): ders, derslik, sıra/sütun/pozisyon."""
+    where, params = ["s.student_no = ?"], [student_no]
+    if department_id:
+        where.append("s.department_id = ?"); params.append(department_id)
+    if exam_type:
+        where.append("ex.exam_type = ?"); params.append(exam_type)
+    con = get_conn(); cur = con.cursor()
+    cur.execute(f"""
+        SELECT ex.id AS exam_id, ex.exam_type, ex.date, ex.start_time, ex.duration_min,
+               c.code AS course_code, c.name AS course_name,
+               r.code AS room_code, r.name AS room_name, es.row, es.col, es.pos
+        FROM students s
+        JOIN exam_seats es ON es.student_id = s.id
+        JOIN exams ex      ON ex.id = es.exam_id
+        JOIN courses c     ON c.id = ex.course_id
+        JOIN rooms r       ON r.id = es.room_id
+        WHERE {" AND ".join(where)}
+        ORDER BY ex.date, ex.start_time, c.code
+    """, params)
+    rows = cur.fetchall()
+    con.close()
+    return rows
+
+
 
 def export_seating_csv(placements: List[dict], path: str) -> str:
     """
@@ -177,23 +423,57 @@ def export_seating_csv(placements: List[dict], path: str) -> str:
             w.writerow([p["room_code"], p["row"], p["col"], p["student_no"], p["full_name"]])
     return path
 
+@lru_cache(maxsize=1)
 def _try_register_turkish_font():
+    """TTF'yi süreç başına bir kez yükler (ayrıştırması pahalı); sonraki çağrılar kayıtlı adı döner."""
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFont
     candidates = [
-        os.path.join("assets", "fonts", "DejaVuSans.ttf"),
+        PROJECT_ROOT / "assets" / "fonts" / "DejaVuSans.ttf",
         "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
         "DejaVuSans.ttf",
     ]
     for p in candidates:
         if os.path.exists(p):
             try:
-                pdfmetrics.registerFont(TTFont("TR_FONT", p))
+                pdfmetrics.registerFont(TTFont("TR_FONT", str(p)))
                 return "TR_FONT"
             except Exception:
                 pass
     return "Helvetica" 
 
-def export_seating_pdf(exam_id: int, placements: List[dict], path: str) -> str:
-    """Yerleşimi PDF'e yazar. Oda başına 1 sayfa; sadece büyük grid ve numaralar."""
+def _draw_grid_form(c, name: str, font_name: str, tpl: SeatTemplate, layouts,
+                    gx: float, gy: float, cell_w: float, cell_h: float, gap: float) -> None:
+    """
+    Düzenin sabit kısmını (eksen numaraları, hücre çerçeveleri, alt hücre dolguları) bir
+    PDF form nesnesi olarak bir kez çizer; aynı düzendeki sayfalar doForm ile yeniden kullanır.
+    """
+    from reportlab.lib.units import mm
+    grid_h = tpl.rows*cell_h + (tpl.rows-1)*gap
+
+    c.beginForm(name)
+    c.setFont(font_name, 9)
+    for ccx in range(1, tpl.cols+1):
+        cx = gx + (ccx-1)*(cell_w+gap) + cell_w/2
+        c.drawCentredString(cx, gy + grid_h + 4*mm, str(ccx))
+    for rrx in range(1, tpl.rows+1):
+        cy = gy + grid_h - (rrx-1)*(cell_h+gap) - cell_h/2
+        c.drawString(gx - 6*mm, cy-3, str(rrx))
+
+    c.setLineWidth(1.2)
+    for rr in range(1, tpl.rows+1):
+        for cc in range(1, tpl.cols+1):
+            x = gx + (cc-1)*(cell_w+gap)
+            yy = gy + grid_h - rr*(cell_h+gap) + gap
+
+            c.rect(x, yy, cell_w, cell_h)
+            for _pos, off, w, allowed in layouts[tpl.kind(rr, cc)]:
+                c.setFillGray(0.92 if allowed else 1.0)
+                c.rect(x + off, yy, w, cell_h, fill=1)
+    c.endForm()
+
+def _exam_pdf_info(exam_id: int):
+    """PDF başlığı için sınav bilgisi ve sınavın derslik düzenleri (kod -> ad/rows/cols/group_size)."""
     con = get_conn(); cur = con.cursor()
     cur.execute("""
         SELECT ex.date, ex.start_time, c.code AS course_code, c.name AS course_name, ex.duration_min
@@ -201,11 +481,10 @@ def export_seating_pdf(exam_id: int, placements: List[dict], path: str) -> str:
         WHERE ex.id=?
     """, (exam_id,))
     ex = cur.fetchone()
-    con.close()
     if not ex:
+        con.close()
         raise RuntimeError("Sınav bulunamadı.")
 
-    con = get_conn(); cur = con.cursor()
     cur.execute("""
         SELECT r.code, r.name, r.rows, r.cols, r.group_size
         FROM exam_rooms er
@@ -223,20 +502,30 @@ def export_seating_pdf(exam_id: int, placements: List[dict], path: str) -> str:
         for r in cur.fetchall()
     }
     con.close()
+    return ex, room_layout
+
+def _draw_exam_pages(c, font_name: str, forms: set, ex, room_layout: Dict[str, dict],
+                     placements: List[dict]) -> int:
+    """
+    Bir sınavın oda sayfalarını verilen canvas'a ekler; eklenen sayfa sayısını döner.
+    forms: bu canvas'ta çizilmiş ızgara formları (aynı belgedeki sınavlar paylaşır).
+    """
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.units import mm
 
     rooms: Dict[str, List[dict]] = {}
     for p in placements:
         rooms.setdefault(p["room_code"], []).append(p)
-    for k in rooms:
-        rooms[k].sort(key=lambda x: (x["row"], x["col"], int(x.get("pos", 0))))
 
-    font_name = _try_register_turkish_font()
-
-    c = canvas.Canvas(path, pagesize=A4)
     W, H = A4
     left = 18*mm; right = 18*mm; top = 18*mm; bottom = 18*mm
     usable_w = W - left - right
 
+    base_cell_w = 60*mm
+    base_cell_h = 18*mm
+    gap = 3*mm
+    sub_gap = 0.1*mm
+
     for room_code, plist in rooms.items():
         info = room_layout.get(room_code, {"name":"", "rows":0, "cols":0, "group_size":2})
         room_name = info["name"] or ""
@@ -259,64 +548,55 @@ def export_seating_pdf(exam_id: int, placements: List[dict], path: str) -> str:
         c.drawString(left, y, f"Ders: {ex['course_code']} - {ex['course_name']}")
         y -= 14
 
-        base_cell_w = 60*mm
-        base_cell_h = 18*mm
-        gap = 3*mm
-        sub_gap = 0.1*mm
-
         grid_w = room_cols*base_cell_w + (room_cols-1)*gap
         grid_h = room_rows*base_cell_h + (room_rows-1)*gap
 
         gx = left + (usable_w - grid_w) / 2.0
         gy = y - grid_h - 8*mm
 
-        by_cell: Dict[Tuple[int,int], Dict[int,str]] = {}
+        tpl = seat_template(room_rows, room_cols, gsize)
+        layouts = tpl.cell_layouts(base_cell_w, sub_gap)
+        form = f"grid_{room_rows}x{room_cols}_{tpl.group_size}"
+        if form not in forms:
+            _draw_grid_form(c, form, font_name, tpl, layouts, gx, gy, base_cell_w, base_cell_h, gap)
+            forms.add(form)
+        c.doForm(form)
+
+        # sayfaya özgü kısım: yalnızca öğrenci numaraları
+        c.setFillGray(0)
+        c.setFont(font_name, 8)
         for p in plist:
             rr, cc, pos = int(p["row"]), int(p["col"]), int(p.get("pos", 0))
-            by_cell.setdefault((rr, cc), {})[pos] = str(p["student_no"])
-
-        c.setFont(font_name, 9)
-        for ccx in range(1, room_cols+1):
-            cx = gx + (ccx-1)*(base_cell_w+gap) + base_cell_w/2
-            c.drawCentredString(cx, gy + grid_h + 4*mm, str(ccx))
-        for rrx in range(1, room_rows+1):
-            cy = gy + grid_h - (rrx-1)*(base_cell_h+gap) - base_cell_h/2
-            c.drawString(gx - 6*mm, cy-3, str(rrx))
-
-        c.setLineWidth(1.2)
-        weight_allow = 2.0   
-        weight_empty = 1.0   
-
-        for rr in range(1, room_rows+1):
-            for cc in range(1, room_cols+1):
-                x = gx + (cc-1)*(base_cell_w+gap)
-                yy = gy + grid_h - rr*(base_cell_h+gap) + gap
-
-                c.rect(x, yy, base_cell_w, base_cell_h)
-
-                allowed = _allowed_positions(gsize, rr, cc)
-                weights = [(weight_allow if pos in allowed else weight_empty) for pos in range(gsize)]
-                total_gaps = (gsize - 1) * sub_gap
-                unit_w = (base_cell_w - total_gaps) / sum(weights)
-                widths = [unit_w * w for w in weights]
-
-                sx = x
-                for pos, w in enumerate(widths):
-                    c.setFillGray(0.92 if pos in allowed else 1.0)
-                    c.rect(sx, yy, w, base_cell_h, fill=1)
-
-                    num = by_cell.get((rr, cc), {}).get(pos)
-                    if num:
-                        c.setFillGray(0)
-                        c.setFont(font_name, 8)
-                        c.drawCentredString(sx + w/2, yy + base_cell_h/2 - 3, num)
-
-                    sx += w + sub_gap
+            if not (1 <= rr <= room_rows and 1 <= cc <= room_cols):
+                continue
+            cells = layouts[tpl.kind(rr, cc)]
+            if not 0 <= pos < len(cells):
+                continue
+            _pos, off, w, _allowed = cells[pos]
+            x = gx + (cc-1)*(base_cell_w+gap) + off
+            yy = gy + grid_h - rr*(base_cell_h+gap) + gap
+            c.drawCentredString(x + w/2, yy + base_cell_h/2 - 3, str(p["student_no"]))
 
         c.showPage()
+    return len(rooms)
+
+def export_seating_pdf(exam_id: int, placements: Optional[List[dict]], path: str) -> str:
+    """
+    Yerleşimi PDF'e yazar. Oda başına 1 sayfa; sadece büyük grid ve numaralar.
+    placements None ise kayıtlı plan (load_seating) kullanılır.
+    Izgara her düzen için bir kez form olarak çizilir; sayfalara yalnızca öğrenci numaraları eklenir.
+    """
+    # reportlab yalnızca PDF üretilirken yüklenir
+    from reportlab.pdfgen import canvas
+    from reportlab.lib.pagesizes import A4
+    ex, room_layout = _exam_pdf_info(exam_id)
+    if placements is None:
+        placements = load_seating(exam_id)
+        if not placements:
+            raise RuntimeError("Bu sınav için kayıtlı oturma planı yok.")
 
+    font_name = _try_register_turkish_font()
+    c = canvas.Canvas(path, pagesize=A4)
+    _draw_exam_pages(c, font_name, set(), ex, room_layout, placements)
     c.save()
     return path
-
-
-
@@ -12,3 +12,32 @@ def list_students(department_id: int | None = None):
         """, (department_id, department_id))
     rows = cur.fetchall(); con.close()
     return rows
+
+# Sayfalı liste için varsayılan sayfa boyu (birkaç ekranlık satır)
+PAGE_SIZE = 500
+
+def list_students_page(department_id: int | None = None, after: tuple | None = None, limit: int = PAGE_SIZE):
+    """
+    Öğrenci listesinin bir sayfası (keyset sayfalama): (student_no, id) sırasında
+    after=(student_no, id) anahtarından sonraki en fazla limit satır. OFFSET kullanılmadığı için
+    her sayfa, kaçıncı sayfa olursa olsun idx_students_no / UNIQUE(department_id, student_no)
+    indeksinden doğrudan okunur. Sonraki sayfa için son satırın (student_no, id) değeri verilir.
+    """
+    no, sid = after if after is not None else ("", 0)
+    con = get_connection(); cur = con.cursor()
+    if department_id is None:
+        cur.execute("""
+            SELECT * FROM students
+            WHERE (student_no, id) > (?, ?)
+            ORDER BY student_no, id
+            LIMIT ?
+        """, (no, sid, limit))
+    else:
+        cur.execute("""
+            SELECT * FROM students
+            WHERE department_id = ? AND (student_no, id) > (?, ?)
+            ORDER BY student_no, id
+            LIMIT ?
+        """, (department_id, no, sid, limit))
+    rows = cur.fetchall(); con.close()
+    return rows
@@ -0,0 +1,72 @@
+# src/services/text_norm.py
+"""
+Ortak metin normalizasyonu (içe aktarım ve arama sekmeleri).
+NFKC + NBSP temizliği + whitespace sadeleştirme; sonuçlar sınırlı bir LRU önbellekte
+tutulur. Çok tekrar eden anahtarlar (ders kodu, sınıf etiketi, bölüm adı) ayrıca
+sys.intern ile tek nesneye indirilir.
+"""
+from __future__ import annotations
+from functools import lru_cache
+import math
+import re
+import sys
+import unicodedata
+
+# Öğrenci listelerinde tekil değer sayısı (öğrenci no + ad + ders kodu) genelde bunun altındadır.
+NORMALIZE_CACHE_SIZE = 1 << 16
+KEY_CACHE_SIZE = 1 << 12
+
+_WS_RE = re.compile(r"\s+")
+_DIGITS_RE = re.compile(r"(\d+)")
+
+def _is_missing(value) -> bool:
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _normalize_str(s: str) -> str:
+    s = unicodedata.normalize("NFKC", s)
+    s = s.replace("\xa0", " ")
+    return _WS_RE.sub(" ", s).strip()
+
+def normalize_text(value) -> str:
+    """Unicode normalize + NBSP temizliği + whitespace sadeleştirme; None/NaN -> ""."""
+    if _is_missing(value):
+        return ""
+    return _normalize_str(value if type(value) is str else str(value))
+
+@lru_cache(maxsize=KEY_CACHE_SIZE)
+def _normalize_key_str(s: str) -> str:
+    return sys.intern(_normalize_str(s))
+
+def normalize_key(value) -> str:
+    """
+    normalize_text + sys.intern: ders kodu, sınıf etiketi, bölüm adı gibi az sayıda
+    farklı değeri olan ve sözlük anahtarı olarak kullanılan metinler için.
+    """
+    if _is_missing(value):
+        return ""
+    return _normalize_key_str(value if type(value) is str else str(value))
+
+@lru_cache(maxsize=KEY_CACHE_SIZE)
+def _class_number_str(s: str) -> int:
+    m = _DIGITS_RE.search(_normalize_str(s))
+    return int(m.group(1)) if m else 0
+
+def class_number(value) -> int:
+    """'2. Sınıf' -> 2; sayı yoksa 0."""
+    if _is_missing(value):
+        return 0
+    return _class_number_str(value if type(value) is str else str(value))
+
+def cache_info() -> dict:
+    """Önbellek istatistikleri (ölçüm betikleri için)."""
+    return {
+        "text": _normalize_str.cache_info(),
+        "key": _normalize_key_str.cache_info(),
+        "class": _class_number_str.cache_info(),
+    }
+
+def clear_caches() -> None:
+    _normalize_str.cache_clear()
+    _normalize_key_str.cache_clear()
+    _class_number_str.cache_clear()
@@ -0,0 +1,219 @@
+# src/services/timetable_export_sqlite.py
+"""
+Öğrenci başına kişisel sınav programı (toplu dışa aktarım).
+Tüm öğrencilerin sınavları tek bir küme sorgusuyla, öğrenci sırasıyla okunur ve satır satır
+yazılır; bellekte aynı anda yalnızca bir öğrencinin sınavları tutulur.
+Çıktı: tek CSV ya da öğrenci başına bir .ics (iCalendar) dosyası içeren zip.
+Oturma planı kaydedilmişse (exam_seats) derslik/sıra/sütun da eklenir.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from functools import lru_cache
+from datetime import datetime, timedelta, timezone
+from itertools import groupby
+from typing import Callable, Iterator, Optional
+import csv
+import threading
+import time
+import zipfile
+
+from src.db.sqlite import get_conn
+
+# Okuma partisi (fetchmany); bellek kullanımı öğrenci sayısından bağımsızdır.
+FETCH_BATCH = 5000
+
+CSV_HEADERS = ["Öğrenci No", "Ad Soyad", "Sınav Türü", "Tarih", "Başlangıç", "Bitiş",
+               "Ders Kodu", "Ders Adı", "Derslikler", "Oturduğu Derslik", "Sıra", "Sütun"]
+
+ICS_PRODID = "-//yazlab//Sinav Takvimi Olusturucu//TR"
+
+@dataclass
+class TimetableExportResult:
+    path: str
+    students: int
+    exams: int
+    seconds: float
+    cancelled: bool = False
+
+    def summary(self) -> str:
+        s = f"{self.students} öğrenci, {self.exams} sınav satırı → {self.path} ({self.seconds:.2f} sn)"
+        return s + ("\nİptal edildi; dosya eksik." if self.cancelled else "")
+
+def _filter(department_id: Optional[int], exam_type: Optional[str]):
+    where, params = [], []
+    if department_id:
+        where.append("s.department_id = ?"); params.append(department_id)
+    if exam_type:
+        where.append("ex.exam_type = ?"); params.append(exam_type)
+    return (("WHERE " + " AND ".join(where)) if where else ""), params
+
+def count_students(department_id: Optional[int] = None, exam_type: Optional[str] = None) -> int:
+    """Programında en az bir sınav olan öğrenci sayısı (ilerleme çubuğu için)."""
+    wh, params = _filter(department_id, exam_type)
+    con = get_conn(); cur = con.cursor()
+    cur.execute(f"""
+        SELECT COUNT(DISTINCT s.id)
+        FROM students s
+        JOIN enrollments e ON e.student_id = s.id
+        JOIN exams ex ON ex.course_id = e.course_id
+        {wh}
+    """, params)
+    n = cur.fetchone()[0]
+    con.close()
+    return n
+
+def iter_timetable_rows(department_id: Optional[int] = None, exam_type: Optional[str] = None) -> Iterator[tuple]:
+    """
+    (student_id, student_no, full_name, exam_id, exam_type, date, start_time, duration_min,
+     course_code, course_name, rooms, seat_room, seat_row, seat_col) satırlarını
+    öğrenci no, tarih, saat sırasıyla parti parti üretir.
+    """
+    wh, params = _filter(department_id, exam_type)
+    con = get_conn(); cur = con.cursor()
+    try:
+        cur.execute(f"""
+            WITH exam_room_list AS (
+                SELECT exam_id, GROUP_CONCAT(code, '+') AS rooms
+                FROM (SELECT er.exam_id, r.code
+                      FROM exam_rooms er
+                      JOIN rooms r ON r.id = er.room_id
+                      ORDER BY er.exam_id, r.code)
+                GROUP BY exam_id
+            )
+            SELECT s.id, s.student_no, s.full_name,
+                   ex.id, ex.exam_type, ex.date, ex.start_time, ex.duration_min,
+                   c.code, c.name, erl.rooms,
+                   sr.code, es.row, es.col
+            FROM students s
+            JOIN enrollments e ON e.student_id = s.id
+            JOIN exams ex      ON ex.course_id = e.course_id
+            JOIN courses c     ON c.id = ex.course_id
+            LEFT JOIN exam_room_list erl ON erl.exam_id = ex.id
+            LEFT JOIN exam_seats es ON es.exam_id = ex.id AND es.student_id = s.id
+            LEFT JOIN rooms sr      ON sr.id = es.room_id
+            {wh}
+            ORDER BY s.student_no, s.id, ex.date, ex.start_time, c.code
+        """, params)
+        while True:
+            batch = cur.fetchmany(FETCH_BATCH)
+            if not batch:
+                break
+            for r in batch:
+                yield tuple(r)
+    finally:
+        con.close()
+
+def _end_time(date: str, start: str, duration_min: int) -> datetime:
+    return datetime.strptime(f"{date} {start}", "%Y-%m-%d %H:%M") + timedelta(minutes=int(duration_min or 0))
+
+@lru_cache(maxsize=4096)
+def _end_hhmm(date: str, start: str, duration_min: int) -> str:
+    return _end_time(date, start, duration_min).strftime("%H:%M")
+
+@lru_cache(maxsize=4096)
+def _ics_span(date: str, start: str, duration_min: int) -> tuple:
+    """(DTSTART, DTEND) yerel saat ("floating") biçiminde; sınavlar öğrenciler arasında tekrarlandığı için önbellekli."""
+    t0 = datetime.strptime(f"{date} {start}", "%Y-%m-%d %H:%M")
+    t1 = t0 + timedelta(minutes=int(duration_min or 0))
+    return f"{t0:%Y%m%dT%H%M%S}", f"{t1:%Y%m%dT%H%M%S}"
+
+def export_timetables_csv(path: str, department_id: Optional[int] = None, exam_type: Optional[str] = None,
+                          progress: Optional[Callable[[int, int], None]] = None,
+                          cancel: Optional[threading.Event] = None) -> TimetableExportResult:
+    """Tüm öğrencilerin programlarını tek CSV'ye (öğrenci başına sınav satırları) yazar."""
+    t0 = time.perf_counter()
+    total = count_students(department_id, exam_type) if progress else 0
+    students = exams = 0
+    cancelled = False
+    with open(path, "w", newline="", encoding="utf-8-sig") as f:
+        w = csv.writer(f)
+        w.writerow(CSV_HEADERS)
+        for _sid, rows in groupby(iter_timetable_rows(department_id, exam_type), key=lambda r: r[0]):
+            if cancel is not None and cancel.is_set():
+                cancelled = True
+                break
+            for r in rows:
+                w.writerow([r[1], r[2], r[4], r[5], r[6], _end_hhmm(r[5], r[6], r[7]), r[8], r[9], r[10] or "",
+                            r[11] or "", r[12] or "", r[13] or ""])
+                exams += 1
+            students += 1
+            if progress and students % 500 == 0:
+                progress(students, total)
+    if progress and not cancelled:
+        progress(students, total)
+    return TimetableExportResult(path, students, exams, time.perf_counter() - t0, cancelled)
+
+def _ics_escape(text: str) -> str:
+    return (str(text).replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,")
+            .replace("\r\n", "\\n").replace("\n", "\\n"))
+
+def _ics_fold(line: str) -> str:
+    """RFC 5545: 75 oktetten uzun satırlar CRLF + boşlukla bölünür (UTF-8 karakter bölünmeden)."""
+    if len(line) <= 18 or len(line.encode("utf-8")) <= 75:
+        return line
+    out, cur, size = [], [], 0
+    for ch in line:
+        n = len(ch.encode("utf-8"))
+        if size + n > 75:
+            out.append("".join(cur))
+            cur, size = [" "], 1
+        cur.append(ch); size += n
+    out.append("".join(cur))
+    return "\r\n".join(out)
+
+def _student_ics(student_id: int, student_no: str, full_name: str, rows, stamp: str) -> str:
+    lines = ["BEGIN:VCALENDAR", "VERSION:2.0", f"PRODID:{ICS_PRODID}", "CALSCALE:GREGORIAN",
+             f"X-WR-CALNAME:{_ics_escape(f'Sınav Programı - {full_name} ({student_no})')}"]
+    for r in rows:
+        dtstart, dtend = _ics_span(r[5], r[6], r[7])
+        if r[11]:
+            location = f"{r[11]} (Sıra {r[12]}, Sütun {r[13]})"
+        else:
+            location = r[10] or ""
+        lines += [
+            "BEGIN:VEVENT",
+            f"UID:exam-{r[3]}-{student_id}@yazlab",
+            f"DTSTAMP:{stamp}",
+            f"DTSTART:{dtstart}",
+            f"DTEND:{dtend}",
+            f"SUMMARY:{_ics_escape(f'{r[8]} {r[9]} ({r[4]})')}",
+            f"LOCATION:{_ics_escape(location)}",
+            "END:VEVENT",
+        ]
+    lines.append("END:VCALENDAR")
+    return "\r\n".join(_ics_fold(l) for l in lines) + "\r\n"
+
+def export_timetables_ics_zip(path: str, department_id: Optional[int] = None, exam_type: Optional[str] = None,
+                              progress: Optional[Callable[[int, int], None]] = None,
+                              cancel: Optional[threading.Event] = None) -> TimetableExportResult:
+    """
+    Öğrenci başına <öğrenci_no>_<öğrenci_id>.ics dosyalarını bir zip arşivine yazar (saatler yerel saat).
+    Öğrenci no yalnızca bölüm içinde tekildir; id eklenmezse bölümler arası aynı numaralar çakışır.
+    """
+    t0 = time.perf_counter()
+    total = count_students(department_id, exam_type) if progress else 0
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    students = exams = 0
+    cancelled = False
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for sid, grp in groupby(iter_timetable_rows(department_id, exam_type), key=lambda r: r[0]):
+            if cancel is not None and cancel.is_set():
+                cancelled = True
+                break
+            rows = list(grp)
+            zf.writestr(f"{rows[0][1]}_{sid}.ics", _student_ics(sid, rows[0][1], rows[0][2], rows, stamp))
+            students += 1
+            exams += len(rows)
+            if progress and students % 500 == 0:
+                progress(students, total)
+    if progress and not cancelled:
+        progress(students, total)
+    return TimetableExportResult(path, students, exams, time.perf_counter() - t0, cancelled)
+
+def export_timetables(path: str, department_id: Optional[int] = None, exam_type: Optional[str] = None,
+                      progress: Optional[Callable[[int, int], None]] = None,
+                      cancel: Optional[threading.Event] = None) -> TimetableExportResult:
+    """Uzantıya göre: .zip -> öğrenci başına .ics arşivi, aksi halde CSV."""
+    if path.lower().endswith(".zip"):
+        return export_timetables_ics_zip(path, department_id, exam_type, progress, cancel)
+    return export_timetables_csv(path, department_id, exam_type, progress, cancel)
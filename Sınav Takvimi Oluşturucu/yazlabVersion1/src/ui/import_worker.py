@@ -0,0 +1,36 @@
+import threading
+
+from PySide6.QtCore import QThread, Signal
+
+
+class ImportWorker(QThread):
+    """
+    İçe aktarım fonksiyonunu (import_courses / import_students) arka planda çalıştırır.
+    Fonksiyona progress ve cancel argümanları eklenir; sinyaller kuyruklu bağlantıyla
+    ana iş parçacığında işlendiğinden bağlanan slotlar arayüze doğrudan dokunabilir.
+    """
+    progress = Signal(str, int, int)   # aşama, işlenen, toplam (bilinmiyorsa -1)
+    succeeded = Signal(object)         # ImportResult
+    failed = Signal(object)            # Exception (ImportCancelled dahil)
+
+    def __init__(self, func, *args, parent=None, **kwargs):
+        super().__init__(parent)
+        self._func = func
+        self._args = args
+        self._kwargs = kwargs
+        self._cancel = threading.Event()
+
+    def cancel(self):
+        """İptal ister; içe aktarım bir sonraki partide durur ve transaction geri alınır."""
+        self._cancel.set()
+
+    def _report(self, stage, done, total):
+        self.progress.emit(stage, done, -1 if total is None else total)
+
+    def run(self):
+        try:
+            res = self._func(*self._args, progress=self._report, cancel=self._cancel, **self._kwargs)
+        except Exception as e:
+            self.failed.emit(e)
+        else:
+            self.succeeded.emit(res)
@@ -0,0 +1,35 @@
+from PySide6.QtWidgets import QWidget, QVBoxLayout
+from PySide6.QtCore import QTimer, Signal
+
+
+class LazyTab(QWidget):
+    """
+    Sekme için hafif yer tutucu.
+    Asıl sekme (factory) ilk kez görünür olduğunda, ilk boyamadan sonra oluşturulur;
+    böylece sekme sayısı ve veri boyutu açılış süresini etkilemez.
+    """
+    built = Signal(QWidget)
+
+    def __init__(self, factory):
+        super().__init__()
+        self._factory = factory
+        self._widget = None
+        lay = QVBoxLayout(self)
+        lay.setContentsMargins(0, 0, 0, 0)
+
+    @property
+    def widget(self):
+        return self._widget
+
+    def ensure_built(self):
+        if self._widget is None:
+            self._widget = self._factory()
+            self._factory = None
+            self.layout().addWidget(self._widget)
+            self.built.emit(self._widget)
+        return self._widget
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._widget is None:
+            QTimer.singleShot(0, self.ensure_built)
@@ -12,6 +12,7 @@ from src.ui.tabs.searchroom import SearchRoomTab
 from src.ui.tabs.students_view import StudentsViewTab
 from src.ui.tabs.courses_view import CoursesViewTab
 from src.ui.tabs.users import UsersTab
+from src.ui.lazy_tab import LazyTab
 
 
 MAIN_QSS = """
@@ -129,46 +130,62 @@ class MainWindow(QMainWindow):
         self.tabs = QTabWidget()
         self._classroom_info_shown = False
 
-        self.rooms_tab = RoomsTab(self.force_dep_id)
-        self.imports_tab = ImportsTab(self.force_dep_id)
-        self.searches_tab = SearchesTab(self.user, self.force_dep_id)
-        self.searchroom_tab = SearchRoomTab(self.force_dep_id)
-        self.seating_tab = SeatingTab(self.user, self.force_dep_id)
+        # Sekmeler ilk açıldıklarında oluşturulur (bkz. LazyTab); o zamana kadar None.
+        self.rooms_tab = None
+        self.imports_tab = None
+        self.searches_tab = None
+        self.searchroom_tab = None
+        self.seating_tab = None
 
         self.scheduler_tab = None     # Programlama (sınav programı)
         self.students_tab = None      # Öğrenci Listesi
         self.courses_tab = None       # Ders Listesi
         self.users_tab = None         # Kullanıcı Yönetimi (sadece admin)
+        self._scheduler_page = None
 
-        self.tabs.addTab(self.rooms_tab, "Derslikler")
-        self.tabs.addTab(self.searchroom_tab, "Sınıf Arama")
-        self.tabs.addTab(self.imports_tab, "İçe Aktarım")
-        self.tabs.addTab(self.searches_tab, "Aramalar")
-        self.tabs.addTab(self.seating_tab, "Oturma Planı")
+        self._add_lazy_tab("Derslikler", lambda: RoomsTab(self.force_dep_id), self._on_rooms_built)
+        self._add_lazy_tab("Sınıf Arama", lambda: SearchRoomTab(self.force_dep_id),
+                           lambda w: setattr(self, "searchroom_tab", w))
+        self._add_lazy_tab("İçe Aktarım", lambda: ImportsTab(self.force_dep_id), self._on_imports_built)
+        self._add_lazy_tab("Aramalar", lambda: SearchesTab(self.user, self.force_dep_id),
+                           lambda w: setattr(self, "searches_tab", w))
+        self._add_lazy_tab("Oturma Planı", lambda: SeatingTab(self.user, self.force_dep_id),
+                           lambda w: setattr(self, "seating_tab", w))
 
         if self.user["role"] == "admin":
-            self.users_tab = UsersTab(self.user)
-            self.tabs.addTab(self.users_tab, "Kullanıcı Yönetimi")
+            self._add_lazy_tab("Kullanıcı Yönetimi", lambda: UsersTab(self.user),
+                               lambda w: setattr(self, "users_tab", w))
 
         self.setCentralWidget(self.tabs)
 
-        self.imports_tab.studentsImported.connect(self._open_students_tab)
-        self.imports_tab.coursesImported.connect(self._open_courses_tab)
-        self.imports_tab.studentsImported.connect(self._maybe_add_scheduler_tab)
-        self.imports_tab.coursesImported.connect(self._maybe_add_scheduler_tab)
-        self.imports_tab.studentsImported.connect(self._refresh_searches_tab)
-        self.imports_tab.coursesImported.connect(self._refresh_searches_tab)
-
-        if hasattr(self.rooms_tab, "dataChanged"):
-            self.rooms_tab.dataChanged.connect(self.apply_feature_gating)
-            self.rooms_tab.dataChanged.connect(self._on_rooms_changed)
-
         self.tabs.currentChanged.connect(self._on_tab_changed)
 
 
         self.apply_feature_gating()
         self._maybe_add_scheduler_tab()
 
+    def _add_lazy_tab(self, label: str, factory, on_built=None) -> LazyTab:
+        page = LazyTab(factory)
+        if on_built is not None:
+            page.built.connect(on_built)
+        self.tabs.addTab(page, label)
+        return page
+
+    def _on_rooms_built(self, w):
+        self.rooms_tab = w
+        if hasattr(w, "dataChanged"):
+            w.dataChanged.connect(self.apply_feature_gating)
+            w.dataChanged.connect(self._on_rooms_changed)
+
+    def _on_imports_built(self, w):
+        self.imports_tab = w
+        w.studentsImported.connect(self._open_students_tab)
+        w.coursesImported.connect(self._open_courses_tab)
+        w.studentsImported.connect(self._maybe_add_scheduler_tab)
+        w.coursesImported.connect(self._maybe_add_scheduler_tab)
+        w.studentsImported.connect(self._refresh_searches_tab)
+        w.coursesImported.connect(self._refresh_searches_tab)
+
     def _open_students_tab(self):
         if self.students_tab is None:
             self.students_tab = StudentsViewTab(self.force_dep_id)
@@ -190,15 +207,14 @@ class MainWindow(QMainWindow):
         self.tabs.setCurrentWidget(self.courses_tab)
 
     def _maybe_add_scheduler_tab(self):
-        if self.user["role"] != "coordinator":
-            if self.scheduler_tab is None:
-                self.scheduler_tab = SchedulerTab(self.user, self.force_dep_id)
-                self.tabs.addTab(self.scheduler_tab, "Programlama")
+        if self._scheduler_page is not None:
             return
-
-        if self.scheduler_tab is None and imports_ready(self.force_dep_id):
-            self.scheduler_tab = SchedulerTab(self.user, self.force_dep_id)
-            self.tabs.addTab(self.scheduler_tab, "Programlama")
+        if self.user["role"] == "coordinator" and not imports_ready(self.force_dep_id):
+            return
+        self._scheduler_page = self._add_lazy_tab(
+            "Programlama", lambda: SchedulerTab(self.user, self.force_dep_id),
+            lambda w: setattr(self, "scheduler_tab", w)
+        )
 
     def _refresh_searches_tab(self):
         """
@@ -230,7 +246,7 @@ class MainWindow(QMainWindow):
 
     def _on_tab_changed(self, idx: int):
         w = self.tabs.widget(idx)
-        if self.scheduler_tab is not None and w is self.scheduler_tab:
+        if self.scheduler_tab is not None and w is self._scheduler_page:
             try:
                 self.scheduler_tab.refresh_rooms()
             except Exception:
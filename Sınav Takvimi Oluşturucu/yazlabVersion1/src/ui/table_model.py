@@ -0,0 +1,201 @@
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel, Signal
+from PySide6.QtWidgets import QTableView, QAbstractItemView
+
+# Ham değer (ör. seçili satırın kimliği için)
+RawRole = Qt.UserRole
+
+
+class ColumnTableModel(QAbstractTableModel):
+    """
+    Salt okunur tablo modeli. Veri sütun başına bir listede tutulur; hücre metni
+    yalnızca görünümün istediği (ekrandaki) satırlar için üretilir, satır başına
+    nesne oluşturulmaz. Sıralama ham değerler üzerinde Python'da yapılır ve yalnızca
+    satır sırası (_order) değişir; karşılaştırma başına data() çağrısı olmaz.
+    """
+
+    def __init__(self, headers, keys=None, align=None, parent=None):
+        super().__init__(parent)
+        self._headers = list(headers)
+        self._keys = list(keys) if keys is not None else None
+        self._align = dict(align or {})   # sütun -> Qt.Alignment
+        self._cols = [[] for _ in self._headers]
+        self._n = 0
+        self._order = None                # görünüm satırı -> veri satırı (None: sorgu sırası)
+        self._sort = (-1, Qt.AscendingOrder)
+
+    # ---- veri ----
+    def set_columns(self, cols):
+        """Sütun listelerini (her biri aynı uzunlukta) doğrudan yükler."""
+        self.beginResetModel()
+        self._cols = [c if isinstance(c, list) else list(c) for c in cols]
+        self._n = len(self._cols[0]) if self._cols else 0
+        self._order = self._sorted_order(*self._sort)
+        self.endResetModel()
+
+    def set_rows(self, rows, keys=None):
+        """Satırları (sqlite3.Row / dict) keys sırasıyla sütunlara çevirip yükler."""
+        keys = keys if keys is not None else self._keys
+        self.set_columns([[r[k] for r in rows] for k in keys])
+
+    def clear(self):
+        self.set_columns([[] for _ in self._headers])
+
+    def _src(self, row: int) -> int:
+        return row if self._order is None else self._order[row]
+
+    def value(self, row: int, col: int):
+        return self._cols[col][self._src(row)]
+
+    def row_values(self, row: int) -> dict:
+        """Satırı keys ile eşlenmiş sözlük olarak döner (keys yoksa sütun sırası)."""
+        keys = self._keys or range(len(self._cols))
+        i = self._src(row)
+        return {k: c[i] for k, c in zip(keys, self._cols)}
+
+    def _sorted_order(self, column, order):
+        if column < 0 or column >= len(self._cols):
+            return None
+        col = self._cols[column]
+        rev = order == Qt.DescendingOrder
+        try:
+            return sorted(range(self._n), key=col.__getitem__, reverse=rev)
+        except TypeError:
+            # karışık tipler (ör. sayı ve None): metin olarak sırala
+            return sorted(range(self._n), key=lambda i: "" if col[i] is None else str(col[i]), reverse=rev)
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.layoutAboutToBeChanged.emit()
+        old = self.persistentIndexList()
+        src_rows = [self._src(ix.row()) for ix in old]
+        self._sort = (column, order)
+        self._order = self._sorted_order(column, order)
+        pos = list(range(self._n))
+        if old and self._order is not None:
+            for r, i in enumerate(self._order):
+                pos[i] = r
+        if old:
+            self.changePersistentIndexList(old, [self.index(pos[i], ix.column()) for i, ix in zip(src_rows, old)])
+        self.layoutChanged.emit()
+
+    # ---- QAbstractTableModel ----
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._n
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            v = self._cols[index.column()][self._src(index.row())]
+            return "" if v is None else str(v)
+        if role == RawRole:
+            return self._cols[index.column()][self._src(index.row())]
+        if role == Qt.TextAlignmentRole:
+            return self._align.get(index.column())
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+
+class PagedTableModel(ColumnTableModel):
+    """
+    Sayfa sayfa dolan ColumnTableModel. fetch_page(after, limit) bir sonraki sayfanın
+    satırlarını, key_of(satır) sonraki sayfanın başlangıç anahtarını verir (keyset sayfalama).
+    reset() yalnızca ilk sayfayı okur; görünüm sona kaydırıldıkça canFetchMore/fetchMore ile
+    devamı yüklenir. Sıra sorgunun sırasıdır; yalnızca yüklenmiş satırlar sıralanamayacağı için
+    sort() bir şey yapmaz.
+    """
+
+    def __init__(self, headers, fetch_page, key_of, to_columns=None, keys=None, align=None,
+                 page_size=500, parent=None):
+        super().__init__(headers, keys, align, parent)
+        self._fetch_page = fetch_page
+        self._key_of = key_of
+        self._to_columns = to_columns or (lambda rows: [[r[k] for r in rows] for k in self._keys])
+        self._page_size = page_size
+        self._after = None
+        self._more = False
+
+    def reset(self):
+        """Baştan yükler: ilk sayfa hemen okunur."""
+        rows = self._fetch_page(None, self._page_size)
+        self._after = self._key_of(rows[-1]) if rows else None
+        self._more = len(rows) >= self._page_size
+        self.set_columns(self._to_columns(rows) if rows else [[] for _ in self._headers])
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._more
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or not self._more:
+            return
+        rows = self._fetch_page(self._after, self._page_size)
+        self._more = len(rows) >= self._page_size
+        if not rows:
+            return
+        self._after = self._key_of(rows[-1])
+        self.beginInsertRows(QModelIndex(), self._n, self._n + len(rows) - 1)
+        for col, new in zip(self._cols, self._to_columns(rows)):
+            col.extend(new)
+        self._n += len(rows)
+        self.endInsertRows()
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        pass
+
+
+class _SourceSortProxy(QSortFilterProxyModel):
+    """Sıralamayı kaynak modele bırakır; proxy eşleme ve filtre için kalır."""
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.sourceModel().sort(column, order)
+
+
+class DataTableView(QTableView):
+    """
+    ColumnTableModel + QSortFilterProxyModel ile hazır QTableView.
+    Başlığa tıklayınca ham değerlere göre sıralar; ilk açılışta kaynak (sorgu) sırası korunur.
+    Yalnızca görünen satırlar çizilir.
+    """
+    selectionChangedRows = Signal()   # QTableWidget.itemSelectionChanged karşılığı
+
+    def __init__(self, headers, keys=None, align=None, parent=None, model=None):
+        super().__init__(parent)
+        self.source = model if model is not None else ColumnTableModel(headers, keys, align)
+        self.source.setParent(self)
+        self.proxy = _SourceSortProxy(self)
+        self.proxy.setSourceModel(self.source)
+        self.setModel(self.proxy)
+        self.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        if isinstance(self.source, PagedTableModel):
+            self.setSortingEnabled(False)
+        else:
+            self.setSortingEnabled(True)
+            self.sortByColumn(-1, Qt.AscendingOrder)
+
+    def selectionChanged(self, selected, deselected):
+        super().selectionChanged(selected, deselected)
+        self.selectionChangedRows.emit()
+
+    def set_rows(self, rows, keys=None):
+        self.source.set_rows(rows, keys)
+
+    def set_columns(self, cols):
+        self.source.set_columns(cols)
+
+    def selected_row(self):
+        """Seçili satırın kaynak modeldeki indeksi (yoksa None)."""
+        idx = self.selectionModel().selectedRows()
+        if not idx:
+            return None
+        return self.proxy.mapToSource(idx[0]).row()
+
+    def selected_values(self):
+        r = self.selected_row()
+        return None if r is None else self.source.row_values(r)
@@ -1,10 +1,13 @@
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem, QLabel,
+    QWidget, QVBoxLayout, QLabel,
     QFrame, QHBoxLayout, QLineEdit, QPushButton, QHeaderView, QAbstractItemView
 )
 from PySide6.QtCore import Qt
 
 from src.services.course_repo_sqlite import list_courses_with_counts
+from src.services.search_index_sqlite import search_ids
+from src.services.text_norm import normalize_text
+from src.ui.table_model import DataTableView
 
 def rget(row, key, default=""):
     return row[key] if key in row.keys() and row[key] is not None else default
@@ -45,12 +48,13 @@ class CoursesViewTab(QWidget):
         frame_l.setContentsMargins(8, 8, 8, 8)
         frame_l.setSpacing(6)
 
-        self.tbl = QTableWidget(0, 5)
-        self.tbl.setHorizontalHeaderLabels(["ID", "Kod", "Ad", "BölümID", "Öğrenci Sayısı"])
+        self.tbl = DataTableView(
+            ["ID", "Kod", "Ad", "BölümID", "Öğrenci Sayısı"],
+            align={0: Qt.AlignCenter, 1: Qt.AlignCenter, 2: Qt.AlignVCenter | Qt.AlignLeft,
+                   3: Qt.AlignCenter, 4: Qt.AlignCenter},
+        )
         self.tbl.setAlternatingRowColors(True)
-        self.tbl.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.tbl.setSelectionMode(QAbstractItemView.SingleSelection)
-        self.tbl.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.tbl.verticalHeader().setVisible(False)
 
         header = self.tbl.horizontalHeader()
@@ -65,41 +69,22 @@ class CoursesViewTab(QWidget):
         root.addWidget(frame, 1)
 
     def _apply_filter(self):
-        q = (self.search.text() or "").strip().lower()
+        q = normalize_text(self.search.text())
         if not q:
             rows = self._rows
         else:
-            rows = [
-                r for r in self._rows
-                if q in str(rget(r, "code", "")).lower() or q in str(rget(r, "name", "")).lower()
-            ]
+            ids = set(search_ids(q, "course", self.department_id, code_contains=True))
+            rows = [r for r in self._rows if rget(r, "id") in ids]
         self._populate_table(rows)
 
     def _populate_table(self, rows):
-        self.tbl.setRowCount(0)
-        for r in rows:
-            i = self.tbl.rowCount()
-            self.tbl.insertRow(i)
-
-            id_item = QTableWidgetItem(str(rget(r, "id")))
-            id_item.setTextAlignment(Qt.AlignCenter)
-            self.tbl.setItem(i, 0, id_item)
-
-            code_item = QTableWidgetItem(str(rget(r, "code")))
-            code_item.setTextAlignment(Qt.AlignCenter)
-            self.tbl.setItem(i, 1, code_item)
-
-            name_item = QTableWidgetItem(str(rget(r, "name")))
-            name_item.setTextAlignment(Qt.AlignVCenter | Qt.AlignLeft)
-            self.tbl.setItem(i, 2, name_item)
-
-            dep_item = QTableWidgetItem(str(rget(r, "department_id", "")))
-            dep_item.setTextAlignment(Qt.AlignCenter)
-            self.tbl.setItem(i, 3, dep_item)
-
-            count_item = QTableWidgetItem(str(rget(r, "student_count", 0)))
-            count_item.setTextAlignment(Qt.AlignCenter)
-            self.tbl.setItem(i, 4, count_item)
+        self.tbl.set_columns([
+            [rget(r, "id") for r in rows],
+            [rget(r, "code") for r in rows],
+            [rget(r, "name") for r in rows],
+            [rget(r, "department_id", "") for r in rows],
+            [rget(r, "student_count", 0) for r in rows],
+        ])
 
     def refresh(self):
         try:
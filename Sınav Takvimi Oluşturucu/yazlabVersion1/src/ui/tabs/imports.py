@@ -1,12 +1,37 @@
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QPushButton, QLabel,
-    QFileDialog, QTextEdit, QComboBox, QMessageBox
+    QFileDialog, QTextEdit, QComboBox, QMessageBox, QApplication, QCheckBox, QProgressBar
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Signal
 
 from src.services.room_repo_sqlite import list_departments
-from src.services.importer_sqlite import import_courses, import_students
+from src.services.importer_sqlite import (
+    import_courses, import_students, ImportCancelled, STAGE_PARSE, STAGE_NORMALISE, STAGE_WRITE
+)
+from src.services.batch_import_sqlite import import_folder
+from src.services.import_log_sqlite import KIND_COURSES, KIND_STUDENTS
+from src.services import import_profile
 from src.services.guards import DomainError
+from src.ui.import_worker import ImportWorker
+
+# xlsx yanında kayıt sistemi CSV/TSV dışa aktarımları doğrudan okunur
+IMPORT_FILE_FILTER = "Excel / CSV (*.xlsx *.csv *.tsv);;Excel (*.xlsx);;CSV (*.csv *.tsv)"
+
+# Toplu içe aktarım: ilerleme dosya sayısı olarak bildirilir
+KIND_BATCH = "batch"
+
+STAGE_LABELS = {
+    STAGE_PARSE: "Dosya okunuyor...",
+    STAGE_NORMALISE: "Satırlar doğrulanıyor...",
+    STAGE_WRITE: "Veritabanına yazılıyor...",
+    KIND_BATCH: "Dosyalar içe aktarılıyor...",
+}
+
+
+def _import_folder_staged(folder, progress=None, cancel=None, force=False):
+    """import_folder'ı ImportWorker'ın (aşama, işlenen, toplam) ilerleme biçimine uyarlar."""
+    report = (lambda done, total: progress(KIND_BATCH, done, total)) if progress else None
+    return import_folder(folder, progress=report, cancel=cancel, force=force)
 
 
 class ImportsTab(QWidget):
@@ -19,8 +44,12 @@ class ImportsTab(QWidget):
 
         self.course_path = None
         self.student_path = None
+        self._worker = None
+        self._worker_kind = None
+        self._folder = None
 
         self._build_ui()
+        QApplication.instance().aboutToQuit.connect(self._stop_worker)
 
     def _build_ui(self):
         root = QVBoxLayout(self)
@@ -30,9 +59,17 @@ class ImportsTab(QWidget):
         self.cmb_dep = QComboBox()
         self._load_departments()
         row.addWidget(self.cmb_dep, 1)
+        self.chk_force = QCheckBox("Değişmemiş dosyaları da yeniden yükle")
+        self.chk_force.setToolTip("İşaretlenmezse son içe aktarımla aynı olan dosyalar atlanır, "
+                                  "değişen öğrenci listelerinde yalnızca fark uygulanır.")
+        row.addWidget(self.chk_force)
+        self.chk_profile = QCheckBox("Profil raporu")
+        self.chk_profile.setToolTip("Aşama süreleri, SQL ifade sayısı ve tepe belleği gösterir; "
+                                    f"JSON olarak {import_profile.PROFILE_LOG_PATH.name} dosyasına eklenir.")
+        row.addWidget(self.chk_profile)
         root.addLayout(row)
 
-        gb1 = QGroupBox("Ders Listesi Yükle (dersler.xlsx)")
+        gb1 = QGroupBox("Ders Listesi Yükle (dersler.xlsx / .csv)")
         g1 = QHBoxLayout(gb1)
         self.lbl_course = QLabel("Dosya: (seçilmedi)")
         btn_course = QPushButton("Dosya Seç")
@@ -43,7 +80,7 @@ class ImportsTab(QWidget):
         g1.addWidget(btn_course)
         g1.addWidget(btn_course_imp)
 
-        gb2 = QGroupBox("Öğrenci Listesi Yükle (ogrenciler.xlsx)")
+        gb2 = QGroupBox("Öğrenci Listesi Yükle (ogrenciler.xlsx / .csv)")
         g2 = QHBoxLayout(gb2)
         self.lbl_student = QLabel("Dosya: (seçilmedi)")
         btn_student = QPushButton("Dosya Seç")
@@ -53,6 +90,29 @@ class ImportsTab(QWidget):
         g2.addWidget(self.lbl_student, 1)
         g2.addWidget(btn_student)
         g2.addWidget(btn_student_imp)
+        self._import_buttons = [btn_course_imp, btn_student_imp]
+
+        gb3 = None
+        if self.force_dep_id is None:
+            gb3 = QGroupBox("Toplu İçe Aktar (tüm bölümler: bm_/ym_/im_/trik_/tronik_ veya manifest.json)")
+            g3 = QHBoxLayout(gb3)
+            g3.addWidget(QLabel("Klasördeki tüm ders ve öğrenci listeleri paralel okunur."), 1)
+            btn_batch = QPushButton("Klasör Seç ve İçe Aktar")
+            btn_batch.clicked.connect(self._import_folder)
+            g3.addWidget(btn_batch)
+            self._import_buttons.append(btn_batch)
+
+        self.progress_row = QWidget()
+        pr = QHBoxLayout(self.progress_row)
+        pr.setContentsMargins(0, 0, 0, 0)
+        self.lbl_stage = QLabel()
+        self.progress = QProgressBar()
+        self.btn_cancel = QPushButton("İptal")
+        self.btn_cancel.clicked.connect(self._cancel_import)
+        pr.addWidget(self.lbl_stage)
+        pr.addWidget(self.progress, 1)
+        pr.addWidget(self.btn_cancel)
+        self.progress_row.setVisible(False)
 
         self.out = QTextEdit()
         self.out.setReadOnly(True)
@@ -60,6 +120,9 @@ class ImportsTab(QWidget):
 
         root.addWidget(gb1)
         root.addWidget(gb2)
+        if gb3 is not None:
+            root.addWidget(gb3)
+        root.addWidget(self.progress_row)
         root.addWidget(self.out, 1)
 
     def _dep_id(self):
@@ -82,39 +145,32 @@ class ImportsTab(QWidget):
             self.cmb_dep.setEnabled(True)
 
     def _pick_courses(self):
-        path, _ = QFileDialog.getOpenFileName(self, "Ders Excel Seç", "", "Excel (*.xlsx)")
+        path, _ = QFileDialog.getOpenFileName(self, "Ders Listesi Seç", "", IMPORT_FILE_FILTER)
         if path:
             self.course_path = path
             self.lbl_course.setText(f"Dosya: {path}")
 
     def _pick_students(self):
-        path, _ = QFileDialog.getOpenFileName(self, "Öğrenci Excel Seç", "", "Excel (*.xlsx)")
+        path, _ = QFileDialog.getOpenFileName(self, "Öğrenci Listesi Seç", "", IMPORT_FILE_FILTER)
         if path:
             self.student_path = path
             self.lbl_student.setText(f"Dosya: {path}")
 
+    def _append_maintenance(self, res):
+        if res.maintenance is not None:
+            self.out.append("🧹 Otomatik veritabanı bakımı:")
+            self.out.append(res.maintenance.summary())
+
     def _import_courses(self):
         dep_id = self._dep_id()
         if not dep_id:
             self.out.append("⚠️ Bölüm seçilmedi.")
             return
         if not self.course_path:
-            self.out.append("⚠️ Ders Excel seçilmedi.")
+            self.out.append("⚠️ Ders dosyası seçilmedi.")
             return
-        try:
-            res = import_courses(self.course_path, dep_id)
-            self.out.append(f"📘 Dersler → Eklendi: {res.inserted}, Güncellendi: {res.updated}")
-            if res.errors:
-                self.out.append("Hatalar:")
-                for e in res.errors:
-                    self.out.append(f" - {e}")
-            self.coursesImported.emit()
-        except DomainError as e:
-            QMessageBox.warning(self, "Önce Derslikler", str(e))
-        except Exception as e:
-            QMessageBox.critical(self, "Hata", f"Yükleme başarısız:\n{e}")
-        finally:
-            self.out.append("—"*40)
+        self._start_import(KIND_COURSES, import_courses, self.course_path, dep_id,
+                           profile=self.chk_profile.isChecked())
 
     def _import_students(self):
         dep_id = self._dep_id()
@@ -122,19 +178,121 @@ class ImportsTab(QWidget):
             self.out.append("⚠️ Bölüm seçilmedi.")
             return
         if not self.student_path:
-            self.out.append("⚠️ Öğrenci Excel seçilmedi.")
+            self.out.append("⚠️ Öğrenci dosyası seçilmedi.")
             return
-        try:
-            res = import_students(self.student_path, dep_id)
-            self.out.append(f"👥 Öğrenciler → Eklendi: {res.inserted}, Güncellendi: {res.updated}")
+        self._start_import(KIND_STUDENTS, import_students, self.student_path, dep_id,
+                           profile=self.chk_profile.isChecked())
+
+    # --- arka plan içe aktarımı ---
+    def _start_import(self, kind, func, *args, **kwargs):
+        if self._worker is not None:
+            return
+        self._worker = ImportWorker(func, *args, force=self.chk_force.isChecked(), parent=self, **kwargs)
+        self._worker.progress.connect(self._on_progress)
+        self._worker_kind = kind
+        self._worker.succeeded.connect(self._on_import_done)
+        self._worker.failed.connect(self._on_import_failed)
+        self._worker.finished.connect(self._on_worker_finished)
+        self._set_busy(True)
+        self._worker.start()
+
+    def _set_busy(self, busy: bool):
+        for w in self._import_buttons:
+            w.setEnabled(not busy)
+        self.chk_force.setEnabled(not busy)
+        self.chk_profile.setEnabled(not busy)
+        self.btn_cancel.setEnabled(busy)
+        self.lbl_stage.setText("Hazırlanıyor..." if busy else "")
+        self.progress.setRange(0, 0 if busy else 1)
+        self.progress.setValue(0)
+        self.progress_row.setVisible(busy)
+
+    def _on_progress(self, stage, done, total):
+        self.lbl_stage.setText(STAGE_LABELS.get(stage, stage))
+        if total < 0:
+            self.progress.setRange(0, 0)
+        else:
+            self.progress.setRange(0, max(total, 1))
+            self.progress.setValue(min(done, max(total, 1)))
+
+    def _cancel_import(self):
+        if self._worker is not None:
+            self._worker.cancel()
+            self.btn_cancel.setEnabled(False)
+            self.lbl_stage.setText("İptal ediliyor...")
+
+    def _on_import_done(self, res):
+        kind = self._worker_kind
+        if kind == KIND_BATCH:
+            self._on_folder_done(res)
+            return
+        label = "Dersler" if kind == KIND_COURSES else "Öğrenciler"
+        if res.skipped:
+            self.out.append(f"⏭️ {label} → Dosya son içe aktarımdan beri değişmemiş, atlandı.")
+        else:
+            if kind == KIND_COURSES:
+                self.out.append(f"📘 Dersler → Eklendi: {res.inserted}, Güncellendi: {res.updated}")
+            else:
+                self.out.append(f"👥 Öğrenciler → Eklendi: {res.inserted}, Güncellendi: {res.updated}, "
+                                f"Silinen kayıt: {res.removed}, Değişmeyen: {res.unchanged}")
             if res.errors:
                 self.out.append("Hatalar:")
                 for e in res.errors:
                     self.out.append(f" - {e}")
-            self.studentsImported.emit()
-        except DomainError as e:
+            self._append_maintenance(res)
+            self._append_profile(res)
+            if kind == KIND_COURSES:
+                self.coursesImported.emit()
+            else:
+                self.studentsImported.emit()
+        self.out.append("—"*40)
+
+    def _append_profile(self, res):
+        if res.profile is None:
+            return
+        self.out.append("⏱️ İçe aktarım profili:")
+        self.out.append(res.profile.summary())
+        try:
+            self.out.append(f"(JSON: {import_profile.append_log(res.profile)})")
+        except OSError as e:
+            self.out.append(f"⚠️ Profil günlüğe yazılamadı: {e}")
+
+    def _on_import_failed(self, e):
+        if isinstance(e, ImportCancelled):
+            self.out.append(f"⛔ {e}")
+        elif isinstance(e, DomainError):
             QMessageBox.warning(self, "Önce Derslikler", str(e))
-        except Exception as e:
+        else:
             QMessageBox.critical(self, "Hata", f"Yükleme başarısız:\n{e}")
-        finally:
-            self.out.append("—"*40)
+        self.out.append("—"*40)
+
+    def _on_worker_finished(self):
+        self._worker.deleteLater()
+        self._worker = None
+        self._set_busy(False)
+
+    def _stop_worker(self):
+        """Uygulama kapanırken süren içe aktarımı iptal edip iş parçacığının bitmesini bekler."""
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker.wait()
+
+    def _import_folder(self):
+        folder = QFileDialog.getExistingDirectory(self, "Liste Klasörü Seç")
+        if not folder:
+            return
+        self._folder = folder
+        self._start_import(KIND_BATCH, _import_folder_staged, folder)
+
+    def _on_folder_done(self, res):
+        self.out.append(f"📦 Toplu içe aktarım ({self._folder}):")
+        self.out.append(res.summary())
+        for f in res.files:
+            for e in f.result.errors[:20]:
+                self.out.append(f" - {f.item.department_name}: {e}")
+            if len(f.result.errors) > 20:
+                self.out.append(f" - {f.item.department_name}: ... (+{len(f.result.errors) - 20} hata)")
+        self._append_maintenance(res)
+        self.coursesImported.emit()
+        self.studentsImported.emit()
+        self.out.append("—"*40)
@@ -1,6 +1,6 @@
 from PySide6.QtCore import Qt, QRectF, Signal 
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
+    QWidget, QVBoxLayout, QHBoxLayout,
     QFormLayout, QLineEdit, QSpinBox, QComboBox, QPushButton, QMessageBox,
     QGraphicsView, QGraphicsScene, QLabel, QAbstractItemView
 )
@@ -9,6 +9,7 @@ from PySide6.QtCore import Qt, QRectF
 from src.services.room_repo_sqlite import (
     list_departments, list_rooms, get_room, create_room, update_room, delete_room
 )
+from src.ui.table_model import DataTableView
 
 CELL_W, CELL_H = 26, 18
 CELL_GAP = 6
@@ -34,13 +35,12 @@ class RoomsTab(QWidget):
         left.addWidget(self.cmb_dep_filter)
 
         # Tablo
-        self.tbl = QTableWidget(0, 8)
-        self.tbl.setHorizontalHeaderLabels(
-            ["ID", "Bölüm", "Kod", "Ad", "Kapasite", "Rows", "Cols", "Grup"]
+        self.tbl = DataTableView(
+            ["ID", "Bölüm", "Kod", "Ad", "Kapasite", "Rows", "Cols", "Grup"],
+            keys=["id", "department_name", "code", "name", "capacity", "rows", "cols", "group_size"],
         )
-        self.tbl.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.tbl.setSelectionMode(QAbstractItemView.SingleSelection)
-        self.tbl.itemSelectionChanged.connect(self.on_table_select)
+        self.tbl.selectionChangedRows.connect(self.on_table_select)
         left.addWidget(self.tbl)
 
         # Form
@@ -125,41 +125,25 @@ class RoomsTab(QWidget):
         return self.cmb_dep.itemData(i)
 
     def load_rooms(self):
-        self.tbl.setRowCount(0)
         dep_id = self._current_dep_filter_id()
-        rooms = list_rooms(dep_id)  
+        rooms = [dict(r) for r in list_rooms(dep_id)]
 
         dep_names = {d["id"]: d["name"] for d in list_departments()}
+        for rd in rooms:
+            if rd.get("department_name") is None:
+                rd["department_name"] = dep_names.get(rd.get("department_id"), "")
 
-        for r in rooms:
-            rd = dict(r)  
-
-            row = self.tbl.rowCount()
-            self.tbl.insertRow(row)
-
-            dept_name = rd.get("department_name")
-            if dept_name is None:
-                dept_name = dep_names.get(rd.get("department_id"), "")
-
-            self.tbl.setItem(row, 0, QTableWidgetItem(str(rd.get("id", ""))))
-            self.tbl.setItem(row, 1, QTableWidgetItem(dept_name))
-            self.tbl.setItem(row, 2, QTableWidgetItem(str(rd.get("code", ""))))
-            self.tbl.setItem(row, 3, QTableWidgetItem(str(rd.get("name", ""))))
-            self.tbl.setItem(row, 4, QTableWidgetItem(str(rd.get("capacity", ""))))
-            self.tbl.setItem(row, 5, QTableWidgetItem(str(rd.get("rows", ""))))
-            self.tbl.setItem(row, 6, QTableWidgetItem(str(rd.get("cols", ""))))
-            self.tbl.setItem(row, 7, QTableWidgetItem(str(rd.get("group_size", ""))))
+        self.tbl.set_rows(rooms)
 
         self.selected_room_id = None
         self.scene.clear()
 
 
     def on_table_select(self):
-        items = self.tbl.selectedItems()
-        if not items:
+        sel = self.tbl.selected_values()
+        if not sel:
             return
-        row = items[0].row()
-        room_id = int(self.tbl.item(row, 0).text())
+        room_id = int(sel["id"])
         self.selected_room_id = room_id
 
         r = get_room(room_id)
@@ -1,16 +1,18 @@
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QLabel, QComboBox, QDateEdit,
-    QSpinBox, QLineEdit, QPushButton, QTableWidget, QTableWidgetItem, QMessageBox,
+    QSpinBox, QLineEdit, QPushButton, QMessageBox,
     QListWidget, QListWidgetItem, QFileDialog, QTimeEdit, QCheckBox, QDialog,
-    QDialogButtonBox
+    QDialogButtonBox, QProgressDialog, QApplication
 )
 from PySide6.QtCore import Qt, QDate, QTime, QTimer
 from datetime import date
+import threading
 from src.services.room_repo_sqlite import list_departments, list_rooms
 from src.services.scheduler_sqlite import (
     schedule_exams, list_scheduled, fetch_courses_with_counts
 )
 from src.services.scheduler_sqlite import export_schedule as export_schedule_to_file
+from src.ui.table_model import DataTableView
 
 
 class DurationOverrideDialog(QDialog):
@@ -163,13 +165,17 @@ class SchedulerTab(QWidget):
         self.btn_run.clicked.connect(self.run_scheduler)
         self.btn_export = QPushButton("Dışa Aktar")
         self.btn_export.clicked.connect(self.export_schedule)
+        self.btn_export_students = QPushButton("Öğrenci Programları")
+        self.btn_export_students.setToolTip("Her öğrencinin kişisel sınav programı: tek CSV ya da .ics dosyalı zip")
+        self.btn_export_students.clicked.connect(self.export_student_timetables)
         btns = QHBoxLayout()
         btns.addStretch(1)
         btns.addWidget(self.btn_run)
         btns.addWidget(self.btn_export)
+        btns.addWidget(self.btn_export_students)
 
-        self.tbl = QTableWidget(0, 6)
-        self.tbl.setHorizontalHeaderLabels(["Ders Kodu","Ders Adı","Tarih","Başlangıç","Süre","Derslik"])
+        self.tbl = DataTableView(["Ders Kodu","Ders Adı","Tarih","Başlangıç","Süre","Derslik"],
+                                 keys=["code","name","date","start_time","duration_min","room_code"])
 
         # ---- Layout ----
         root.addWidget(gb)
@@ -324,16 +330,7 @@ class SchedulerTab(QWidget):
         QMessageBox.information(self, "Sonuç", msg)
 
     def _reload_result(self, exam_type, dep_id):
-        rows = list_scheduled(exam_type, dep_id)
-        self.tbl.setRowCount(0)
-        for r in rows:
-            i = self.tbl.rowCount(); self.tbl.insertRow(i)
-            self.tbl.setItem(i, 0, QTableWidgetItem(r["code"]))
-            self.tbl.setItem(i, 1, QTableWidgetItem(r["name"]))
-            self.tbl.setItem(i, 2, QTableWidgetItem(r["date"]))
-            self.tbl.setItem(i, 3, QTableWidgetItem(r["start_time"]))
-            self.tbl.setItem(i, 4, QTableWidgetItem(str(r["duration_min"])))
-            self.tbl.setItem(i, 5, QTableWidgetItem(r["room_code"]))
+        self.tbl.set_rows(list_scheduled(exam_type, dep_id))
 
     def export_schedule(self):
         dep_id = self._dep_id()
@@ -349,3 +346,39 @@ class SchedulerTab(QWidget):
             QMessageBox.information(self, "Dışa Aktarım", f"Kaydedildi:\n{out}")
         except Exception as e:
             QMessageBox.critical(self, "Hata", f"Dışa aktarılamadı:\n{e}")
+
+    def export_student_timetables(self):
+        """Bölümdeki tüm öğrencilerin kişisel programları (seçili tür); .zip seçilirse öğrenci başına .ics."""
+        path, flt = QFileDialog.getSaveFileName(
+            self, "Öğrenci Programlarını Dışa Aktar",
+            "ogrenci_programlari.csv",
+            "CSV (*.csv);;iCalendar - öğrenci başına .ics (*.zip)"
+        )
+        if not path: return
+        if flt.endswith("(*.zip)") and not path.lower().endswith(".zip"):
+            path += ".zip"
+
+        from src.services.timetable_export_sqlite import export_timetables
+        cancel = threading.Event()
+        dlg = QProgressDialog("Öğrenci programları yazılıyor...", "İptal", 0, 0, self)
+        dlg.setWindowTitle("Öğrenci Programları")
+        dlg.setWindowModality(Qt.WindowModal)
+        dlg.setMinimumDuration(0)
+        dlg.canceled.connect(cancel.set)
+        dlg.show()
+
+        def progress(done, total):
+            dlg.setMaximum(total)
+            dlg.setValue(done)
+            QApplication.processEvents()
+
+        try:
+            res = export_timetables(path, self._dep_id(), self.cmb_type.currentText(),
+                                    progress=progress, cancel=cancel)
+        except Exception as e:
+            QMessageBox.critical(self, "Hata", f"Dışa aktarılamadı:\n{e}"); return
+        finally:
+            dlg.close()
+        if not res.students:
+            QMessageBox.warning(self, "Boş", "Seçilen türde programı olan öğrenci yok."); return
+        QMessageBox.information(self, "Öğrenci Programları", res.summary())
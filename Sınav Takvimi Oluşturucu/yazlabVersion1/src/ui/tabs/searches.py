@@ -1,10 +1,12 @@
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QLabel, QLineEdit, QPushButton,
-    QComboBox, QTableWidget, QTableWidgetItem,QFrame, QHeaderView
+    QComboBox, QTableWidget, QTableWidgetItem,QFrame, QHeaderView, QCompleter
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QStringListModel, QTimer
 from src.services.room_repo_sqlite import list_departments
 from src.services.search_repo_sqlite import get_student_courses, get_course_students
+from src.services.search_index_sqlite import search
+from src.services.text_norm import normalize_text
 from src.db.sqlite import get_connection
 
 
@@ -31,8 +33,17 @@ class SearchesTab(QWidget):
             self._load_departments(self.cmb_dep_l, add_all=False)
 
             self.ed_sno = QLineEdit()
-            self.ed_sno.setPlaceholderText("Öğrenci No")
+            self.ed_sno.setPlaceholderText("Öğrenci No veya Ad")
             self.ed_sno.setFixedWidth(200) 
+            # yazarken öneri: numara ya da ad önekine göre (arama dizini)
+            self._sno_model = QStringListModel(self)
+            completer = QCompleter(self._sno_model, self)
+            completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+            completer.setMaxVisibleItems(12)
+            completer.activated.connect(self._on_student_picked)
+            self.ed_sno.setCompleter(completer)
+            self.ed_sno.textEdited.connect(self._suggest_students)
+            self.ed_sno.returnPressed.connect(self._query_left)
 
             self.btn_left = QPushButton("Dersleri Listele") 
             self.btn_left.clicked.connect(self._query_left)
@@ -132,6 +143,22 @@ class SearchesTab(QWidget):
         return combo.itemData(i)
 
     # ================= SOL TARAF İŞLEMLERİ =================
+    SUGGEST_LIMIT = 15
+
+    def _suggest_students(self, text: str):
+        hits = search(text, kinds=("student",), department_id=self._dep_id_of(self.cmb_dep_l),
+                      limit=self.SUGGEST_LIMIT)
+        self._sno_model.setStringList([f"{h.code} — {h.name}" for h in hits])
+
+    def _on_student_picked(self, text: str):
+        # QLineEdit seçilen öneriyi kendisi yazar; numarayı ondan sonra bırak
+        self._picked_sno = text.split(" — ", 1)[0]
+        QTimer.singleShot(0, self._apply_picked_student)
+
+    def _apply_picked_student(self):
+        self.ed_sno.setText(self._picked_sno)
+        self._query_left()
+
     def _resolve_student_name_cols(self):
         con = get_connection()
         cur = con.cursor()
@@ -187,7 +214,7 @@ class SearchesTab(QWidget):
 
     def _query_left(self):
         dep_id = self._dep_id_of(self.cmb_dep_l)
-        sno = (self.ed_sno.text() or "").strip()
+        sno = normalize_text(self.ed_sno.text())  # içe aktarımda saklanan biçimle aynı
 
         self.tbl_left.setRowCount(0)
         self.lbl_student_info.setText("")
@@ -7,6 +7,8 @@ from PySide6.QtCore import QRectF, Qt
 from PySide6.QtGui import QPen, QBrush, QColor, QFont, QPainter
 from src.db.sqlite import get_connection
 from src.services.room_repo_sqlite import get_room  
+from src.services.text_norm import normalize_text
+from src.services.search_index_sqlite import fold_search_text, search_ids
 
 MM = 3.7795275591
 
@@ -64,30 +66,30 @@ class SearchRoomTab(QWidget):
 
     # ---------------- DB sorguları ----------------
     def _query_by_code(self, code: str):
-        """Code ile (büyük/küçük harf duyarsız) arama. Tam eşleşme yoksa LIKE ile kısmi arama dener."""
-        code = (code or "").strip()
+        """
+        Kod/ad ile arama (arama dizini: kelime öneki ya da kodun herhangi bir parçası,
+        Türkçe büyük/küçük harf duyarsız). Kodu tam eşleşen derslik varsa yalnızca o döner.
+        """
+        code = normalize_text(code)
         if not code:
             return []
+        ids = search_ids(code, "room", code_contains=True)
+        if not ids:
+            return []
 
         con = get_connection()
         cur = con.cursor()
-
-        # 1) tam eşleşme
-        cur.execute("SELECT * FROM rooms WHERE LOWER(code)=LOWER(?)", (code,))
+        cur.execute(f"SELECT * FROM rooms WHERE id IN ({','.join('?' * len(ids))}) ORDER BY code", ids)
         rows = cur.fetchall()
-
-        # 2) yoksa kısmi
-        if not rows:
-            like = f"%{code}%"
-            cur.execute("SELECT * FROM rooms WHERE LOWER(code) LIKE LOWER(?) ORDER BY code", (like,))
-            rows = cur.fetchall()
-
         con.close()
-        return rows
+
+        key = fold_search_text(code).lower()
+        exact = [r for r in rows if fold_search_text(r["code"]).lower() == key]
+        return exact or rows
 
     # ---------------- Arama işlemi ----------------
     def search_room(self):
-        q = (self.ed_query.text() or "").strip()
+        q = normalize_text(self.ed_query.text())
         if not q:
             QMessageBox.warning(self, "Uyarı", "Lütfen sınıf ID veya kod girin.")
             return
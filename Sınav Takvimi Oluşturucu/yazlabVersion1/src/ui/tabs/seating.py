@@ -1,11 +1,16 @@
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QLabel, QComboBox, QPushButton,
-    QGraphicsView, QGraphicsScene, QFileDialog, QMessageBox, QApplication
+    QGraphicsView, QGraphicsScene, QGraphicsItem, QFileDialog, QMessageBox, QApplication, QProgressDialog
 )
-from PySide6.QtCore import Qt, QRectF
-from PySide6.QtGui import QPen, QBrush, QFont, QPainter, QColor
+from PySide6.QtCore import Qt, QRectF, Signal
+import bisect
+import math
+import threading
+import time
+from PySide6.QtGui import QPen, QBrush, QFont, QFontMetricsF, QPainter, QColor
 from src.services.seating_sqlite import (
-    list_exams_with_rooms, build_seating, export_seating_csv, get_exam_rooms
+    list_exams_with_rooms, build_seating, build_all_seatings, export_seating_csv, get_exam_rooms,
+    save_seating, save_all_seatings, load_seating, seat_template
 )
 
 MM = 3.7795275591
@@ -26,14 +31,147 @@ WHITE = QColor(255, 255, 255)
 BLACK = QColor(0, 0, 0)
 WHITE_TXT = QColor(255, 255, 255)
 
-def _allowed_positions(group_size: int, row: int, col: int) -> list[int]:
-    if group_size <= 2:
-        return [(row + col) % 2]
-    if group_size == 3:
-        return [0, 2]
-    return [0, group_size - 1]
+# Bu yakınlaştırmanın altında öğrenci numaraları okunamayacak kadar küçük; çizilmez.
+NUMBER_MIN_LOD = 0.35
+TEXT_MARGIN = 4.0   # QGraphicsTextItem belge kenar boşluğu (eski çizimle aynı yerleşim için)
+
+# Görünür sayfaların bu kadar öncesi/sonrası da hazır tutulur; daha uzaktakiler sahneden çıkarılır.
+PAGE_PRELOAD = 1
+PAGE_KEEP = 2
+
+def _page_width(room) -> float:
+    """Dersliğin sayfa genişliği (geniş ızgaralar A4'ten taşabilir); öğe oluşturmadan hesaplanır."""
+    rows, cols = int(room.rows or 0), int(room.cols or 0)
+    if rows <= 0 or cols <= 0:
+        return PAGE_W
+    grid_w = cols * BASE_CELL_W + (cols - 1) * GAP
+    gx = MARGIN + (USABLE_W - grid_w) / 2.0
+    return max(PAGE_W, gx + grid_w + 2 * MARGIN)
+
+def _title_font() -> QFont:
+    f = QFont(); f.setPointSize(18)
+    return f
+
+def _grid_top() -> float:
+    """Izgaranın sayfa içindeki üst kenarı (başlık + eksen numaraları payı)."""
+    return MARGIN + QFontMetricsF(_title_font()).height() + 2 * TEXT_MARGIN + 8 * MM
+
+def _page_height(room, grid_top: float) -> float:
+    """Sayfa yüksekliği: A4, ızgara sığmıyorsa ızgarayı içine alacak kadar uzun."""
+    rows, cols = int(room.rows or 0), int(room.cols or 0)
+    if rows <= 0 or cols <= 0:
+        return PAGE_H
+    grid_h = rows * BASE_CELL_H + (rows - 1) * GAP
+    return max(PAGE_H, grid_top + grid_h + MARGIN)
+
+def _visible_range(lo: float, hi: float, origin: float, step: float, size: float, count: int) -> range:
+    """[lo, hi] aralığına düşen 1 tabanlı hücre indeksleri (origin + (i-1)*step, boy size)."""
+    first = max(1, math.floor((lo - origin - size) / step) + 2)
+    last = min(count, math.floor((hi - origin) / step) + 1)
+    return range(first, last + 1)
+
+class RoomGridItem(QGraphicsItem):
+    """
+    Bir dersliğin sayfasını (başlık, eksen numaraları, ızgara, öğrenci numaraları) tek bir
+    sahne öğesi olarak paint() içinde çizer. Yalnızca görünen hücreler çizilir; uzaklaştırınca
+    (LOD < NUMBER_MIN_LOD) numaralar atlanır; çizim DeviceCoordinateCache ile önbelleklenir.
+    """
+    def __init__(self, room, placements: list, grid_top: float, parent=None):
+        super().__init__(parent)
+        self._rows = int(room.rows or 0)
+        self._cols = int(room.cols or 0)
+        gsize = max(1, int(room.group_size or 2))
+
+        title = f"Oda: {room.code}"
+        room_name = getattr(room, "name", None)
+        if room_name:
+            title += f" - {room_name}"
+        self._title = title + f"  ({room.rows}x{room.cols}, grup={room.group_size})"
+
+        self._font_title = _title_font()
+        self._font_axis = QFont(); self._font_axis.setPointSize(9)
+        self._font_num = QFont(); self._font_num.setPointSize(8)
+        self._pen_outer = QPen(BLACK); self._pen_outer.setWidthF(1.2)
+        self._pen_inner = QPen(BLACK); self._pen_inner.setWidthF(0.8)
+        self._axis_h = QFontMetricsF(self._font_axis).height() + 2 * TEXT_MARGIN
+
+        self._title_h = QFontMetricsF(self._font_title).height() + 2 * TEXT_MARGIN
+        self._tpl = None
+        if self._rows > 0 and self._cols > 0:
+            self._tpl = seat_template(self._rows, self._cols, gsize)
+            self._layouts = self._tpl.cell_layouts(BASE_CELL_W, SUB_GAP)
+            self._grid_w = self._cols * BASE_CELL_W + (self._cols - 1) * GAP
+            self._gx = MARGIN + (USABLE_W - self._grid_w) / 2.0
+            self._gy = grid_top
+        self._rect = QRectF(0, 0, _page_width(room), _page_height(room, grid_top))
+
+        self._numbers = {(int(p["row"]), int(p["col"]), int(p.get("pos", 0))): str(p["student_no"])
+                         for p in placements}
+
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption)
+
+    def boundingRect(self) -> QRectF:
+        return self._rect
+
+    def paint(self, painter, option, widget=None):
+        exposed = option.exposedRect
+        painter.setPen(WHITE_TXT)
+        painter.setFont(self._font_title)
+        painter.drawText(QRectF(MARGIN + TEXT_MARGIN, MARGIN + TEXT_MARGIN, self._rect.width(), self._title_h),
+                         Qt.AlignLeft | Qt.AlignTop, self._title)
+        if self._tpl is None:
+            return
+
+        gx, gy = self._gx, self._gy
+        step_x, step_y = BASE_CELL_W + GAP, BASE_CELL_H + GAP
+        rows = _visible_range(exposed.top(), exposed.bottom(), gy, step_y, BASE_CELL_H, self._rows)
+        cols = _visible_range(exposed.left(), exposed.right(), gx, step_x, BASE_CELL_W, self._cols)
+
+        # eksen numaraları
+        painter.setFont(self._font_axis)
+        for cc in range(1, self._cols + 1):
+            x = gx + (cc - 1) * step_x
+            painter.drawText(QRectF(x, gy - 4 * MM - self._axis_h, BASE_CELL_W, self._axis_h),
+                             Qt.AlignCenter, str(cc))
+        for rr in range(1, self._rows + 1):
+            cy = gy + (rr - 1) * step_y + BASE_CELL_H / 2
+            painter.drawText(QRectF(0, cy - self._axis_h / 2, gx - 6 * MM - TEXT_MARGIN, self._axis_h),
+                             Qt.AlignRight | Qt.AlignVCenter, str(rr))
+
+        # ızgara: dikdörtgenler kalem/fırça başına tek drawRects çağrısıyla
+        show_numbers = option.levelOfDetailFromTransform(painter.worldTransform()) >= NUMBER_MIN_LOD
+        outer, allowed_cells, empty_cells, texts = [], [], [], []
+        for rr in rows:
+            yy = gy + (rr - 1) * step_y
+            for cc in cols:
+                x = gx + (cc - 1) * step_x
+                outer.append(QRectF(x, yy, BASE_CELL_W, BASE_CELL_H))
+                for pos, off, w, allowed in self._layouts[self._tpl.kind(rr, cc)]:
+                    cell = QRectF(x + off, yy, w, BASE_CELL_H)
+                    (allowed_cells if allowed else empty_cells).append(cell)
+                    if show_numbers:
+                        num = self._numbers.get((rr, cc, pos))
+                        if num:
+                            texts.append((cell, num))
+
+        painter.setPen(self._pen_outer)
+        painter.setBrush(Qt.NoBrush)
+        painter.drawRects(outer)
+        painter.setPen(self._pen_inner)
+        painter.setBrush(QBrush(GRAY_ALLOWED))
+        painter.drawRects(allowed_cells)
+        painter.setBrush(QBrush(WHITE))
+        painter.drawRects(empty_cells)
+
+        painter.setPen(BLACK)  # hücre içindeki numaralar siyah
+        painter.setFont(self._font_num)
+        for cell, num in texts:
+            painter.drawText(cell, Qt.AlignCenter, num)
 
 class ZoomableGraphicsView(QGraphicsView):
+    viewportChanged = Signal()   # kaydırma, yakınlaştırma ya da boyut değişti
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.setRenderHints(
@@ -54,22 +192,38 @@ class ZoomableGraphicsView(QGraphicsView):
             zoom_out = 1 / zoom_in
             factor = zoom_in if event.angleDelta().y() > 0 else zoom_out
             self.scale(factor, factor)
+            self.viewportChanged.emit()
         else:
             super().wheelEvent(event)
 
+    def scrollContentsBy(self, dx, dy):
+        super().scrollContentsBy(dx, dy)
+        self.viewportChanged.emit()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.viewportChanged.emit()
+
     def reset_zoom(self):
-        self.setTransform(self.transform().reset())
+        self.resetTransform()
+        self.viewportChanged.emit()
 
     def step_zoom(self, inout: int):
         zoom_in = 1.15
         zoom_out = 1 / zoom_in
         factor = zoom_in if inout > 0 else zoom_out
         self.scale(factor, factor)
+        self.viewportChanged.emit()
 
     def fit_to_scene(self):
-        rect = self.scene().itemsBoundingRect()
+        # sayfa öğeleri tembel oluşturulduğundan öğelerin değil sahnenin sınırları
+        rect = self.scene().sceneRect()
         if rect.isValid():
             self.fitInView(rect, Qt.KeepAspectRatio)
+            self.viewportChanged.emit()
+
+    def visible_scene_rect(self) -> QRectF:
+        return self.mapToScene(self.viewport().rect()).boundingRect()
 
 
 class SeatingTab(QWidget):
@@ -79,6 +233,10 @@ class SeatingTab(QWidget):
         self.force_dep_id = force_department_id
         self._placements = []
         self._rooms_meta = []
+        self._by_room = {}
+        self._pages = {}       # sayfa sırası -> RoomGridItem (yalnızca görünür civardakiler)
+        self._page_tops = []   # sayfaların sahnedeki üst kenarları (son eleman toplam yükseklik)
+        self._grid_top = 0.0
         self._build_ui()
 
     def _build_ui(self):
@@ -91,14 +249,17 @@ class SeatingTab(QWidget):
         self.cmb_exam = QComboBox()
         self.btn_reload = QPushButton("Listele"); self.btn_reload.clicked.connect(lambda: self.reload_exams(silent=False))
         self.btn_make = QPushButton("Oturma Planı Oluştur"); self.btn_make.clicked.connect(self.make_seating)
+        self.btn_make_all = QPushButton("Tümünü Oluştur"); self.btn_make_all.clicked.connect(self.make_all_seatings)
         self.btn_export = QPushButton("CSV Dışa Aktar"); self.btn_export.clicked.connect(self.export_csv)
         self.btn_export_pdf = QPushButton("PDF'ye Aktar"); self.btn_export_pdf.clicked.connect(self.export_pdf)
+        self.btn_export_all_pdf = QPushButton("Tümünü PDF'ye Aktar"); self.btn_export_all_pdf.clicked.connect(self.export_all_pdf)
 
         hl.addWidget(QLabel("Tür:")); hl.addWidget(self.cmb_exam_type)
         hl.addWidget(QLabel("Sınav:")); hl.addWidget(self.cmb_exam, 1)
-        hl.addWidget(self.btn_reload); hl.addWidget(self.btn_make); hl.addWidget(self.btn_export); hl.addWidget(self.btn_export_pdf)
+        hl.addWidget(self.btn_reload); hl.addWidget(self.btn_make); hl.addWidget(self.btn_make_all); hl.addWidget(self.btn_export); hl.addWidget(self.btn_export_pdf); hl.addWidget(self.btn_export_all_pdf)
 
         self.cmb_exam_type.currentIndexChanged.connect(lambda: self.reload_exams(silent=True))
+        self.cmb_exam.currentIndexChanged.connect(self._show_saved)
 
         # Zoom araçları
         tools = QHBoxLayout()
@@ -111,6 +272,7 @@ class SeatingTab(QWidget):
         self.view = ZoomableGraphicsView()
         self.scene = QGraphicsScene()
         self.view.setScene(self.scene)
+        self.view.viewportChanged.connect(self._sync_pages)
 
         self.btn_fit.clicked.connect(lambda: self.view.fit_to_scene())
         self.btn_100.clicked.connect(lambda: self.view.reset_zoom())
@@ -143,6 +305,7 @@ class SeatingTab(QWidget):
         if not exam_id:
             QMessageBox.warning(self, "Seçim", "Lütfen bir sınav seçin."); return
         placements, warnings = build_seating(int(exam_id))
+        save_seating(int(exam_id), placements)
         self._placements = placements
         self._rooms_meta = get_exam_rooms(int(exam_id))
         self._draw()
@@ -151,119 +314,81 @@ class SeatingTab(QWidget):
             msg += "\n" + "\n".join(f"- {w}" for w in warnings)
         QMessageBox.information(self, "Oturma Planı", msg)
 
+    def make_all_seatings(self):
+        """Seçili türdeki tüm sınavların planını tek seferde oluşturup kaydeder."""
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            t0 = time.perf_counter()
+            seatings = build_all_seatings(self.cmb_exam_type.currentText(), self._dep_id())
+            save_all_seatings(seatings)
+            elapsed = time.perf_counter() - t0
+        finally:
+            QApplication.restoreOverrideCursor()
+        if not seatings:
+            QMessageBox.information(self, "Bilgi", "Seçilen türde derslik atanmış sınav bulunamadı."); return
+        self._show_saved()
+
+        total = sum(len(es.placements) for es in seatings)
+        msg = f"{len(seatings)} sınav için {total} yerleşim oluşturuldu ({elapsed:.2f} sn)."
+        warned = [es for es in seatings if es.warnings]
+        if warned:
+            msg += "\n\nUyarılar:"
+            for es in warned:
+                msg += f"\n{es.date} {es.start_time} - {es.course_code}:"
+                msg += "".join(f"\n  - {w}" for w in es.warnings)
+        QMessageBox.information(self, "Oturma Planları", msg)
+
+    def _show_saved(self):
+        """Seçilen sınavın kayıtlı planını çizer; plan yoksa önceki sınavın çizimi temizlenir."""
+        exam_id = self.cmb_exam.itemData(self.cmb_exam.currentIndex())
+        self._placements = load_seating(int(exam_id)) if exam_id else []
+        self._rooms_meta = get_exam_rooms(int(exam_id)) if self._placements else []
+        self._draw()
+
     # ---------------- PDF ile birebir UI çizimi ----------------
     def _draw(self):
+        """
+        Sahneyi tüm sayfaların boyunda kurar ama RoomGridItem'ları yalnızca görünür sayfalar
+        (± PAGE_PRELOAD) için oluşturur; kaydırıldıkça _sync_pages ekler/çıkarır.
+        Yerleşimler bir kez odalara ayrılır.
+        """
         self.scene.clear()
+        self._pages = {}
 
-        # PDF font ölçekleri
-        font_title = QFont(); font_title.setPointSize(18)
-        font_axis  = QFont(); font_axis.setPointSize(9)
-        font_num   = QFont(); font_num.setPointSize(8)
-
-        pen_outer = QPen(BLACK); pen_outer.setWidthF(1.2)
-        pen_inner = QPen(BLACK); pen_inner.setWidthF(0.8)
-
-        y_page_top = 0.0   
-        max_right  = 0.0
+        self._by_room = {}
+        for p in self._placements:
+            self._by_room.setdefault(p["room_code"], []).append(p)
 
+        self._grid_top = _grid_top()
+        self._page_tops = [0.0]
         for room in self._rooms_meta:
-            page_top = y_page_top
-
-            # --- Başlık: sayfanın ÜSTÜNDEN başla ---
-            y = page_top + MARGIN
-
-            # Odaya ait yerleşimler
-            room_pl = [p for p in self._placements if p["room_code"] == room.code]
-            room_pl.sort(key=lambda x: (int(x["row"]), int(x["col"]), int(x.get("pos", 0))))
-
-            title_text = f"Oda: {room.code}"
-            room_name = getattr(room, "name", None)
-            if room_name:
-                title_text += f" - {room_name}"
-            title_text += f"  ({room.rows}x{room.cols}, grup={room.group_size})"
-
-            title_item = self.scene.addText(title_text, font_title)
-            title_item.setDefaultTextColor(WHITE_TXT)
-            title_item.setPos(MARGIN, y)
-            title_h = title_item.boundingRect().height()
-
-            # --- GRID ölçüleri ---
-            room_rows = int(room.rows or 0)
-            room_cols = int(room.cols or 0)
-            gsize     = max(1, int(room.group_size or 2))
-            if room_rows <= 0 or room_cols <= 0:
-                y_page_top += PAGE_H
-                continue
-
-            grid_w = room_cols * BASE_CELL_W + (room_cols - 1) * GAP
-            grid_h = room_rows * BASE_CELL_H + (room_rows - 1) * GAP
-
-            gx = MARGIN + (USABLE_W - grid_w) / 2.0
-            gy_top = y + title_h + 8 * MM 
-
-            # --- Sütun Numaraları 
-            for ccx in range(1, room_cols + 1):
-                cx = gx + (ccx - 1) * (BASE_CELL_W + GAP) + BASE_CELL_W / 2
-                t = self.scene.addText(str(ccx), font_axis)
-                t.setDefaultTextColor(WHITE_TXT)
-                br = t.boundingRect()
-                t.setPos(cx - br.width() / 2, gy_top - 4 * MM - br.height())
-
-            # --- Satır Numaraları 
-            for rrx in range(1, room_rows + 1):
-                cy = gy_top + (rrx - 1) * (BASE_CELL_H + GAP) + BASE_CELL_H / 2
-                t = self.scene.addText(str(rrx), font_axis)
-                t.setDefaultTextColor(WHITE_TXT)
-                br = t.boundingRect()
-                t.setPos(gx - 6 * MM - br.width(), cy - br.height() / 2)
-
-            by_cell = {}
-            for p in room_pl:
-                rr, cc, pos = int(p["row"]), int(p["col"]), int(p.get("pos", 0))
-                by_cell.setdefault((rr, cc), {})[pos] = str(p["student_no"])
-
-            # --- Grid çizimi (TOP-DOWN) ---
-            for rr in range(1, room_rows + 1):
-                for cc in range(1, room_cols + 1):
-                    x = gx + (cc - 1) * (BASE_CELL_W + GAP)
-                    yy = gy_top + (rr - 1) * (BASE_CELL_H + GAP)
-
-                    # Dış çerçeve
-                    self.scene.addRect(QRectF(x, yy, BASE_CELL_W, BASE_CELL_H),
-                                       pen_outer, QBrush(Qt.NoBrush))
-
-                    allowed = _allowed_positions(gsize, rr, cc)
-                    weight_allow = 2.0
-                    weight_empty = 1.0
-                    weights = [(weight_allow if pos in allowed else weight_empty)
-                               for pos in range(gsize)]
-                    total_gaps = (gsize - 1) * SUB_GAP
-                    unit_w = (BASE_CELL_W - total_gaps) / sum(weights)
-                    widths = [unit_w * w for w in weights]
-
-                    sx = x
-                    for pos, w in enumerate(widths):
-                        fill = QBrush(GRAY_ALLOWED if pos in allowed else WHITE)
-                        self.scene.addRect(QRectF(sx, yy, w, BASE_CELL_H),
-                                           pen_inner, fill)
-
-                        num = by_cell.get((rr, cc), {}).get(pos)
-                        if num:
-                            ti = self.scene.addText(num, font_num)
-                            ti.setDefaultTextColor(BLACK)  # hücre içindeki numaralar siyah
-                            br = ti.boundingRect()
-                            ti.setPos(sx + (w - br.width()) / 2,
-                                      yy + (BASE_CELL_H - br.height()) / 2)
-                        sx += w + SUB_GAP
-
-            right_edge = gx + grid_w + MARGIN
-            max_right = max(max_right, right_edge)
-            y_page_top += PAGE_H
-
-        total_h = y_page_top
-        total_w = max(PAGE_W, max_right + MARGIN)
-        bounds = QRectF(0, 0, total_w, total_h).adjusted(-10, -10, 10, 10)
+            self._page_tops.append(self._page_tops[-1] + _page_height(room, self._grid_top))
+
+        total_w = max([PAGE_W] + [_page_width(room) for room in self._rooms_meta])
+        bounds = QRectF(0, 0, total_w, self._page_tops[-1]).adjusted(-10, -10, 10, 10)
         self.scene.setSceneRect(bounds)
+        self._sync_pages()
+
+    def _sync_pages(self):
+        """Görünür sayfaların öğelerini oluşturur, PAGE_KEEP sayfadan uzaktakileri bırakır."""
+        scene = self.view.scene()   # kapanışta sahne görünümden önce silinebilir
+        if scene is None or not self._rooms_meta:
+            return
+        visible = self.view.visible_scene_rect()
+        last = len(self._rooms_meta) - 1
+        first_vis = min(max(bisect.bisect_right(self._page_tops, visible.top()) - 1, 0), last)
+        last_vis = min(max(bisect.bisect_right(self._page_tops, visible.bottom()) - 1, 0), last)
+
+        for idx in [i for i in self._pages if i < first_vis - PAGE_KEEP or i > last_vis + PAGE_KEEP]:
+            scene.removeItem(self._pages.pop(idx))
+
+        for idx in range(max(first_vis - PAGE_PRELOAD, 0), min(last_vis + PAGE_PRELOAD, last) + 1):
+            if idx not in self._pages:
+                room = self._rooms_meta[idx]
+                item = RoomGridItem(room, self._by_room.get(room.code, []), self._grid_top)
+                item.setPos(0, self._page_tops[idx])
+                scene.addItem(item)
+                self._pages[idx] = item
 
     def export_csv(self):
         if not self._placements:
@@ -290,3 +415,45 @@ class SeatingTab(QWidget):
             QMessageBox.information(self, "Dışa Aktarım", f"Kaydedildi:\n{out}")
         except Exception as e:
             QMessageBox.critical(self, "Hata", f"PDF oluşturulamadı:\n{e}")
+
+    def export_all_pdf(self):
+        """Seçili türdeki tüm sınavların PDF'leri: tek birleşik dosya ya da klasöre sınav başına bir dosya."""
+        ans = QMessageBox.question(
+            self, "Toplu PDF",
+            "Tüm sınavlar tek bir PDF'te birleştirilsin mi?\n(Hayır: seçilecek klasöre sınav başına bir dosya)",
+            QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel, QMessageBox.Yes)
+        if ans == QMessageBox.Cancel:
+            return
+        merge = ans == QMessageBox.Yes
+        if merge:
+            target, _ = QFileDialog.getSaveFileName(self, "PDF Dışa Aktar", "oturma_planlari.pdf", "PDF (*.pdf)")
+        else:
+            target = QFileDialog.getExistingDirectory(self, "PDF Klasörü Seç")
+        if not target:
+            return
+
+        from src.services.batch_seating_pdf import export_seating_pdfs
+        cancel = threading.Event()
+        dlg = QProgressDialog("Oturma planları çiziliyor...", "İptal", 0, 0, self)
+        dlg.setWindowTitle("Toplu PDF")
+        dlg.setWindowModality(Qt.WindowModal)
+        dlg.setMinimumDuration(0)
+        dlg.canceled.connect(cancel.set)
+        dlg.show()
+
+        def progress(done, total):
+            dlg.setMaximum(total)
+            dlg.setValue(done)
+            QApplication.processEvents()
+
+        try:
+            res = export_seating_pdfs(self.cmb_exam_type.currentText(), self._dep_id(), target,
+                                      merge=merge, progress=progress, cancel=cancel)
+        except Exception as e:
+            QMessageBox.critical(self, "Hata", f"PDF'ler oluşturulamadı:\n{e}"); return
+        finally:
+            dlg.close()
+        msg = res.summary()
+        if not merge:
+            msg += f"\n\nKlasör: {target}"
+        QMessageBox.information(self, "Toplu PDF", msg)
@@ -2,7 +2,7 @@
 from __future__ import annotations
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QFormLayout, QLineEdit,
-    QComboBox, QPushButton, QTableWidget, QTableWidgetItem, QMessageBox
+    QComboBox, QPushButton, QMessageBox, QAbstractItemView
 )
 from PySide6.QtCore import Qt
 from src.services.users_repo_sqlite import (
@@ -10,6 +10,8 @@ from src.services.users_repo_sqlite import (
     department_has_coordinator
 )
 from src.services.room_repo_sqlite import list_departments
+from src.db.maintenance import run_maintenance
+from src.ui.table_model import DataTableView
 
 
 class UsersTab(QWidget):
@@ -36,12 +38,13 @@ class UsersTab(QWidget):
         gb_list = QGroupBox("Kullanıcılar")
         vl_list = QVBoxLayout(gb_list)
 
-        self.tbl = QTableWidget(0, 5)
-        self.tbl.setHorizontalHeaderLabels(["ID", "Kullanıcı Adı", "Rol", "Bölüm", "DeptID"])
+        self.tbl = DataTableView(
+            ["ID", "Kullanıcı Adı", "Rol", "Bölüm", "DeptID"],
+            keys=["id", "username", "role", "department_name", "department_id"],
+        )
         self.tbl.setColumnHidden(4, True)  
-        self.tbl.setSelectionBehavior(self.tbl.SelectionBehavior.SelectRows)
-        self.tbl.setSelectionMode(self.tbl.SelectionMode.SingleSelection)
-        self.tbl.itemSelectionChanged.connect(self._on_table_select)
+        self.tbl.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.tbl.selectionChangedRows.connect(self._on_table_select)
         vl_list.addWidget(self.tbl)
 
         # Form
@@ -69,25 +72,18 @@ class UsersTab(QWidget):
         self.btn_pwd = QPushButton("Şifre Sıfırla"); self.btn_pwd.clicked.connect(self._on_reset_password)
         self.btn_del = QPushButton("Sil");       self.btn_del.clicked.connect(self._on_delete)
         self.btn_clear = QPushButton("Temizle"); self.btn_clear.clicked.connect(self._clear_form)
+        self.btn_maint = QPushButton("Veritabanı Bakımı"); self.btn_maint.clicked.connect(self._on_maintenance)
         btns.addWidget(self.btn_new); btns.addWidget(self.btn_upd)
         btns.addWidget(self.btn_pwd); btns.addWidget(self.btn_del); btns.addWidget(self.btn_clear)
+        btns.addStretch(1)
+        btns.addWidget(self.btn_maint)
 
         root.addWidget(gb_list)
         root.addWidget(gb_form)
         root.addLayout(btns)
 
     def _reload_table(self):
-        self.tbl.setRowCount(0)
-        for r in list_users():
-            rd = dict(r)
-            row = self.tbl.rowCount()
-            self.tbl.insertRow(row)
-            self.tbl.setItem(row, 0, QTableWidgetItem(str(rd.get("id", ""))))
-            self.tbl.setItem(row, 1, QTableWidgetItem(str(rd.get("username", ""))))
-            self.tbl.setItem(row, 2, QTableWidgetItem(str(rd.get("role", ""))))
-            self.tbl.setItem(row, 3, QTableWidgetItem(str(rd.get("department_name", ""))))
-            self.tbl.setItem(row, 4, QTableWidgetItem("" if rd.get("department_id") is None else str(rd.get("department_id"))))
-
+        self.tbl.set_rows(list_users())
         self._selected_user_id = None
 
     def _load_roles(self):
@@ -131,17 +127,15 @@ class UsersTab(QWidget):
         self.cmb_department.setCurrentIndex(0)
 
     def _on_table_select(self):
-        items = self.tbl.selectedItems()
-        if not items:
+        sel = self.tbl.selected_values()
+        if not sel:
             self._selected_user_id = None
             return
-        row = items[0].row()
 
-        self._selected_user_id = int(self.tbl.item(row, 0).text())
-        username = self.tbl.item(row, 1).text()
-        role = self.tbl.item(row, 2).text()
-        dept_id_text = self.tbl.item(row, 4).text().strip()
-        dep_id = int(dept_id_text) if dept_id_text else None
+        self._selected_user_id = int(sel["id"])
+        username = str(sel["username"] or "")
+        role = str(sel["role"] or "")
+        dep_id = sel["department_id"]
 
 
         self.ed_username.setText(username)
@@ -278,6 +272,18 @@ class UsersTab(QWidget):
         except Exception as e:
             QMessageBox.critical(self, "Hata", f"Kullanıcı silinemedi:\n{e}")
 
+    def _on_maintenance(self):
+        if QMessageBox.question(
+            self, "Onay",
+            "Veritabanı bakımı (ANALYZE, optimize, vacuum, bütünlük kontrolü) çalıştırılsın mı?"
+        ) != QMessageBox.StandardButton.Yes:
+            return
+        try:
+            report = run_maintenance()
+            QMessageBox.information(self, "Veritabanı Bakımı", report.summary())
+        except Exception as e:
+            QMessageBox.critical(self, "Hata", f"Bakım başarısız:\n{e}")
+
     def _ask_text(self, prompt: str):
         from PySide6.QtWidgets import QInputDialog
         text, ok = QInputDialog.getText(self, "Girdi", prompt)